@@ -9,6 +9,7 @@ import (
 	"os"
 	"os/signal"
 	"path/filepath"
+	"sync"
 	"syscall"
 	"time"
 
@@ -34,6 +35,9 @@ func main() {
 	if err := core.SetupLogger(logConfig); err != nil {
 		// Fallback: print to stderr and continue
 		fmt.Fprintf(os.Stderr, "Failed to setup logger: %v\n", err)
+	} else {
+		// 最先注册、最后执行：其余 defer 中的关闭日志也会在退出前刷出
+		defer core.CloseLogger()
 	}
 
 	// Start pprof server for CPU profiling
@@ -130,19 +134,6 @@ func main() {
 		log.Info().Int("count", poolManager.GetEmojiCount()).Msg("Emojis loaded to PoolManager")
 	}
 
-	poolCtx := context.Background()
-	if err := poolManager.Start(poolCtx); err != nil {
-		log.Fatal().Err(err).Msg("Failed to start PoolManager")
-	}
-	log.Info().Msg("PoolManager initialized")
-
-	// Load all sites into cache at startup
-	ctx := context.Background()
-	log.Info().Msg("Loading all sites into cache...")
-	if err := siteCache.LoadAll(ctx); err != nil {
-		log.Fatal().Err(err).Msg("Failed to load sites into cache")
-	}
-
 	// Initialize template analyzer
 	log.Info().Msg("Initializing template analyzer...")
 	templateAnalyzer := core.NewTemplateAnalyzer()
@@ -152,10 +143,38 @@ func main() {
 	// Set analyzer on template cache (before loading templates)
 	templateCache.SetAnalyzer(templateAnalyzer)
 
-	// Load all templates into cache at startup
-	log.Info().Msg("Loading all templates into cache...")
-	if err := templateCache.LoadAll(ctx); err != nil {
-		log.Fatal().Err(err).Msg("Failed to load templates into cache")
+	// PoolManager、站点缓存、模板缓存的启动加载互不依赖（各自读库），并发执行，
+	// 启动耗时取最慢的一项而不是三者之和
+	ctx := context.Background()
+	poolCtx := context.Background()
+	var poolErr, siteErr, templateErr error
+	var initWg sync.WaitGroup
+	initWg.Add(3)
+	go func() {
+		defer initWg.Done()
+		poolErr = poolManager.Start(poolCtx)
+	}()
+	go func() {
+		defer initWg.Done()
+		log.Info().Msg("Loading all sites into cache...")
+		siteErr = siteCache.LoadAll(ctx)
+	}()
+	go func() {
+		defer initWg.Done()
+		log.Info().Msg("Loading all templates into cache...")
+		templateErr = templateCache.LoadAll(ctx)
+	}()
+	initWg.Wait()
+
+	if poolErr != nil {
+		log.Fatal().Err(poolErr).Msg("Failed to start PoolManager")
+	}
+	log.Info().Msg("PoolManager initialized")
+	if siteErr != nil {
+		log.Fatal().Err(siteErr).Msg("Failed to load sites into cache")
+	}
+	if templateErr != nil {
+		log.Fatal().Err(templateErr).Msg("Failed to load templates into cache")
 	}
 
 	// Initialize high-concurrency object pools (target: 500 QPS)
@@ -183,6 +202,14 @@ func main() {
 	// Register task handlers
 	core.RegisterAllHandlers(scheduler, poolManager, templateCache, db, redisClient)
 
+	// 多实例同步：任务变更经 Redis 广播给其他实例
+	if redisClient != nil {
+		scheduler.SetRedis(redisClient)
+		scheduleReloader := core.NewScheduleReloader(redisClient, scheduler)
+		scheduleReloader.Start()
+		defer scheduleReloader.Stop()
+	}
+
 	// Start scheduler
 	schedCtx := context.Background()
 	if err := scheduler.Start(schedCtx); err != nil {
@@ -756,12 +756,10 @@ func (h *KeywordsHandler) BatchAdd(c *gin.Context) {
 
 	// 成功后追加到缓存
 	if len(addedKeywords) > 0 && h.poolManager != nil {
-		h.poolManager.AppendKeywords(groupID, addedKeywords)
-		// 同步到 TemplateFuncsManager（需要重新获取完整数据）
+		encodedKeywords := h.poolManager.AppendKeywords(groupID, addedKeywords)
+		// 同步到 TemplateFuncsManager（复用已编码结果，只追加新增部分）
 		if h.funcsManager != nil {
-			encodedKeywords := h.poolManager.GetKeywords(groupID)
-			rawKeywords := h.poolManager.GetAllRawKeywords(groupID)
-			h.funcsManager.ReloadKeywordGroup(groupID, encodedKeywords, rawKeywords)
+			h.funcsManager.AppendKeywords(groupID, encodedKeywords, addedKeywords)
 		}
 	}
 
@@ -811,12 +809,11 @@ func (h *KeywordsHandler) Add(c *gin.Context) {
 
 	// 成功后追加到缓存
 	if h.poolManager != nil {
-		h.poolManager.AppendKeywords(groupID, []string{req.Keyword})
-		// 同步到 TemplateFuncsManager
+		rawKeywords := []string{req.Keyword}
+		encodedKeywords := h.poolManager.AppendKeywords(groupID, rawKeywords)
+		// 同步到 TemplateFuncsManager（复用已编码结果，只追加新增部分）
 		if h.funcsManager != nil {
-			encodedKeywords := h.poolManager.GetKeywords(groupID)
-			rawKeywords := h.poolManager.GetAllRawKeywords(groupID)
-			h.funcsManager.ReloadKeywordGroup(groupID, encodedKeywords, rawKeywords)
+			h.funcsManager.AppendKeywords(groupID, encodedKeywords, rawKeywords)
 		}
 	}
 
@@ -82,16 +82,18 @@ func DualAuthMiddleware(secret string, db *sqlx.DB) gin.HandlerFunc {
 			return
 		}
 
+		// 启用开关和 Token 一次查询读出
+		values := getSettingValues(db, "api_token_enabled", "api_token")
+
 		// 检查 API Token 是否启用
-		var enabled string
-		if err := db.Get(&enabled, "SELECT setting_value FROM system_settings WHERE setting_key = 'api_token_enabled'"); err != nil || (enabled != "true" && enabled != "1") {
+		if enabled := values["api_token_enabled"]; enabled != "true" && enabled != "1" {
 			core.AbortWithMessage(c, core.ErrUnauthorized, "API Token 认证未启用")
 			return
 		}
 
 		// 验证 API Token
-		var storedToken string
-		if err := db.Get(&storedToken, "SELECT setting_value FROM system_settings WHERE setting_key = 'api_token'"); err != nil || storedToken == "" {
+		storedToken := values["api_token"]
+		if storedToken == "" {
 			core.AbortWithMessage(c, core.ErrUnauthorized, "API Token 未配置")
 			return
 		}
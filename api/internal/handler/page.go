@@ -18,6 +18,9 @@ import (
 	"seo-generator/api/pkg/config"
 )
 
+// nonSpiderHTML 非爬虫请求返回的固定页面（包级复用，避免每次请求转换分配）
+var nonSpiderHTML = []byte("<html><body>Hello</body></html>")
+
 // PageHandler handles /page requests
 type PageHandler struct {
 	db               *sqlx.DB
@@ -71,10 +74,13 @@ func (h *PageHandler) ServePage(c *gin.Context) {
 
 	clientIP := getClientIP(c)
 
+	// 分段计时仅在 Debug 日志开启时读取时钟
+	timer := stageTimer{enabled: log.Debug().Enabled()}
+
 	// Spider detection
-	t1 := time.Now()
+	timer.mark()
 	detection := h.spiderDetector.Detect(ua)
-	spiderTime := time.Since(t1)
+	spiderTime := timer.since()
 
 	// Non-spider handling
 	if !detection.IsSpider {
@@ -82,12 +88,12 @@ func (h *PageHandler) ServePage(c *gin.Context) {
 			c.AbortWithStatus(http.StatusNotFound)
 			return
 		}
-		c.Data(http.StatusOK, "text/html; charset=utf-8", []byte("<html><body>Hello</body></html>"))
+		c.Data(http.StatusOK, "text/html; charset=utf-8", nonSpiderHTML)
 		return
 	}
 
 	// Get site config
-	t3 := time.Now()
+	timer.mark()
 	ctx := context.Background()
 	site, err := h.siteCache.Get(ctx, domain)
 	if err != nil {
@@ -100,10 +106,10 @@ func (h *PageHandler) ServePage(c *gin.Context) {
 		c.JSON(http.StatusForbidden, gin.H{"error": "Domain not registered"})
 		return
 	}
-	siteTime := time.Since(t3)
+	siteTime := timer.since()
 
 	// Get template content from cache (no DB query)
-	t4 := time.Now()
+	timer.mark()
 	templateName := site.Template
 	if templateName == "" {
 		templateName = "download_site"
@@ -142,17 +148,15 @@ func (h *PageHandler) ServePage(c *gin.Context) {
 
 	// Get title and content from pool
 	var title, content string
-	title, err = h.poolManager.Pop("titles", keywordGroupID)
+	title, err = h.poolManager.PopTitle(keywordGroupID)
 	if err != nil {
 		log.Warn().Err(err).Int("group", keywordGroupID).Msg("Failed to get title from pool")
 	}
-	content, err = h.poolManager.Pop("contents", articleGroupID)
+	content, err = h.poolManager.PopContent(articleGroupID)
 	if err != nil {
 		log.Warn().Err(err).Int("group", articleGroupID).Msg("Failed to get content from pool")
 	}
-	// 获取关键词用于标题生成（使用关键词分组）
-	titleKeywords := h.poolManager.GetRandomKeywords(keywordGroupID, 3)
-	fetchTime := time.Since(t4)
+	fetchTime := timer.since()
 
 	// Build article content using fetched title and content
 	articleContent := core.BuildArticleContentFromSingle(title, content)
@@ -166,6 +170,7 @@ func (h *PageHandler) ServePage(c *gin.Context) {
 	}
 
 	// 创建标题生成器闭包，同一页面多次调用返回相同标题
+	// 标题按需生成：模板不含标题占位符时不取关键词、不拼接
 	var cachedTitle string
 	titleGenerator := func() string {
 		if cachedTitle == "" {
@@ -176,8 +181,7 @@ func (h *PageHandler) ServePage(c *gin.Context) {
 	}
 
 	renderData := &core.RenderData{
-		Title:          h.generateTitle(titleKeywords), // 兼容静态用途
-		TitleGenerator: titleGenerator,                 // 动态生成器
+		TitleGenerator: titleGenerator, // 动态生成器（设置后 Title 字段不再使用）
 		SiteID:         site.ID,
 		KeywordGroupID: keywordGroupID,
 		ImageGroupID:   imageGroupID,
@@ -187,14 +191,14 @@ func (h *PageHandler) ServePage(c *gin.Context) {
 	}
 
 	// Render template
-	t5 := time.Now()
+	timer.mark()
 	html, err := h.templateRenderer.Render(templateData.Content, templateName, renderData, content)
 	if err != nil {
 		log.Error().Err(err).Str("template", templateName).Msg("Failed to render template")
 		c.JSON(http.StatusInternalServerError, gin.H{"error": "Render failed"})
 		return
 	}
-	renderTime := time.Since(t5)
+	renderTime := timer.since()
 
 	// Cache the result asynchronously
 	go func() {
@@ -223,7 +227,34 @@ func (h *PageHandler) ServePage(c *gin.Context) {
 	// Log spider visit asynchronously
 	go h.logSpiderVisit(detection, clientIP, ua, domain, path, false, int(elapsed.Milliseconds()), 200)
 
-	c.Data(http.StatusOK, "text/html; charset=utf-8", []byte(html))
+	// 直接写出字符串，省去 []byte(html) 对整页内容的再次拷贝
+	c.Header("Content-Type", "text/html; charset=utf-8")
+	c.Status(http.StatusOK)
+	if _, err := c.Writer.WriteString(html); err != nil {
+		log.Debug().Err(err).Str("domain", domain).Msg("Failed to write response")
+	}
+}
+
+// stageTimer 页面生成的分段计时器
+// 未开启 Debug 日志时 mark/since 均不读取时钟，分段耗时记为 0
+type stageTimer struct {
+	enabled bool
+	start   time.Time
+}
+
+// mark 记录当前阶段的起点
+func (t *stageTimer) mark() {
+	if t.enabled {
+		t.start = time.Now()
+	}
+}
+
+// since 返回自上次 mark 以来的耗时
+func (t *stageTimer) since() time.Duration {
+	if !t.enabled {
+		return 0
+	}
+	return time.Since(t.start)
 }
 
 // generateTitle 生成 SEO 优化的页面标题
@@ -236,22 +267,9 @@ func (h *PageHandler) generateTitle(keywords []string) string {
 		return keywords[0]
 	}
 
-	usedEmojis := make(map[string]bool, 2)
-	var builder strings.Builder
-	builder.Grow(100) // 预分配空间
-
-	for i := 0; i < 3; i++ {
-		builder.WriteString(keywords[i])
-		// 在前两个关键词后添加 Emoji
-		if i < 2 {
-			if emoji := h.poolManager.GetRandomEmojiExclude(usedEmojis); emoji != "" {
-				usedEmojis[emoji] = true
-				builder.WriteString(emoji)
-			}
-		}
-	}
-
-	return builder.String()
+	// 两个 Emoji 按下标去重一次取出，无需每个标题分配排除集合
+	emoji1, emoji2 := h.poolManager.GetRandomEmojiPair()
+	return keywords[0] + emoji1 + keywords[1] + emoji2 + keywords[2]
 }
 
 // logSpiderVisit logs spider visit to database asynchronously
@@ -329,13 +347,8 @@ func getClientIP(c *gin.Context) string {
 	return c.ClientIP()
 }
 
-// generateBaiduPushJS generates Baidu push JavaScript code
-func generateBaiduPushJS(token string) string {
-	if token == "" {
-		return ""
-	}
-
-	return `<script>
+// baiduPushScript 百度自动推送脚本（内容与 token 无关，包级常量直接复用）
+const baiduPushScript = `<script>
 (function(){
     var bp = document.createElement('script');
     var curProtocol = window.location.protocol.split(':')[0];
@@ -348,6 +361,14 @@ func generateBaiduPushJS(token string) string {
     s.parentNode.insertBefore(bp, s);
 })();
 </script>`
+
+// generateBaiduPushJS generates Baidu push JavaScript code
+// 配置了 token 的站点返回固定脚本，未配置返回空串
+func generateBaiduPushJS(token string) string {
+	if token == "" {
+		return ""
+	}
+	return baiduPushScript
 }
 
 // Health handles health check endpoint
@@ -31,10 +31,10 @@ func NewPoolConfigHandler(db *sqlx.DB, rdb *redis.Client, analyzer *core.Templat
 // GetConfig 获取当前配置
 func (h *PoolConfigHandler) GetConfig(c *gin.Context) {
 	// 从数据库读取配置
-	var preset, customStr, bufferStr string
-	h.db.Get(&preset, "SELECT setting_value FROM system_settings WHERE setting_key = 'pool.concurrency_preset'")
-	h.db.Get(&customStr, "SELECT setting_value FROM system_settings WHERE setting_key = 'pool.concurrency_custom'")
-	h.db.Get(&bufferStr, "SELECT setting_value FROM system_settings WHERE setting_key = 'pool.buffer_seconds'")
+	values := getSettingValues(h.db, "pool.concurrency_preset", "pool.concurrency_custom", "pool.buffer_seconds")
+	preset := values["pool.concurrency_preset"]
+	customStr := values["pool.concurrency_custom"]
+	bufferStr := values["pool.buffer_seconds"]
 
 	// 默认值
 	if preset == "" {
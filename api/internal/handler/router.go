@@ -3,6 +3,7 @@ package api
 
 import (
 	"context"
+	"errors"
 	"net/http"
 	"runtime"
 	"strconv"
@@ -825,21 +826,17 @@ func taskByIDHandler(deps *Dependencies) gin.HandlerFunc {
 			return
 		}
 
-		// 从任务列表中查找指定任务
-		tasks, err := deps.Scheduler.GetTasks(c.Request.Context())
+		task, err := deps.Scheduler.GetTask(c.Request.Context(), int64(taskID))
 		if err != nil {
-			core.FailWithMessage(c, core.ErrInternalServer, err.Error())
-			return
-		}
-
-		for _, task := range tasks {
-			if task.ID == int64(taskID) {
-				core.Success(c, task)
+			if errors.Is(err, core.ErrTaskNotFound) {
+				core.FailWithCode(c, core.ErrSchedulerTaskNotFound)
 				return
 			}
+			core.FailWithMessage(c, core.ErrInternalServer, err.Error())
+			return
 		}
 
-		core.FailWithCode(c, core.ErrSchedulerTaskNotFound)
+		core.Success(c, task)
 	}
 }
 
@@ -50,6 +50,30 @@ func convertSettingValue(value, stype string) interface{} {
 	}
 }
 
+// settingRow system_settings 的键值两列
+type settingRow struct {
+	Key   string `db:"setting_key"`
+	Value string `db:"setting_value"`
+}
+
+// getSettingValues 一次查询读取多个设置项（按唯一键 setting_key 的 IN 查找），
+// 代替每个键一条 SELECT；不存在的键不出现在结果中，查询失败时返回空 map
+func getSettingValues(db *sqlx.DB, keys ...string) map[string]string {
+	values := make(map[string]string, len(keys))
+	query, args, err := sqlx.In("SELECT setting_key, setting_value FROM system_settings WHERE setting_key IN (?)", keys)
+	if err != nil {
+		return values
+	}
+	var rows []settingRow
+	if err := db.Select(&rows, db.Rebind(query), args...); err != nil {
+		return values
+	}
+	for _, r := range rows {
+		values[r.Key] = r.Value
+	}
+	return values
+}
+
 // Get 获取系统配置
 func (h *SettingsHandler) Get(c *gin.Context) {
 	cfg, exists := c.Get("config")
@@ -205,9 +229,8 @@ func (h *SettingsHandler) GetAPIToken(c *gin.Context) {
 	}
 	sqlxDB := db.(*sqlx.DB)
 
-	var token, enabled string
-	sqlxDB.Get(&token, "SELECT setting_value FROM system_settings WHERE setting_key = 'api_token'")
-	sqlxDB.Get(&enabled, "SELECT setting_value FROM system_settings WHERE setting_key = 'api_token_enabled'")
+	values := getSettingValues(sqlxDB, "api_token", "api_token_enabled")
+	token, enabled := values["api_token"], values["api_token_enabled"]
 
 	if enabled == "" {
 		enabled = "true"
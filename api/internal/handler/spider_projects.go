@@ -468,17 +468,22 @@ func (h *SpiderProjectsHandler) Toggle(c *gin.Context) {
 	newEnabled := 1 - enabled
 	sqlxDB.Exec("UPDATE spider_projects SET enabled = ? WHERE id = ?", newEnabled, id)
 
-	// 同步定时任务状态
+	// 同步定时任务状态：定时配置未变，已有任务直接启停，不再回读并重新解析配置
 	if scheduler, exists := c.Get("scheduler"); exists {
 		s := scheduler.(*core.Scheduler)
-		var project struct {
-			Name     string  `db:"name"`
-			Schedule *string `db:"schedule"`
-		}
-		if err := sqlxDB.Get(&project, "SELECT name, schedule FROM spider_projects WHERE id = ?", id); err == nil {
-			ctx := context.Background()
-			if syncErr := core.SyncSpiderSchedule(ctx, sqlxDB, s, id, project.Name, project.Schedule, newEnabled); syncErr != nil {
-				log.Warn().Err(syncErr).Int("project_id", id).Msg("Failed to sync spider schedule")
+		ctx := context.Background()
+		found, syncErr := core.SetSpiderScheduleEnabled(ctx, sqlxDB, s, id, newEnabled == 1)
+		if syncErr != nil {
+			log.Warn().Err(syncErr).Int("project_id", id).Msg("Failed to toggle spider schedule")
+		} else if !found {
+			var project struct {
+				Name     string  `db:"name"`
+				Schedule *string `db:"schedule"`
+			}
+			if err := sqlxDB.Get(&project, "SELECT name, schedule FROM spider_projects WHERE id = ?", id); err == nil {
+				if syncErr := core.SyncSpiderSchedule(ctx, sqlxDB, s, id, project.Name, project.Schedule, newEnabled); syncErr != nil {
+					log.Warn().Err(syncErr).Int("project_id", id).Msg("Failed to sync spider schedule")
+				}
 			}
 		}
 	}
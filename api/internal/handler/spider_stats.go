@@ -75,10 +75,9 @@ func (h *SpiderStatsHandler) GetChartStats(c *gin.Context) {
 
 	id, _ := strconv.Atoi(c.Param("id"))
 	period := c.DefaultQuery("period", "hour")
-	limit, _ := strconv.Atoi(c.DefaultQuery("limit", "100"))
+	limit := chartLimit(c)
 
-	var data []models.StatsChartPoint
-	err := sqlxDB.Select(&data, `
+	data, err := queryChartPoints(sqlxDB, limit, `
 		SELECT period_start as time, total, completed, failed, retried, avg_speed
 		FROM spider_stats_history
 		WHERE project_id = ? AND period_type = ?
@@ -86,7 +85,7 @@ func (h *SpiderStatsHandler) GetChartStats(c *gin.Context) {
 		LIMIT ?
 	`, id, period, limit)
 
-	if err != nil || data == nil {
+	if err != nil {
 		data = []models.StatsChartPoint{}
 	}
 
@@ -238,22 +237,39 @@ func (h *SpiderStatsHandler) RetryAllFailed(c *gin.Context) {
 	ctx := context.Background()
 	queueKey := fmt.Sprintf("spider:queue:%d", id)
 
+	// 按批推入队列并更新状态：每批一条多值 LPUSH 和一条 UPDATE ... IN，
+	// 而不是每个请求各一次 LPUSH 和 UPDATE
 	count := 0
-	for _, f := range failed {
-		reqData, _ := json.Marshal(map[string]interface{}{
-			"url":      f.URL,
-			"method":   f.Method,
-			"callback": f.Callback,
-			"meta":     f.Meta,
-		})
-		redisClient.LPush(ctx, queueKey, reqData)
-		sqlxDB.Exec("UPDATE spider_failed_requests SET status = 'retried' WHERE id = ?", f.ID)
-		count++
+	for start := 0; start < len(failed); start += retryFailedBatchSize {
+		batch := failed[start:min(start+retryFailedBatchSize, len(failed))]
+
+		reqs := make([]interface{}, len(batch))
+		ids := make([]int, len(batch))
+		for i, f := range batch {
+			reqData, _ := json.Marshal(map[string]interface{}{
+				"url":      f.URL,
+				"method":   f.Method,
+				"callback": f.Callback,
+				"meta":     f.Meta,
+			})
+			reqs[i] = reqData
+			ids[i] = f.ID
+		}
+		if err := redisClient.LPush(ctx, queueKey, reqs...).Err(); err != nil {
+			break
+		}
+		if query, args, err := sqlx.In("UPDATE spider_failed_requests SET status = 'retried' WHERE id IN (?)", ids); err == nil {
+			sqlxDB.Exec(sqlxDB.Rebind(query), args...)
+		}
+		count += len(batch)
 	}
 
 	c.JSON(200, gin.H{"success": true, "message": fmt.Sprintf("已重试 %d 个失败请求", count), "count": count})
 }
 
+// retryFailedBatchSize 批量重试失败请求时每批推入队列的请求数
+const retryFailedBatchSize = 500
+
 // RetryOneFailed 重试单个失败请求
 func (h *SpiderStatsHandler) RetryOneFailed(c *gin.Context) {
 	db, exists := c.Get("db")
@@ -364,15 +380,12 @@ func (h *SpiderStatsHandler) GetOverview(c *gin.Context) {
 		// 单个项目统计
 		projectID, _ := strconv.Atoi(projectIDStr)
 		statsKey := fmt.Sprintf("spider:%d:stats", projectID)
-		statsData, err := redisClient.HGetAll(ctx, statsKey).Result()
-		if err == nil && len(statsData) > 0 {
-			total, _ = strconv.ParseInt(statsData["total"], 10, 64)
-			completed, _ = strconv.ParseInt(statsData["completed"], 10, 64)
-			failed, _ = strconv.ParseInt(statsData["failed"], 10, 64)
-			retried, _ = strconv.ParseInt(statsData["retried"], 10, 64)
+		if vals, err := redisClient.HMGet(ctx, statsKey, spiderStatsFields...).Result(); err == nil {
+			total, completed, failed, retried = parseSpiderStats(vals)
 		}
 	} else {
 		// 全部项目统计：扫描所有 spider:*:stats 键
+		var keys []string
 		iter := redisClient.Scan(ctx, 0, "spider:*:stats", 100).Iterator()
 		for iter.Next(ctx) {
 			key := iter.Val()
@@ -380,23 +393,30 @@ func (h *SpiderStatsHandler) GetOverview(c *gin.Context) {
 			if strings.Contains(key, ":archived") || strings.HasPrefix(key, "test_spider:") {
 				continue
 			}
-			statsData, err := redisClient.HGetAll(ctx, key).Result()
-			if err == nil {
-				t, _ := strconv.ParseInt(statsData["total"], 10, 64)
-				comp, _ := strconv.ParseInt(statsData["completed"], 10, 64)
-				f, _ := strconv.ParseInt(statsData["failed"], 10, 64)
-				r, _ := strconv.ParseInt(statsData["retried"], 10, 64)
-				total += t
-				completed += comp
-				failed += f
-				retried += r
-			}
+			keys = append(keys, key)
 		}
 		// 检查迭代器错误
 		if err := iter.Err(); err != nil {
 			c.JSON(500, gin.H{"success": false, "message": "Redis 扫描失败"})
 			return
 		}
+
+		// 各项目统计在一个 pipeline 中读取
+		pipe := redisClient.Pipeline()
+		cmds := make([]*redis.SliceCmd, len(keys))
+		for i, key := range keys {
+			cmds[i] = pipe.HMGet(ctx, key, spiderStatsFields...)
+		}
+		pipe.Exec(ctx)
+		for _, cmd := range cmds {
+			if vals, err := cmd.Result(); err == nil {
+				t, comp, f, r := parseSpiderStats(vals)
+				total += t
+				completed += comp
+				failed += f
+				retried += r
+			}
+		}
 	}
 
 	var successRate float64
@@ -426,14 +446,7 @@ func (h *SpiderStatsHandler) GetChart(c *gin.Context) {
 
 	projectIDStr := c.Query("project_id")
 	period := c.DefaultQuery("period", "hour")
-	limit, _ := strconv.Atoi(c.DefaultQuery("limit", "100"))
-
-	// 周期回退顺序
-	periodFallback := map[string]string{
-		"month": "day",
-		"day":   "hour",
-		"hour":  "minute",
-	}
+	limit := chartLimit(c)
 
 	// 尝试查询，如果没有数据则回退
 	for {
@@ -448,8 +461,7 @@ func (h *SpiderStatsHandler) GetChart(c *gin.Context) {
 
 		args = append(args, limit)
 
-		var data []models.StatsChartPoint
-		err := sqlxDB.Select(&data, `
+		data, err := queryChartPoints(sqlxDB, limit, `
 			SELECT period_start as time, SUM(total) as total, SUM(completed) as completed,
 			       SUM(failed) as failed, SUM(retried) as retried, AVG(avg_speed) as avg_speed
 			FROM spider_stats_history
@@ -469,7 +481,7 @@ func (h *SpiderStatsHandler) GetChart(c *gin.Context) {
 		}
 
 		// 回退到更细粒度
-		fallback, ok := periodFallback[period]
+		fallback, ok := chartPeriodFallback[period]
 		if !ok {
 			// 已经是最细粒度，返回空
 			c.JSON(200, gin.H{"success": true, "data": []interface{}{}})
@@ -479,6 +491,44 @@ func (h *SpiderStatsHandler) GetChart(c *gin.Context) {
 	}
 }
 
+// chartPeriodFallback 图表周期回退顺序（无数据时回退到更细粒度）
+var chartPeriodFallback = map[string]string{
+	"month": "day",
+	"day":   "hour",
+	"hour":  "minute",
+}
+
+// chartMaxLimit 图表单次最多返回的数据点数
+const chartMaxLimit = 1000
+
+// chartLimit 解析图表 limit 参数，非法值取默认 100，超出上限截断
+func chartLimit(c *gin.Context) int {
+	limit, err := strconv.Atoi(c.DefaultQuery("limit", "100"))
+	if err != nil || limit < 1 {
+		return 100
+	}
+	return min(limit, chartMaxLimit)
+}
+
+// queryChartPoints 逐行扫描图表数据到按 limit 预分配的切片
+// 相比 Select 不会随行数反复扩容，结果集最多 limit 行
+func queryChartPoints(db *sqlx.DB, limit int, query string, args ...interface{}) ([]models.StatsChartPoint, error) {
+	rows, err := db.Queryx(query, args...)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+
+	data := make([]models.StatsChartPoint, 0, limit)
+	for rows.Next() {
+		data = append(data, models.StatsChartPoint{})
+		if err := rows.StructScan(&data[len(data)-1]); err != nil {
+			return nil, err
+		}
+	}
+	return data, rows.Err()
+}
+
 // GetScheduled 获取已调度项目
 func (h *SpiderStatsHandler) GetScheduled(c *gin.Context) {
 	db, exists := c.Get("db")
@@ -531,18 +581,19 @@ func (h *SpiderStatsHandler) GetByProject(c *gin.Context) {
 		return
 	}
 
-	// 从 Redis 获取每个项目的统计
-	result := make([]gin.H, 0, len(projects))
-	for _, p := range projects {
-		statsKey := fmt.Sprintf("spider:%d:stats", p.ID)
-		statsData, err := redisClient.HGetAll(ctx, statsKey).Result()
+	// 从 Redis 获取每个项目的统计（一个 pipeline 读取全部项目）
+	pipe := redisClient.Pipeline()
+	cmds := make([]*redis.SliceCmd, len(projects))
+	for i, p := range projects {
+		cmds[i] = pipe.HMGet(ctx, fmt.Sprintf("spider:%d:stats", p.ID), spiderStatsFields...)
+	}
+	pipe.Exec(ctx)
 
+	result := make([]gin.H, 0, len(projects))
+	for i, p := range projects {
 		var total, completed, failed, retried int64
-		if err == nil && len(statsData) > 0 {
-			total, _ = strconv.ParseInt(statsData["total"], 10, 64)
-			completed, _ = strconv.ParseInt(statsData["completed"], 10, 64)
-			failed, _ = strconv.ParseInt(statsData["failed"], 10, 64)
-			retried, _ = strconv.ParseInt(statsData["retried"], 10, 64)
+		if vals, err := cmds[i].Result(); err == nil {
+			total, completed, failed, retried = parseSpiderStats(vals)
 		}
 
 		var successRate float64
@@ -564,3 +615,17 @@ func (h *SpiderStatsHandler) GetByProject(c *gin.Context) {
 
 	c.JSON(200, gin.H{"success": true, "data": result})
 }
+
+// spiderStatsFields 实时统计中用到的字段，HMGET 按固定顺序读取，不必取回整个哈希
+var spiderStatsFields = []string{"total", "completed", "failed", "retried"}
+
+// parseSpiderStats 解析 HMGET 结果（缺失字段为 nil，按 0 计）
+func parseSpiderStats(vals []interface{}) (total, completed, failed, retried int64) {
+	var out [4]int64
+	for i, v := range vals {
+		if str, ok := v.(string); ok && i < len(out) {
+			out[i], _ = strconv.ParseInt(str, 10, 64)
+		}
+	}
+	return out[0], out[1], out[2], out[3]
+}
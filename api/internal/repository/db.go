@@ -3,8 +3,11 @@
 package repository
 
 import (
+	"context"
+	"database/sql"
 	"fmt"
 	"strings"
+	"sync"
 	"time"
 
 	_ "github.com/go-sql-driver/mysql"
@@ -56,16 +59,55 @@ func Init(cfg *config.DatabaseConfig) error {
 		return fmt.Errorf("failed to ping database: %w", err)
 	}
 
+	// 启动时预先建立空闲连接，首批流量不用再逐个付出 TCP 握手和认证的开销
+	warmed := warmUp(db, idleConns)
+
 	log.Info().
 		Str("host", cfg.Host).
 		Int("port", cfg.Port).
 		Str("database", cfg.Database).
 		Int("pool_size", cfg.PoolSize).
+		Int("warm_conns", warmed).
 		Msg("Database connection established")
 
 	return nil
 }
 
+// warmUp 并发打开 n 个连接后一起归还，使其留在空闲池中，返回成功建立的连接数
+// 连接必须全部取出后再归还，否则会复用刚归还的同一个连接；预热失败不影响启动
+func warmUp(db *sqlx.DB, n int) int {
+	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
+	defer cancel()
+
+	conns := make([]*sql.Conn, n)
+	var wg sync.WaitGroup
+	for i := range conns {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			conn, err := db.Conn(ctx)
+			if err != nil {
+				return
+			}
+			if err := conn.PingContext(ctx); err != nil {
+				conn.Close()
+				return
+			}
+			conns[i] = conn
+		}(i)
+	}
+	wg.Wait()
+
+	warmed := 0
+	for _, conn := range conns {
+		if conn != nil {
+			conn.Close()
+			warmed++
+		}
+	}
+	return warmed
+}
+
 // GetDB returns the database connection
 func GetDB() *sqlx.DB {
 	return db
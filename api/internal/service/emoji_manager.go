@@ -65,6 +65,55 @@ func (m *EmojiManager) GetRandom() string {
 	return m.emojis[rand.IntN(len(m.emojis))]
 }
 
+// GetRandomPair 获取两个不同位置的随机 Emoji（按下标去重，无需构造排除集合）
+func (m *EmojiManager) GetRandomPair() (string, string) {
+	m.mu.RLock()
+	defer m.mu.RUnlock()
+
+	n := len(m.emojis)
+	switch n {
+	case 0:
+		return "", ""
+	case 1:
+		return m.emojis[0], m.emojis[0]
+	}
+
+	i := rand.IntN(n)
+	j := rand.IntN(n - 1)
+	if j >= i {
+		j++
+	}
+	return m.emojis[i], m.emojis[j]
+}
+
+// GetRandomPairs 一次加锁取出 n 对随机 Emoji（每对两个位置不同），平铺为长度 2n 的切片
+// 未加载 Emoji 时返回 nil
+func (m *EmojiManager) GetRandomPairs(n int) []string {
+	m.mu.RLock()
+	emojis := m.emojis
+	m.mu.RUnlock()
+
+	total := len(emojis)
+	if total == 0 || n <= 0 {
+		return nil
+	}
+
+	result := make([]string, 2*n)
+	for k := 0; k < n; k++ {
+		i := rand.IntN(total)
+		j := i
+		if total > 1 {
+			j = rand.IntN(total - 1)
+			if j >= i {
+				j++
+			}
+		}
+		result[2*k] = emojis[i]
+		result[2*k+1] = emojis[j]
+	}
+	return result
+}
+
 // GetRandomExclude 获取不在 exclude 中的随机 Emoji
 func (m *EmojiManager) GetRandomExclude(exclude map[string]bool) string {
 	m.mu.RLock()
@@ -1,20 +1,23 @@
 package core
 
 import (
-	"math/rand/v2"
-	"strconv"
 	"strings"
+	"sync/atomic"
+
+	"seo-generator/api/internal/service/pool"
 )
 
 // HTMLEntityEncoder encodes non-ASCII characters to HTML entities
 type HTMLEntityEncoder struct {
-	mixRatio float64 // Ratio of hex encoding (0.5 = 50% hex, 50% decimal)
+	mixRatio  float64 // Ratio of hex encoding (0.5 = 50% hex, 50% decimal)
+	hexCutoff uint32  // mixRatio 映射到 [0, 65536]，与 16 位随机量比较决定是否 hex 编码
 }
 
 // NewHTMLEntityEncoder creates a new encoder with the specified mix ratio
 func NewHTMLEntityEncoder(mixRatio float64) *HTMLEntityEncoder {
 	return &HTMLEntityEncoder{
-		mixRatio: mixRatio,
+		mixRatio:  mixRatio,
+		hexCutoff: pool.HexCutoff(mixRatio),
 	}
 }
 
@@ -27,28 +30,40 @@ func (e *HTMLEntityEncoder) EncodeText(text string) string {
 
 	var sb strings.Builder
 	sb.Grow(len(text) * 2) // Pre-allocate for efficiency
+	var rb pool.RandBits
+	pool.AppendEncoded(&sb, text, e.hexCutoff, &rb)
+	return sb.String()
+}
 
-	for _, r := range text {
-		if r <= 127 {
-			// ASCII character, keep as-is
-			sb.WriteRune(r)
-		} else {
-			// Non-ASCII character, encode (strconv 比 fmt.Sprintf 快 5-10 倍)
-			if rand.Float64() < e.mixRatio {
-				// Hex encoding: &#x数字;
-				sb.WriteString("&#x")
-				sb.WriteString(strconv.FormatInt(int64(r), 16))
-				sb.WriteByte(';')
-			} else {
-				// Decimal encoding: &#数字;
-				sb.WriteString("&#")
-				sb.WriteString(strconv.FormatInt(int64(r), 10))
-				sb.WriteByte(';')
-			}
-		}
+// EncodeBatch 批量编码，所有结果共享同一块底层内存（单次分配），
+// 随机位在整批文本间连续消费，返回的每个字符串都是该内存块的子串
+func (e *HTMLEntityEncoder) EncodeBatch(texts []string) []string {
+	if len(texts) == 0 {
+		return nil
 	}
 
-	return sb.String()
+	total := 0
+	for _, t := range texts {
+		total += len(t)
+	}
+
+	var sb strings.Builder
+	sb.Grow(total * 3) // 中文 3 字节 -> 实体约 8 字节，按 3 倍预估
+	ends := make([]int, len(texts))
+	var rb pool.RandBits
+	for i, text := range texts {
+		pool.AppendEncoded(&sb, text, e.hexCutoff, &rb)
+		ends[i] = sb.Len()
+	}
+
+	blob := sb.String()
+	result := make([]string, len(texts))
+	start := 0
+	for i, end := range ends {
+		result[i] = blob[start:end]
+		start = end
+	}
+	return result
 }
 
 // Encode is an alias for EncodeText
@@ -57,19 +72,21 @@ func (e *HTMLEntityEncoder) Encode(text string) string {
 }
 
 // Global encoder instance
-var globalEncoder *HTMLEntityEncoder
+// 原子指针持有，默认 0.5 预先创建：读路径无 nil 判断和惰性写入，InitEncoder 替换时也不存在数据竞争
+var globalEncoder atomic.Pointer[HTMLEntityEncoder]
+
+func init() {
+	globalEncoder.Store(NewHTMLEntityEncoder(0.5))
+}
 
 // InitEncoder initializes the global encoder
 func InitEncoder(mixRatio float64) {
-	globalEncoder = NewHTMLEntityEncoder(mixRatio)
+	globalEncoder.Store(NewHTMLEntityEncoder(mixRatio))
 }
 
 // GetEncoder returns the global encoder
 func GetEncoder() *HTMLEntityEncoder {
-	if globalEncoder == nil {
-		globalEncoder = NewHTMLEntityEncoder(0.5)
-	}
-	return globalEncoder
+	return globalEncoder.Load()
 }
 
 // Encode is a convenience function that uses the global encoder
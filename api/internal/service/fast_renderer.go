@@ -3,6 +3,8 @@ package core
 import (
 	"bytes"
 	"html/template"
+	"math/rand/v2"
+	"strconv"
 	"sync"
 	"sync/atomic"
 )
@@ -44,11 +46,31 @@ type CompiledFastTemplate struct {
 	Segments     []string      // 静态片段列表（与 Placeholders 交替）
 	Placeholders []Placeholder // 占位符列表（按顺序）
 	TotalSize    int           // 预估输出大小，用于 buffer 预分配
+	URLCount     int           // URL 占位符数量，渲染时一次性从池中预留
+	ClsCount     int           // cls 占位符数量，渲染时一次性从池中预留
+}
+
+// NewCompiledFastTemplate 创建快速模板并统计需要按请求预留的占位符数量
+func NewCompiledFastTemplate(segments []string, placeholders []Placeholder, totalSize int) *CompiledFastTemplate {
+	ct := &CompiledFastTemplate{
+		Segments:     segments,
+		Placeholders: placeholders,
+		TotalSize:    totalSize,
+	}
+	for _, p := range placeholders {
+		switch p.Type {
+		case PlaceholderURL:
+			ct.URLCount++
+		case PlaceholderCls:
+			ct.ClsCount++
+		}
+	}
+	return ct
 }
 
 // FastRenderer 快速字符串替换渲染器
 type FastRenderer struct {
-	templates    sync.Map // cacheKey -> *CompiledFastTemplate
+	templates    boundedTemplateCache // cacheKey -> *CompiledFastTemplate
 	funcsManager *TemplateFuncsManager
 }
 
@@ -60,12 +82,12 @@ func NewFastRenderer(fm *TemplateFuncsManager) *FastRenderer {
 }
 
 // Store 存储编译后的快速模板
-func (r *FastRenderer) Store(cacheKey string, ct *CompiledFastTemplate) {
+func (r *FastRenderer) Store(cacheKey uint64, ct *CompiledFastTemplate) {
 	r.templates.Store(cacheKey, ct)
 }
 
 // Render 快速渲染 - 使用 bytes.Buffer 顺序写入
-func (r *FastRenderer) Render(cacheKey string, data *RenderData) (string, bool) {
+func (r *FastRenderer) Render(cacheKey uint64, data *RenderData) (string, bool) {
 	cached, ok := r.templates.Load(cacheKey)
 	if !ok {
 		return "", false
@@ -73,8 +95,13 @@ func (r *FastRenderer) Render(cacheKey string, data *RenderData) (string, bool)
 
 	ct := cached.(*CompiledFastTemplate)
 
+	// data 在入口统一规整为非 nil，后续占位符直接读字段，无需逐个判空
+	if data == nil {
+		data = &RenderData{KeywordGroupID: 1, ImageGroupID: 1}
+	}
+
 	// 请求级缓存：NowFunc 只计算一次，避免 ~1200 次重复调用
-	if data != nil && data.Now == "" {
+	if data.Now == "" {
 		data.Now = NowFunc()
 	}
 
@@ -83,11 +110,66 @@ func (r *FastRenderer) Render(cacheKey string, data *RenderData) (string, bool)
 	buf.Reset()
 	buf.Grow(ct.TotalSize) // 预分配
 
+	// 请求级解析：关键词/图片分组切片每次渲染只查找一次，
+	// 对应占位符直接按下标取值，不再逐个走原子加载 + map 查找
+	keywordGroupID := data.KeywordGroupID
+	keywords := r.funcsManager.keywordsForGroup(keywordGroupID)
+	images := r.funcsManager.imagesForGroup(data.ImageGroupID)
+
+	// 带 emoji 关键词的池在首次遇到该占位符时解析一次，之后直接复用
+	kwEmojiGen := r.funcsManager.keywordEmojiGenerator
+	var kwEmojiPool *KeywordEmojiPool
+
+	// 关键词/图片下标的随机量按 64 位预取，每两次取值只调用一次 rand
+	var idx randIndexer
+
+	// URL/cls 按本模板的占位符数量一次性预留，之后在本协程内顺序消费
+	urls := r.funcsManager.reserveURLs(ct.URLCount)
+	clsBases := r.funcsManager.reserveCls(ct.ClsCount)
+
 	// 顺序写入：Segments[0] + getValue(PH[0]) + Segments[1] + getValue(PH[1]) + ...
 	for i, segment := range ct.Segments {
 		buf.WriteString(segment)
-		if i < len(ct.Placeholders) {
-			buf.WriteString(r.getValue(ct.Placeholders[i], data))
+		if i >= len(ct.Placeholders) {
+			continue
+		}
+		switch p := ct.Placeholders[i]; p.Type {
+		case PlaceholderCls:
+			// 分段写入，避免 Cls() 拼接出的中间字符串
+			buf.WriteString(clsBases.Next())
+			buf.WriteByte(' ')
+			buf.WriteString(p.Arg)
+		case PlaceholderURL:
+			buf.WriteString(urls.Next())
+		case PlaceholderNumber:
+			// 数字直接追加到 buffer 空闲区，不经过 formatInt 的字符串分配
+			n := r.funcsManager.RandomNumber(p.MinMax[0], p.MinMax[1])
+			buf.Write(strconv.AppendInt(buf.AvailableBuffer(), int64(n), 10))
+		case PlaceholderKeyword:
+			if len(keywords) > 0 {
+				buf.WriteString(keywords[idx.next(len(keywords))])
+			}
+		case PlaceholderKeywordEmoji:
+			if kwEmojiGen == nil {
+				buf.WriteString(r.getValue(p, data))
+				break
+			}
+			if kwEmojiPool == nil {
+				kwEmojiPool = kwEmojiGen.getOrCreatePool(keywordGroupID)
+			}
+			buf.WriteString(kwEmojiGen.popFrom(kwEmojiPool))
+		case PlaceholderImage:
+			if len(images) > 0 {
+				buf.WriteString(images[idx.next(len(images))])
+			}
+		case PlaceholderNow:
+			buf.WriteString(data.Now)
+		case PlaceholderContent:
+			buf.WriteString(data.Content)
+		case PlaceholderArticleContent:
+			buf.WriteString(string(data.ArticleContent))
+		default:
+			buf.WriteString(r.getValue(p, data))
 		}
 	}
 
@@ -97,6 +179,24 @@ func (r *FastRenderer) Render(cacheKey string, data *RenderData) (string, bool)
 	return result, true
 }
 
+// randIndexer 渲染内的随机下标源
+// 一次 rand.Uint64 拆成两个 32 位随机量，各自按乘法映射到 [0, n)（n 远小于 2^32，偏差可忽略）
+type randIndexer struct {
+	bits    uint64
+	pending bool // bits 的高 32 位尚未使用
+}
+
+// next 返回 [0, n) 内的随机下标
+func (r *randIndexer) next(n int) int {
+	if r.pending {
+		r.pending = false
+		return int((r.bits >> 32) * uint64(n) >> 32)
+	}
+	r.bits = rand.Uint64()
+	r.pending = true
+	return int((r.bits & 0xffffffff) * uint64(n) >> 32)
+}
+
 // getValue 获取占位符对应的实际值
 func (r *FastRenderer) getValue(p Placeholder, data *RenderData) string {
 	return resolvePlaceholder(p, data, r.funcsManager)
@@ -185,19 +285,14 @@ func formatInt(n int) string {
 
 // GetStats 返回统计信息
 func (r *FastRenderer) GetStats() map[string]interface{} {
-	var count int
-	r.templates.Range(func(_, _ interface{}) bool {
-		count++
-		return true
-	})
 	return map[string]interface{}{
-		"fast_templates": count,
+		"fast_templates": r.templates.Len(),
 	}
 }
 
 // ClearCache 清除快速模板缓存
 func (r *FastRenderer) ClearCache() {
-	r.templates = sync.Map{}
+	r.templates.Clear()
 }
 
 // ============================================================
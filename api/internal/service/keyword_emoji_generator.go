@@ -8,6 +8,7 @@ import (
 	"sync"
 	"sync/atomic"
 	"time"
+	"unicode/utf8"
 
 	"github.com/rs/zerolog/log"
 )
@@ -15,11 +16,22 @@ import (
 // KeywordEmojiPool 关键词表情池（基于 channel）
 type KeywordEmojiPool struct {
 	ch            chan string
+	refillCh      chan struct{} // 消费跌破阈值时通知填充协程（缓冲 1）
 	groupID       int
 	memoryBytes   atomic.Int64 // 内存占用追踪
 	consumedCount atomic.Int64 // 被消费的数量（Pop 计数）
 }
 
+// signalRefill 剩余量低于阈值时通知填充协程（非阻塞，已有待处理通知时跳过）
+func (p *KeywordEmojiPool) signalRefill(threshold int) {
+	if len(p.ch) < threshold && len(p.refillCh) == 0 {
+		select {
+		case p.refillCh <- struct{}{}:
+		default:
+		}
+	}
+}
+
 // KeywordEmojiGenerator 关键词表情生成器（对标 TitleGenerator）
 type KeywordEmojiGenerator struct {
 	pools        map[int]*KeywordEmojiPool // groupID -> 池
@@ -66,34 +78,67 @@ func (g *KeywordEmojiGenerator) generateKeywordEmoji(groupID int) string {
 		return keyword
 	}
 
-	// 随机决定插入 1 或 2 个 emoji（50% 概率）
-	emojiCount := 1
-	if rand.Float64() < 0.5 {
-		emojiCount = 2
+	return g.encoder.EncodeText(insertRandomEmojis(keyword, g.emojiManager))
+}
+
+// keywordEmojiBatchSize 补充池时每批生成的数量（一批共用一次编码分配）
+const keywordEmojiBatchSize = 256
+
+// generateKeywordEmojiBatch 生成最多 n 个关键词表情组合
+// 先逐个插入 emoji，再整批 HTML 编码，避免每条结果单独分配编码缓冲区
+func (g *KeywordEmojiGenerator) generateKeywordEmojiBatch(groupID, n int) []string {
+	raw := make([]string, 0, n)
+	for i := 0; i < n; i++ {
+		keyword := g.poolManager.GetRandomRawKeyword(groupID)
+		if keyword == "" {
+			break
+		}
+		if g.emojiManager != nil && g.encoder != nil {
+			keyword = insertRandomEmojis(keyword, g.emojiManager)
+		}
+		raw = append(raw, keyword)
+	}
+
+	if g.encoder == nil || len(raw) == 0 {
+		return raw
 	}
+	return g.encoder.EncodeBatch(raw)
+}
 
-	runes := []rune(keyword)
-	runeLen := len(runes)
+// insertRandomEmojis 在关键词的随机字符边界插入 1-2 个不重复的 emoji（50% 概率插入 2 个）
+// 按字节偏移直接拼接，避免 []rune 往返转换和逐次重建切片；插入位置只取原关键词的字符边界，不会拆开多码点 emoji
+func insertRandomEmojis(keyword string, em *EmojiManager) string {
+	runeLen := utf8.RuneCountInString(keyword)
 	if runeLen == 0 {
-		return g.encoder.EncodeText(keyword)
-	}
-
-	exclude := make(map[string]bool)
-	for i := 0; i < emojiCount; i++ {
-		pos := rand.IntN(runeLen + 1)
-		emoji := g.emojiManager.GetRandomExclude(exclude)
-		if emoji != "" {
-			exclude[emoji] = true
-			newRunes := make([]rune, 0, len(runes)+len([]rune(emoji)))
-			newRunes = append(newRunes, runes[:pos]...)
-			newRunes = append(newRunes, []rune(emoji)...)
-			newRunes = append(newRunes, runes[pos:]...)
-			runes = newRunes
-			runeLen = len(runes)
-		}
+		return keyword
+	}
+
+	emoji1, emoji2 := em.GetRandomPair()
+	if emoji1 == "" {
+		return keyword
 	}
 
-	return g.encoder.EncodeText(string(runes))
+	p1 := runeOffset(keyword, rand.IntN(runeLen+1))
+	if rand.Float64() >= 0.5 {
+		return keyword[:p1] + emoji1 + keyword[p1:]
+	}
+
+	p2 := runeOffset(keyword, rand.IntN(runeLen+1))
+	if p2 < p1 {
+		p1, p2 = p2, p1
+	}
+	return keyword[:p1] + emoji1 + keyword[p1:p2] + emoji2 + keyword[p2:]
+}
+
+// runeOffset 返回第 n 个字符的字节偏移（n 超出时返回 len(s)）
+func runeOffset(s string, n int) int {
+	for i := range s {
+		if n == 0 {
+			return i
+		}
+		n--
+	}
+	return len(s)
 }
 
 // getOrCreatePool 获取或创建指定 groupID 的池
@@ -117,8 +162,9 @@ func (g *KeywordEmojiGenerator) getOrCreatePool(groupID int) *KeywordEmojiPool {
 	}
 
 	pool := &KeywordEmojiPool{
-		ch:      make(chan string, g.config.KeywordEmojiPoolSize),
-		groupID: groupID,
+		ch:       make(chan string, g.config.KeywordEmojiPoolSize),
+		refillCh: make(chan struct{}, 1),
+		groupID:  groupID,
 	}
 	g.pools[groupID] = pool
 	log.Debug().Int("group_id", groupID).Int("size", g.config.KeywordEmojiPoolSize).Msg("Created keyword emoji pool")
@@ -127,17 +173,22 @@ func (g *KeywordEmojiGenerator) getOrCreatePool(groupID int) *KeywordEmojiPool {
 
 // Pop 从池获取一个关键词表情组合
 func (g *KeywordEmojiGenerator) Pop(groupID int) string {
-	pool := g.getOrCreatePool(groupID)
+	return g.popFrom(g.getOrCreatePool(groupID))
+}
 
+// popFrom 从已解析的池获取一个关键词表情组合
+// 渲染时同一请求的多个占位符共用一次池查找，避免逐个走 RLock + map 查找
+func (g *KeywordEmojiGenerator) popFrom(pool *KeywordEmojiPool) string {
 	select {
 	case item := <-pool.ch:
 		pool.memoryBytes.Add(-StringMemorySize(item))
 		pool.consumedCount.Add(1)
+		pool.signalRefill(int(float64(g.config.KeywordEmojiPoolSize) * g.config.KeywordEmojiThreshold))
 		return item
 	default:
 		// 池空，同步生成一个返回
 		pool.consumedCount.Add(1)
-		return g.generateKeywordEmoji(groupID)
+		return g.generateKeywordEmoji(pool.groupID)
 	}
 }
 
@@ -151,17 +202,19 @@ func (g *KeywordEmojiGenerator) fillPool(groupID int, pool *KeywordEmojiPool) {
 	filled := 0
 	var addedMem int64
 loop:
-	for i := 0; i < need; i++ {
-		item := g.generateKeywordEmoji(groupID)
-		if item == "" {
+	for filled < need {
+		batch := g.generateKeywordEmojiBatch(groupID, min(need-filled, keywordEmojiBatchSize))
+		if len(batch) == 0 {
 			break
 		}
-		select {
-		case pool.ch <- item:
-			filled++
-			addedMem += StringMemorySize(item)
-		default:
-			break loop
+		for _, item := range batch {
+			select {
+			case pool.ch <- item:
+				filled++
+				addedMem += StringMemorySize(item)
+			default:
+				break loop
+			}
 		}
 	}
 
@@ -194,19 +247,21 @@ func (g *KeywordEmojiGenerator) refillWorker(groupID int, pool *KeywordEmojiPool
 		select {
 		case <-g.ctx.Done():
 			return
+		case <-pool.refillCh:
 		case <-ticker.C:
-			if g.stopped.Load() {
-				return
-			}
-			// 预检查：关键词池为空时跳过
-			if !g.poolManager.HasRawKeywords(groupID) {
-				continue
-			}
-			// 低于阈值时触发补充
-			thresholdCount := int(float64(g.config.KeywordEmojiPoolSize) * g.config.KeywordEmojiThreshold)
-			if len(pool.ch) < thresholdCount {
-				g.fillPool(groupID, pool)
-			}
+		}
+
+		if g.stopped.Load() {
+			return
+		}
+		// 预检查：关键词池为空时跳过
+		if !g.poolManager.HasRawKeywords(groupID) {
+			continue
+		}
+		// 低于阈值时触发补充
+		thresholdCount := int(float64(g.config.KeywordEmojiPoolSize) * g.config.KeywordEmojiThreshold)
+		if len(pool.ch) < thresholdCount {
+			g.fillPool(groupID, pool)
 		}
 	}
 }
@@ -395,14 +450,25 @@ func (g *KeywordEmojiGenerator) SyncGroups(groupIDs []int) {
 	}
 }
 
-// GetTotalStats 获取汇总统计
-func (g *KeywordEmojiGenerator) GetTotalStats() (current, maxSize int, memoryBytes, consumedCount int64) {
+// snapshotPools 短暂持锁复制池列表和当前配置，统计在锁外计算，避免监控轮询与 Pop/建池争用 g.mu
+// 配置指针会被 Reload/Resize 在写锁下替换，须与池列表在同一临界区内读取
+func (g *KeywordEmojiGenerator) snapshotPools() ([]*KeywordEmojiPool, *CachePoolConfig) {
 	g.mu.RLock()
-	defer g.mu.RUnlock()
-
+	pools := make([]*KeywordEmojiPool, 0, len(g.pools))
 	for _, pool := range g.pools {
+		pools = append(pools, pool)
+	}
+	cfg := g.config
+	g.mu.RUnlock()
+	return pools, cfg
+}
+
+// GetTotalStats 获取汇总统计
+func (g *KeywordEmojiGenerator) GetTotalStats() (current, maxSize int, memoryBytes, consumedCount int64) {
+	pools, cfg := g.snapshotPools()
+	for _, pool := range pools {
 		current += len(pool.ch)
-		maxSize += g.config.KeywordEmojiPoolSize
+		maxSize += cfg.KeywordEmojiPoolSize
 		memoryBytes += pool.memoryBytes.Load()
 		consumedCount += pool.consumedCount.Load()
 	}
@@ -411,20 +477,18 @@ func (g *KeywordEmojiGenerator) GetTotalStats() (current, maxSize int, memoryByt
 
 // GetGroupStats 获取分组详情统计
 func (g *KeywordEmojiGenerator) GetGroupStats() []PoolGroupInfo {
-	g.mu.RLock()
-	defer g.mu.RUnlock()
-
-	groups := make([]PoolGroupInfo, 0, len(g.pools))
-	for gid, pool := range g.pools {
+	pools, cfg := g.snapshotPools()
+	groups := make([]PoolGroupInfo, 0, len(pools))
+	for _, pool := range pools {
 		current := len(pool.ch)
-		maxSize := g.config.KeywordEmojiPoolSize
+		maxSize := cfg.KeywordEmojiPoolSize
 		consumed := int(pool.consumedCount.Load())
 		util := 0.0
 		if maxSize > 0 {
 			util = float64(current) / float64(maxSize) * 100
 		}
 		groups = append(groups, PoolGroupInfo{
-			ID:          gid,
+			ID:          pool.groupID,
 			Count:       current,
 			Size:        maxSize,
 			Available:   current,
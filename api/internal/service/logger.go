@@ -7,6 +7,8 @@ import (
 	"io"
 	"os"
 	"path/filepath"
+	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/gin-gonic/gin"
@@ -88,8 +90,8 @@ func SetupLogger(cfg *LogConfig) error {
 		writers = append(writers, buildStdoutWriter(cfg.Format))
 	}
 
-	// Create multi writer
-	multiWriter := io.MultiWriter(writers...)
+	// Create multi writer（LevelWriter 版本，使文件写入器能按级别决定是否立即刷盘）
+	multiWriter := zerolog.MultiLevelWriter(writers...)
 
 	// Set global logger
 	log.Logger = zerolog.New(multiWriter).With().Timestamp().Caller().Logger()
@@ -122,13 +124,126 @@ func buildFileWriter(cfg *LogConfig) (io.Writer, error) {
 		return nil, err
 	}
 
-	return &lumberjack.Logger{
+	// 重复调用 SetupLogger 时先刷出旧写入器中的缓冲日志
+	if old := logFileWriter.Swap(nil); old != nil {
+		old.Close()
+	}
+
+	w := newBatchWriter(&lumberjack.Logger{
 		Filename:   cfg.FilePath,
 		MaxSize:    cfg.MaxSize,
 		MaxBackups: cfg.MaxBackups,
 		MaxAge:     cfg.MaxAge,
 		Compress:   cfg.Compress,
-	}, nil
+	})
+	logFileWriter.Store(w)
+	return w, nil
+}
+
+// 日志文件批量写入参数
+const (
+	logFlushInterval = 500 * time.Millisecond // 定时刷盘间隔
+	logBufferSize    = 64 * 1024              // 缓冲达到该大小时立即刷盘
+)
+
+// logFileWriter 当前的日志文件写入器，CloseLogger 据此在退出前刷出缓冲并关闭文件
+var logFileWriter atomic.Pointer[batchWriter]
+
+// batchWriter 批量写日志文件：日志先追加到内存缓冲，定时或缓冲写满时一次 write 落盘，
+// 高频日志下每秒的写系统调用从每行一次降到每批一次。
+// Error 及以上级别写入后立即刷盘：Fatal 随后会 os.Exit，不能留在缓冲里丢失
+type batchWriter struct {
+	mu  sync.Mutex
+	out io.WriteCloser
+	buf []byte
+
+	stopCh chan struct{}
+	done   chan struct{}
+}
+
+func newBatchWriter(out io.WriteCloser) *batchWriter {
+	w := &batchWriter{
+		out:    out,
+		buf:    make([]byte, 0, logBufferSize),
+		stopCh: make(chan struct{}),
+		done:   make(chan struct{}),
+	}
+	go w.flushLoop()
+	return w
+}
+
+// Write 实现 io.Writer
+func (w *batchWriter) Write(p []byte) (int, error) {
+	return w.WriteLevel(zerolog.NoLevel, p)
+}
+
+// WriteLevel 实现 zerolog.LevelWriter
+func (w *batchWriter) WriteLevel(level zerolog.Level, p []byte) (int, error) {
+	w.mu.Lock()
+	defer w.mu.Unlock()
+
+	w.buf = append(w.buf, p...)
+	if len(w.buf) >= logBufferSize || (level >= zerolog.ErrorLevel && level != zerolog.NoLevel) {
+		if err := w.flushLocked(); err != nil {
+			return 0, err
+		}
+	}
+	return len(p), nil
+}
+
+// flushLocked 将缓冲一次写入文件（调用方持有 mu）
+func (w *batchWriter) flushLocked() error {
+	if len(w.buf) == 0 {
+		return nil
+	}
+	_, err := w.out.Write(w.buf)
+	w.buf = w.buf[:0]
+	return err
+}
+
+// Flush 立即刷出缓冲
+func (w *batchWriter) Flush() error {
+	w.mu.Lock()
+	defer w.mu.Unlock()
+	return w.flushLocked()
+}
+
+func (w *batchWriter) flushLoop() {
+	defer close(w.done)
+	ticker := time.NewTicker(logFlushInterval)
+	defer ticker.Stop()
+
+	for {
+		select {
+		case <-w.stopCh:
+			return
+		case <-ticker.C:
+			if err := w.Flush(); err != nil {
+				fmt.Fprintf(os.Stderr, "Failed to flush log file: %v\n", err)
+			}
+		}
+	}
+}
+
+// Close 停止定时刷盘，刷出剩余缓冲并关闭文件
+func (w *batchWriter) Close() error {
+	close(w.stopCh)
+	<-w.done
+
+	w.mu.Lock()
+	defer w.mu.Unlock()
+	err := w.flushLocked()
+	if cerr := w.out.Close(); err == nil {
+		err = cerr
+	}
+	return err
+}
+
+// CloseLogger 刷出剩余缓冲并关闭日志文件，进程退出前调用（应在 main 中最先 defer）
+func CloseLogger() {
+	if w := logFileWriter.Swap(nil); w != nil {
+		w.Close()
+	}
 }
 
 // RequestLogger returns a gin middleware for request logging
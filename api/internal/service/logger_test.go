@@ -0,0 +1,142 @@
+package core
+
+import (
+	"bytes"
+	"strings"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/rs/zerolog"
+)
+
+// fakeLogFile 记录 batchWriter 落盘内容的 io.WriteCloser
+type fakeLogFile struct {
+	mu     sync.Mutex
+	data   bytes.Buffer
+	writes int
+	closed bool
+}
+
+func (f *fakeLogFile) Write(p []byte) (int, error) {
+	f.mu.Lock()
+	defer f.mu.Unlock()
+	f.writes++
+	return f.data.Write(p)
+}
+
+func (f *fakeLogFile) Close() error {
+	f.mu.Lock()
+	defer f.mu.Unlock()
+	f.closed = true
+	return nil
+}
+
+func (f *fakeLogFile) snapshot() (string, int, bool) {
+	f.mu.Lock()
+	defer f.mu.Unlock()
+	return f.data.String(), f.writes, f.closed
+}
+
+func TestBatchWriter_BuffersUntilSizeLimit(t *testing.T) {
+	out := &fakeLogFile{}
+	w := newBatchWriter(out)
+	defer w.Close()
+
+	line := []byte(strings.Repeat("x", 1023) + "\n")
+	for i := 0; i < logBufferSize/len(line)-1; i++ {
+		w.WriteLevel(zerolog.InfoLevel, line)
+	}
+	if _, writes, _ := out.snapshot(); writes != 0 {
+		t.Fatalf("expected no write below %d bytes, got %d writes", logBufferSize, writes)
+	}
+
+	// 缓冲达到 logBufferSize 时一次写出全部内容
+	w.WriteLevel(zerolog.InfoLevel, line)
+	data, writes, _ := out.snapshot()
+	if writes != 1 {
+		t.Fatalf("expected 1 write at %d bytes, got %d", logBufferSize, writes)
+	}
+	if len(data) != logBufferSize {
+		t.Fatalf("expected %d bytes written, got %d", logBufferSize, len(data))
+	}
+}
+
+func TestBatchWriter_FlushesOnInterval(t *testing.T) {
+	out := &fakeLogFile{}
+	w := newBatchWriter(out)
+	defer w.Close()
+
+	w.WriteLevel(zerolog.InfoLevel, []byte("info\n"))
+	if data, _, _ := out.snapshot(); data != "" {
+		t.Fatalf("expected info line to stay buffered, got %q", data)
+	}
+
+	deadline := time.Now().Add(4 * logFlushInterval)
+	for time.Now().Before(deadline) {
+		if data, _, _ := out.snapshot(); data == "info\n" {
+			return
+		}
+		time.Sleep(logFlushInterval / 10)
+	}
+	t.Fatalf("buffer not flushed within %v", 4*logFlushInterval)
+}
+
+func TestBatchWriter_FlushesErrorImmediately(t *testing.T) {
+	tests := []struct {
+		name  string
+		level zerolog.Level
+		flush bool
+	}{
+		{"debug", zerolog.DebugLevel, false},
+		{"info", zerolog.InfoLevel, false},
+		{"warn", zerolog.WarnLevel, false},
+		{"no level", zerolog.NoLevel, false},
+		{"error", zerolog.ErrorLevel, true},
+		{"fatal", zerolog.FatalLevel, true},
+		{"panic", zerolog.PanicLevel, true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			out := &fakeLogFile{}
+			w := newBatchWriter(out)
+			defer w.Close()
+
+			w.WriteLevel(zerolog.InfoLevel, []byte("before\n"))
+			w.WriteLevel(tt.level, []byte("line\n"))
+
+			data, _, _ := out.snapshot()
+			want := ""
+			if tt.flush {
+				// 立即刷盘时连同之前缓冲的日志一起写出，保持顺序
+				want = "before\nline\n"
+			}
+			if data != want {
+				t.Fatalf("expected %q written, got %q", want, data)
+			}
+		})
+	}
+}
+
+func TestBatchWriter_CloseDrainsBuffer(t *testing.T) {
+	out := &fakeLogFile{}
+	w := newBatchWriter(out)
+
+	w.Write([]byte("a\n"))
+	w.WriteLevel(zerolog.WarnLevel, []byte("b\n"))
+	if err := w.Close(); err != nil {
+		t.Fatalf("Close: %v", err)
+	}
+
+	data, writes, closed := out.snapshot()
+	if data != "a\nb\n" {
+		t.Fatalf("expected buffered lines on Close, got %q", data)
+	}
+	if writes != 1 {
+		t.Fatalf("expected a single write on Close, got %d", writes)
+	}
+	if !closed {
+		t.Fatal("expected underlying writer to be closed")
+	}
+}
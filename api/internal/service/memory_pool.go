@@ -32,26 +32,43 @@ type PoolItem struct {
 }
 
 // MemoryPool is a thread-safe FIFO queue for pool items
+// 使用固定容量的环形缓冲区：Pop 不再 reslice，已消费的槽位立即复用并释放文本引用
 type MemoryPool struct {
-	items         []PoolItem
-	mu            sync.RWMutex
-	groupID       int
-	poolType      string // "titles" or "contents"
-	maxSize       int
-	memoryBytes   atomic.Int64          // 内存占用追踪
-	consumedCount atomic.Int64          // 被消费的数量（Pop 计数）
-	loadedIDs     map[int64]struct{}    // 已加载的 ID 集合，用于去重
-	exhaustedUntil time.Time            // 数据耗尽时的冷却截止时间，避免空转查询
+	ring           []PoolItem // 环形缓冲区，容量 = maxSize
+	head           int        // 队首位置
+	count          int        // 当前元素数量
+	mu             sync.RWMutex
+	groupID        int
+	poolType       string // "titles" or "contents"
+	maxSize        int
+	memoryBytes    atomic.Int64       // 内存占用追踪
+	consumedCount  atomic.Int64       // 被消费的数量（Pop 计数）
+	length         atomic.Int64       // count 的缓存，Len() 无需加锁
+	loadedIDs      map[int64]struct{} // 已加载的 ID 集合，用于去重
+	exhaustedUntil time.Time          // 数据耗尽时的冷却截止时间，避免空转查询
+
+	// 补充查询的代次：ForgetIDs 只在提交前开始的补充全部结束后才删除去重记录，
+	// 否则提交前发出的 SELECT 仍可能返回已消费的行，被 Push 再次放入池中
+	refillSeq      uint64              // 已开始的补充次数
+	activeRefills  map[uint64]struct{} // 进行中的补充代次
+	pendingForgets []pendingForget     // 等待在途补充结束后再删除的 ID
+}
+
+// pendingForget 一批已提交消费的 ID，seq 为提交时已开始的最后一次补充的代次
+type pendingForget struct {
+	ids []int64
+	seq uint64
 }
 
 // NewMemoryPool creates a new memory pool
 func NewMemoryPool(groupID int, poolType string, maxSize int) *MemoryPool {
 	return &MemoryPool{
-		items:     make([]PoolItem, 0, maxSize),
-		groupID:   groupID,
-		poolType:  poolType,
-		maxSize:   maxSize,
-		loadedIDs: make(map[int64]struct{}),
+		ring:          make([]PoolItem, maxSize),
+		groupID:       groupID,
+		poolType:      poolType,
+		maxSize:       maxSize,
+		loadedIDs:     make(map[int64]struct{}),
+		activeRefills: make(map[uint64]struct{}),
 	}
 }
 
@@ -60,12 +77,15 @@ func (p *MemoryPool) Pop() (PoolItem, bool) {
 	p.mu.Lock()
 	defer p.mu.Unlock()
 
-	if len(p.items) == 0 {
+	if p.count == 0 {
 		return PoolItem{}, false
 	}
 
-	item := p.items[0]
-	p.items = p.items[1:]
+	item := p.ring[p.head]
+	p.ring[p.head] = PoolItem{} // 释放文本引用
+	p.head = (p.head + 1) % len(p.ring)
+	p.count--
+	p.length.Store(int64(p.count))
 
 	// 减少内存计数
 	p.memoryBytes.Add(-StringMemorySize(item.Text))
@@ -85,7 +105,7 @@ func (p *MemoryPool) Push(items []PoolItem) int {
 	p.mu.Lock()
 	defer p.mu.Unlock()
 
-	available := p.maxSize - len(p.items)
+	available := len(p.ring) - p.count
 	if available <= 0 {
 		return 0
 	}
@@ -100,27 +120,89 @@ func (p *MemoryPool) Push(items []PoolItem) int {
 			continue
 		}
 		p.loadedIDs[item.ID] = struct{}{}
-		p.items = append(p.items, item)
+		p.ring[(p.head+p.count)%len(p.ring)] = item
+		p.count++
 		addedMem += StringMemorySize(item.Text)
 		added++
 	}
+	p.length.Store(int64(p.count))
 	p.memoryBytes.Add(addedMem)
 	return added
 }
 
-// Len returns the current number of items in the pool
+// BeginRefill marks the start of a refill query and returns its generation.
+// Every BeginRefill must be paired with EndRefill once the query result has been pushed.
+func (p *MemoryPool) BeginRefill() uint64 {
+	p.mu.Lock()
+	defer p.mu.Unlock()
+	p.refillSeq++
+	p.activeRefills[p.refillSeq] = struct{}{}
+	return p.refillSeq
+}
+
+// EndRefill marks the refill of the given generation as finished and releases
+// forgotten IDs that no in-flight refill can return any more.
+func (p *MemoryPool) EndRefill(seq uint64) {
+	p.mu.Lock()
+	defer p.mu.Unlock()
+	delete(p.activeRefills, seq)
+	p.drainForgetsLocked()
+}
+
+// ForgetIDs removes IDs from loaded ID tracking once their status = 0 update
+// has been committed; refills started after the commit (status = 1) can no longer
+// return them, so keeping them would only grow loadedIDs without bound.
+// Refills already in flight may still return the consumed rows, so deletion is
+// deferred until every refill that started before this call has finished.
+func (p *MemoryPool) ForgetIDs(ids []int64) {
+	if len(ids) == 0 {
+		return
+	}
+	p.mu.Lock()
+	defer p.mu.Unlock()
+	p.pendingForgets = append(p.pendingForgets, pendingForget{ids: ids, seq: p.refillSeq})
+	p.drainForgetsLocked()
+}
+
+// drainForgetsLocked 删除不会再被任何在途补充返回的 ID（调用方持有 mu）
+func (p *MemoryPool) drainForgetsLocked() {
+	oldest := p.refillSeq + 1 // 最早的在途补充代次，无在途补充时大于所有记录
+	for seq := range p.activeRefills {
+		oldest = min(oldest, seq)
+	}
+
+	// pendingForgets 按 seq 递增追加，依次处理到第一个仍需等待的批次
+	n := 0
+	for _, pf := range p.pendingForgets {
+		if pf.seq >= oldest {
+			break
+		}
+		for _, id := range pf.ids {
+			delete(p.loadedIDs, id)
+		}
+		n++
+	}
+	if n > 0 {
+		clear(p.pendingForgets[:n])
+		p.pendingForgets = p.pendingForgets[n:]
+	}
+}
+
+// Len returns the current number of items in the pool (lock-free)
 func (p *MemoryPool) Len() int {
-	p.mu.RLock()
-	defer p.mu.RUnlock()
-	return len(p.items)
+	return int(p.length.Load())
 }
 
 // Clear removes all items from the pool and resets loaded ID tracking
 func (p *MemoryPool) Clear() {
 	p.mu.Lock()
 	defer p.mu.Unlock()
-	p.items = p.items[:0]
+	clear(p.ring)
+	p.head = 0
+	p.count = 0
+	p.length.Store(0)
 	p.loadedIDs = make(map[int64]struct{})
+	p.pendingForgets = nil
 	p.memoryBytes.Store(0)
 	p.exhaustedUntil = time.Time{} // 重置冷却，允许立即重新加载
 }
@@ -132,16 +214,26 @@ func (p *MemoryPool) Resize(newMaxSize int) {
 
 	p.maxSize = newMaxSize
 
-	// Truncate if current items exceed new max size
-	if len(p.items) > newMaxSize {
-		// 计算被移除项的内存
-		var removedMem int64
-		for i := newMaxSize; i < len(p.items); i++ {
-			removedMem += StringMemorySize(p.items[i].Text)
+	// 按新容量重建环形缓冲区，保留队首的元素，超出部分截断
+	newRing := make([]PoolItem, newMaxSize)
+	keep := p.count
+	if keep > newMaxSize {
+		keep = newMaxSize
+	}
+	var removedMem int64
+	for i := 0; i < p.count; i++ {
+		item := p.ring[(p.head+i)%len(p.ring)]
+		if i < keep {
+			newRing[i] = item
+		} else {
+			removedMem += StringMemorySize(item.Text)
 		}
-		p.memoryBytes.Add(-removedMem)
-		p.items = p.items[:newMaxSize]
 	}
+	p.memoryBytes.Add(-removedMem)
+	p.ring = newRing
+	p.head = 0
+	p.count = keep
+	p.length.Store(int64(keep))
 }
 
 // GetGroupID returns the group ID
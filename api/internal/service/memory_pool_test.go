@@ -59,6 +59,67 @@ func TestPop_DoesNotRemoveFromLoadedIDs(t *testing.T) {
 	}
 }
 
+func TestForgetIDs_AllowsReloadAfterFlush(t *testing.T) {
+	pool := NewMemoryPool(1, "contents", 100)
+
+	pool.Push([]PoolItem{{ID: 1, Text: "aaa"}, {ID: 2, Text: "bbb"}})
+	pool.Pop()
+
+	// 状态更新已提交且没有在途补充，ID 1 不再需要去重
+	pool.ForgetIDs([]int64{1})
+
+	pool.Push([]PoolItem{{ID: 1, Text: "aaa"}, {ID: 2, Text: "bbb"}})
+
+	if pool.Len() != 2 {
+		t.Fatalf("expected 2 after forget and re-push, got %d", pool.Len())
+	}
+}
+
+func TestForgetIDs_DeferredUntilInFlightRefillEnds(t *testing.T) {
+	pool := NewMemoryPool(1, "contents", 100)
+
+	pool.Push([]PoolItem{{ID: 1, Text: "aaa"}})
+	pool.Pop()
+
+	// 补充查询在提交前开始，其结果仍包含已消费的 ID 1
+	seq := pool.BeginRefill()
+	pool.ForgetIDs([]int64{1})
+
+	if added := pool.Push([]PoolItem{{ID: 1, Text: "aaa"}, {ID: 2, Text: "bbb"}}); added != 1 {
+		t.Fatalf("stale refill must not re-add consumed ID, added %d", added)
+	}
+	pool.EndRefill(seq)
+
+	// 提交后开始的补充不会再返回 ID 1，此时去重记录已释放
+	pool.mu.RLock()
+	_, tracked := pool.loadedIDs[1]
+	pool.mu.RUnlock()
+	if tracked {
+		t.Fatal("expected ID 1 to be forgotten after in-flight refill ended")
+	}
+}
+
+func TestForgetIDs_IgnoresRefillsStartedAfterFlush(t *testing.T) {
+	pool := NewMemoryPool(1, "contents", 100)
+
+	pool.Push([]PoolItem{{ID: 1, Text: "aaa"}})
+	pool.Pop()
+
+	before := pool.BeginRefill()
+	pool.ForgetIDs([]int64{1})
+	after := pool.BeginRefill()
+
+	// 提交前开始的补充结束即可释放，不必等待提交后开始的补充
+	pool.EndRefill(before)
+	pool.mu.RLock()
+	_, tracked := pool.loadedIDs[1]
+	pool.mu.RUnlock()
+	if tracked {
+		t.Fatal("expected ID 1 to be forgotten once earlier refill ended")
+	}
+	pool.EndRefill(after)
+}
+
 func TestClear_ResetsLoadedIDs(t *testing.T) {
 	pool := NewMemoryPool(1, "contents", 100)
 
@@ -92,3 +153,24 @@ func TestPush_MemoryBytesCorrectWithDedup(t *testing.T) {
 		t.Fatalf("memory should not increase on duplicate push: %d != %d", pool.MemoryBytes(), memAfterFirst)
 	}
 }
+
+func TestPushPop_RingWrapsAroundInOrder(t *testing.T) {
+	pool := NewMemoryPool(1, "contents", 3)
+
+	pool.Push([]PoolItem{{ID: 1, Text: "a"}, {ID: 2, Text: "b"}, {ID: 3, Text: "c"}})
+	pool.Pop()
+	pool.Pop()
+
+	// 写入位置回绕到缓冲区开头
+	pool.Push([]PoolItem{{ID: 4, Text: "d"}, {ID: 5, Text: "e"}})
+
+	for _, want := range []int64{3, 4, 5} {
+		item, ok := pool.Pop()
+		if !ok || item.ID != want {
+			t.Fatalf("expected ID %d, got %d (ok=%v)", want, item.ID, ok)
+		}
+	}
+	if pool.Len() != 0 {
+		t.Fatalf("expected empty pool, got %d", pool.Len())
+	}
+}
@@ -7,14 +7,16 @@ import (
 )
 
 // NumberPool 随机数池管理器
+// 以 [min, max] 数组为键，Get 无需格式化字符串键
+// 预定义范围均在 int32 内，池以 int32 存储，环形缓冲区内存减半、缓存更友好
 type NumberPool struct {
-	pools map[string]*ObjectPool[int]
+	pools map[[2]int]*ObjectPool[int32]
 }
 
 // NewNumberPool 创建随机数池
 func NewNumberPool() *NumberPool {
 	np := &NumberPool{
-		pools: make(map[string]*ObjectPool[int]),
+		pools: make(map[[2]int]*ObjectPool[int32]),
 	}
 
 	// 预定义常用范围（根据模板中实际使用的范围）
@@ -41,23 +43,39 @@ func NewNumberPool() *NumberPool {
 			Name:          "number_" + key,
 			Size:          10000,
 			Threshold:     0.3,
-			NumWorkers:    2,
+			NumWorkers:    1, // 生成整数只需纳秒级，单协程补充即可，无需并行
 			CheckInterval: 1 * time.Second,
 		}
 
-		// 使用闭包捕获min/max
-		generator := func(min, max int) func() int {
-			return func() int {
-				return rand.IntN(max-min+1) + min
+		// 使用闭包捕获min/max，批量生成时区间跨度只计算一次
+		generator := func(min, max int) func(dst []int32) {
+			span := uint64(max - min + 1)
+			return func(dst []int32) {
+				fillRandomInts(dst, min, span)
 			}
 		}(minVal, maxVal)
 
-		np.pools[key] = NewObjectPool[int](cfg, generator)
+		np.pools[r] = NewBatchObjectPool[int32](cfg, generator)
 	}
 
 	return np
 }
 
+// fillRandomInts 用 [min, min+span) 内的随机数填满 dst
+// 一次 rand.Uint64 拆成两个 32 位随机量，各自按乘法映射到区间（span 远小于 2^32，偏差可忽略）
+func fillRandomInts(dst []int32, min int, span uint64) {
+	base := int32(min)
+	i := 0
+	for ; i+1 < len(dst); i += 2 {
+		x := rand.Uint64()
+		dst[i] = int32((x&0xffffffff)*span>>32) + base
+		dst[i+1] = int32((x>>32)*span>>32) + base
+	}
+	if i < len(dst) {
+		dst[i] = int32((rand.Uint64()&0xffffffff)*span>>32) + base
+	}
+}
+
 // Start 启动所有池
 func (np *NumberPool) Start() {
 	for _, pool := range np.pools {
@@ -67,9 +85,8 @@ func (np *NumberPool) Start() {
 
 // Get 获取随机数
 func (np *NumberPool) Get(min, max int) int {
-	key := fmt.Sprintf("%d-%d", min, max)
-	if pool, ok := np.pools[key]; ok {
-		return pool.Get()
+	if pool, ok := np.pools[[2]int{min, max}]; ok {
+		return int(pool.Get())
 	}
 	// 降级到直接生成
 	return rand.IntN(max-min+1) + min
@@ -85,8 +102,8 @@ func (np *NumberPool) Stop() {
 // Stats 返回所有池统计
 func (np *NumberPool) Stats() map[string]interface{} {
 	stats := make(map[string]interface{})
-	for key, pool := range np.pools {
-		stats[key] = pool.Stats()
+	for r, pool := range np.pools {
+		stats[fmt.Sprintf("%d-%d", r[0], r[1])] = pool.Stats()
 	}
 	return stats
 }
@@ -30,24 +30,27 @@ type ObjectPool[T any] struct {
 	checkInterval time.Duration // 检查间隔
 
 	// 生产者
-	generator   func() T
-	memorySizer func(any) int64 // 计算元素内存占用
+	generator      func() T
+	batchGenerator func(dst []T)   // 可选：批量生成，设置后优先于 generator
+	memorySizer    func(any) int64 // 计算元素内存占用
 
 	// 控制
-	stopCh  chan struct{}
-	wg      sync.WaitGroup
-	stopped atomic.Bool // 是否已停止
+	stopCh   chan struct{}
+	refillCh chan struct{} // 消费者越过低水位时通知补充（缓冲 1，合并重复通知）
+	lowWater atomic.Int64  // 低水位数量 = size * threshold
+	wg       sync.WaitGroup
+	stopped  atomic.Bool // 是否已停止
 
 	// 统计
 	totalGenerated int64
-	totalConsumed  int64
+	consumedBase   int64        // head 重置（Clear/Resize）前累计的消费量，总消费 = consumedBase + head
 	refillCount    atomic.Int64 // 补充次数统计
 	lastRefresh    atomic.Int64 // 最后刷新时间戳（Unix纳秒）
 
 	// 内存追踪（仅用于 string 类型）
 	memoryBytes atomic.Int64
 
-	// 仅用于 Resize/Clear/UpdateConfig 等低频操作的互斥锁
+	// Resize/Clear/UpdateConfig 等低频操作的互斥锁，补充时发布新元素也持有（每块一次）
 	mu sync.Mutex
 
 	// ticker 用于 refillLoop，提升为字段以支持动态更新间隔
@@ -74,6 +77,7 @@ func NewObjectPool[T any](cfg PoolConfig, generator func() T) *ObjectPool[T] {
 		generator:     generator,
 		memorySizer:   cfg.MemorySizer,
 		stopCh:        make(chan struct{}),
+		refillCh:      make(chan struct{}, 1),
 	}
 	// 初始化快照
 	snap := &poolSnapshot[T]{
@@ -81,6 +85,15 @@ func NewObjectPool[T any](cfg PoolConfig, generator func() T) *ObjectPool[T] {
 		size: int64(cfg.Size),
 	}
 	p.snapshot.Store(snap)
+	p.lowWater.Store(int64(float64(cfg.Size) * cfg.Threshold))
+	return p
+}
+
+// NewBatchObjectPool 创建批量生产的对象池
+// batchGenerator 一次填满 dst，便于批内共享底层内存（如整批字符串共用一块缓冲区）
+func NewBatchObjectPool[T any](cfg PoolConfig, batchGenerator func(dst []T)) *ObjectPool[T] {
+	p := NewObjectPool[T](cfg, nil)
+	p.batchGenerator = batchGenerator
 	return p
 }
 
@@ -121,11 +134,11 @@ func (p *ObjectPool[T]) prefillParallel() {
 		}
 		go func(start, batch, wIdx int) {
 			defer wg.Done()
+			segment := snap.data[start : start+batch]
+			p.fill(segment)
 			var localMem int64
-			for i := 0; i < batch; i++ {
-				item := p.generator()
-				snap.data[start+i] = item
-				if p.memorySizer != nil {
+			if p.memorySizer != nil {
+				for _, item := range segment {
 					localMem += p.memorySizer(item)
 				}
 			}
@@ -152,11 +165,56 @@ func (p *ObjectPool[T]) prefillParallel() {
 func (p *ObjectPool[T]) Get() T {
 	snap := p.snapshot.Load() // atomic load, 无锁
 
+	// 消费计数由 head 推导，热路径只有一次原子自增
 	idx := atomic.AddInt64(&p.head, 1) - 1
-	atomic.AddInt64(&p.totalConsumed, 1)
+
+	// 剩余量恰好跌破低水位时通知补充协程（每次跌破只有一个消费者命中）
+	if atomic.LoadInt64(&p.tail)-idx == p.lowWater.Load() {
+		p.notifyRefill()
+	}
 	return snap.data[idx%snap.size]
 }
 
+// PoolReservation 一次性预留的连续元素，由单个协程顺序消费，不再访问共享计数器
+type PoolReservation[T any] struct {
+	snap     *poolSnapshot[T]
+	next     int64
+	fallback func() T // snap 为空（池未初始化）时逐个生成
+}
+
+// Next 返回预留区间的下一个元素（调用次数不应超过预留数量）
+func (r *PoolReservation[T]) Next() T {
+	if r.snap == nil {
+		return r.fallback()
+	}
+	v := r.snap.data[r.next%r.snap.size]
+	r.next++
+	return v
+}
+
+// Reserve 一次原子操作预留 n 个元素，供单次渲染无竞争地顺序消费
+// 渲染中同类占位符可达数百个，逐个 Get 会让所有请求争用同一个 head 缓存行
+func (p *ObjectPool[T]) Reserve(n int) PoolReservation[T] {
+	snap := p.snapshot.Load()
+	end := atomic.AddInt64(&p.head, int64(n))
+	start := end - int64(n)
+
+	// 预留区间跨过低水位时通知补充协程（与 Get 的判定等价）
+	remain := atomic.LoadInt64(&p.tail) - start
+	if lw := p.lowWater.Load(); remain >= lw && remain-int64(n) < lw {
+		p.notifyRefill()
+	}
+	return PoolReservation[T]{snap: snap, next: start}
+}
+
+// notifyRefill 非阻塞通知补充协程（已有待处理通知时合并）
+func (p *ObjectPool[T]) notifyRefill() {
+	select {
+	case p.refillCh <- struct{}{}:
+	default:
+	}
+}
+
 // Available 当前可用数量
 func (p *ObjectPool[T]) Available() int64 {
 	snap := p.snapshot.Load()
@@ -174,6 +232,7 @@ func (p *ObjectPool[T]) Available() int64 {
 }
 
 // refillLoop 后台补充循环
+// 低水位通知立即触发补充，ticker 作为兜底检查
 func (p *ObjectPool[T]) refillLoop() {
 	defer p.wg.Done()
 
@@ -186,6 +245,8 @@ func (p *ObjectPool[T]) refillLoop() {
 		select {
 		case <-p.stopCh:
 			return
+		case <-p.refillCh:
+			p.checkAndRefill()
 		case <-p.ticker.C:
 			p.checkAndRefill()
 		}
@@ -214,6 +275,12 @@ func (p *ObjectPool[T]) refillToFull(need int) {
 		return
 	}
 
+	// 单协程配置直接在当前协程生成，省去 goroutine 调度和 WaitGroup
+	if p.numWorkers <= 1 {
+		p.produce(need)
+		return
+	}
+
 	var wg sync.WaitGroup
 	batchPerWorker := need / p.numWorkers
 	remainder := need % p.numWorkers
@@ -226,24 +293,80 @@ func (p *ObjectPool[T]) refillToFull(need int) {
 		}
 		go func(batch int) {
 			defer wg.Done()
+			p.produce(batch)
+		}(workerBatch)
+	}
 
-			items := make([]T, batch)
-			for i := 0; i < batch; i++ {
-				items[i] = p.generator()
-			}
+	wg.Wait()
+}
+
+// produceChunk 补充时每次生成并发布的元素数（限制单次持锁复制的长度）
+const produceChunk = 256
+
+// produce 生成 batch 个元素
+// 每块先在私有切片中生成（不持锁，多个 worker 并行），再在 p.mu 下复制进环形槽位，
+// 写入完成后才推进 tail，消费者看到的 tail 之前的槽位均已写好
+func (p *ObjectPool[T]) produce(batch int) {
+	scratch := make([]T, min(batch, produceChunk))
+	for remaining := batch; remaining > 0; {
+		chunk := scratch[:min(remaining, len(scratch))]
+		p.fill(chunk)
+		p.publish(chunk)
+		remaining -= len(chunk)
+	}
 
-			snap := p.snapshot.Load()
+	atomic.AddInt64(&p.totalGenerated, int64(batch))
+}
 
-			for _, item := range items {
-				idx := atomic.AddInt64(&p.tail, 1) - 1
-				snap.data[idx%snap.size] = item
-			}
+// publish 将已生成的元素复制到 tail 之后的槽位并推进 tail（持 p.mu，与 Resize/Clear 互斥）
+// 内存统计按被覆盖元素与新元素的差值更新，保持与 prefillParallel 相同的整环口径
+func (p *ObjectPool[T]) publish(items []T) {
+	p.mu.Lock()
+	defer p.mu.Unlock()
 
-			atomic.AddInt64(&p.totalGenerated, int64(batch))
-		}(workerBatch)
+	snap := p.snapshot.Load()
+	n := min(int64(len(items)), snap.size)
+	tail := atomic.LoadInt64(&p.tail)
+	start := tail % snap.size
+
+	// 目标槽位可能跨越环尾，分两段复制
+	first := min(n, snap.size-start)
+	var memDelta int64
+	if p.memorySizer != nil {
+		memDelta = p.ringMemoryDelta(snap.data[start:start+first], items[:first])
+	}
+	copy(snap.data[start:start+first], items[:first])
+	if first < n {
+		if p.memorySizer != nil {
+			memDelta += p.ringMemoryDelta(snap.data[:n-first], items[first:n])
+		}
+		copy(snap.data[:n-first], items[first:n])
 	}
 
-	wg.Wait()
+	atomic.StoreInt64(&p.tail, tail+n)
+	if memDelta != 0 {
+		p.memoryBytes.Add(memDelta)
+	}
+}
+
+// ringMemoryDelta 用 items 覆盖 slots 后的内存占用变化量
+func (p *ObjectPool[T]) ringMemoryDelta(slots, items []T) int64 {
+	var delta int64
+	for i := range items {
+		delta += p.memorySizer(items[i]) - p.memorySizer(slots[i])
+	}
+	return delta
+}
+
+// fill 生成 len(dst) 个元素写入 dst
+func (p *ObjectPool[T]) fill(dst []T) {
+	if p.batchGenerator != nil {
+		p.batchGenerator(dst)
+		return
+	}
+	for i := range dst {
+		dst[i] = p.generator()
+	}
 }
 
 // Stop 停止池子（安全支持重复调用）
@@ -284,7 +407,7 @@ func (p *ObjectPool[T]) Stats() map[string]interface{} {
 		"available":       available,
 		"used":            used,
 		"total_generated": atomic.LoadInt64(&p.totalGenerated),
-		"total_consumed":  atomic.LoadInt64(&p.totalConsumed),
+		"total_consumed":  atomic.LoadInt64(&p.consumedBase) + atomic.LoadInt64(&p.head),
 		"utilization":     float64(available) / float64(snap.size) * 100,
 		"status":          status,
 		"refill_count":    p.refillCount.Load(),
@@ -304,9 +427,9 @@ func (p *ObjectPool[T]) Clear() {
 	p.mu.Lock()
 	defer p.mu.Unlock()
 
-	atomic.StoreInt64(&p.head, 0)
+	atomic.AddInt64(&p.consumedBase, atomic.SwapInt64(&p.head, 0))
 	atomic.StoreInt64(&p.tail, 0)
-	p.memoryBytes.Store(0)
+	// 环形槽位中的元素仍被引用，内存占用不变，由后续补充按覆盖差值更新
 
 	log.Info().Str("pool", p.name).Msg("Object pool cleared")
 }
@@ -317,6 +440,7 @@ func (p *ObjectPool[T]) UpdateConfig(size int, threshold float64, numWorkers int
 
 	// 1. 更新阈值
 	p.threshold = threshold
+	p.lowWater.Store(int64(float64(p.snapshot.Load().size) * threshold))
 
 	// 2. 更新协程数
 	p.numWorkers = numWorkers
@@ -396,8 +520,18 @@ func (p *ObjectPool[T]) Resize(newSize int) {
 		size: int64(newSize),
 	}
 	p.snapshot.Store(newSnap)
+	p.lowWater.Store(int64(float64(newSize) * p.threshold))
+
+	// 新环的内存占用（含未复制槽位的零值，与 prefillParallel 口径一致）
+	if p.memorySizer != nil {
+		var totalMem int64
+		for _, item := range newPool {
+			totalMem += p.memorySizer(item)
+		}
+		p.memoryBytes.Store(totalMem)
+	}
 
-	atomic.StoreInt64(&p.head, 0)
+	atomic.AddInt64(&p.consumedBase, atomic.SwapInt64(&p.head, 0))
 	atomic.StoreInt64(&p.tail, copyCount)
 
 	log.Info().Str("pool", p.name).Int64("copied", copyCount).Int("newSize", newSize).Msg("Pool resize completed")
@@ -3,8 +3,10 @@ package pool
 import (
 	"context"
 	"fmt"
+	"maps"
 	"math/rand/v2"
 	"sync"
+	"sync/atomic"
 
 	"github.com/jmoiron/sqlx"
 	"github.com/rs/zerolog/log"
@@ -14,17 +16,18 @@ import (
 
 // ImagePool 图片池实现
 // 使用 Repository 层获取数据,支持多分组管理
+// 与 KeywordPool 相同：读取无锁加载快照，写入在 mu 下复制分组表后发布
 type ImagePool struct {
 	repo repository.ImageRepository
 
 	// 数据存储
-	data        map[int][]string // groupID -> image URLs
-	mu          sync.RWMutex
-	memoryBytes int64 // 内存占用追踪
+	data        atomic.Pointer[map[int][]string] // groupID -> image URLs（不可变快照）
+	mu          sync.Mutex                       // 仅串行化写入
+	memoryBytes atomic.Int64                     // 内存占用追踪（统计读取不加锁）
 
 	// 统计
-	hits   int64
-	misses int64
+	hits   atomic.Int64
+	misses atomic.Int64
 
 	// 控制
 	ctx    context.Context
@@ -35,14 +38,14 @@ type ImagePool struct {
 // NewImagePool 创建新的图片池
 func NewImagePool(db *sqlx.DB) *ImagePool {
 	ctx, cancel := context.WithCancel(context.Background())
-	return &ImagePool{
+	p := &ImagePool{
 		repo:   repository.NewImageRepository(db),
-		data:   make(map[int][]string),
 		ctx:    ctx,
 		cancel: cancel,
-		hits:   0,
-		misses: 0,
 	}
+	data := make(map[int][]string)
+	p.data.Store(&data)
+	return p
 }
 
 // Start 启动图片池
@@ -65,7 +68,7 @@ func (p *ImagePool) Start(ctx context.Context) error {
 
 	log.Info().
 		Int("groups", len(groups)).
-		Int64("memory_bytes", p.memoryBytes).
+		Int64("memory_bytes", p.memoryBytes.Load()).
 		Msg("Image pool started")
 
 	return nil
@@ -81,37 +84,28 @@ func (p *ImagePool) Stop() error {
 
 // Pop 获取一个图片URL(随机)
 func (p *ImagePool) Pop(groupID int) (string, error) {
-	p.mu.RLock()
-	items := p.data[groupID]
-	if len(items) == 0 {
-		// Fallback to default group
-		items = p.data[1]
-	}
-	p.mu.RUnlock()
+	items := groupItems(*p.data.Load(), groupID)
 
 	if len(items) == 0 {
-		p.misses++
+		p.misses.Add(1)
 		return "", ErrEmptyPool
 	}
 
-	p.hits++
+	p.hits.Add(1)
 	return items[rand.IntN(len(items))], nil
 }
 
 // GetStats 获取统计信息
 func (p *ImagePool) GetStats(groupID int) PoolStats {
-	p.mu.RLock()
-	items := p.data[groupID]
-	count := len(items)
-	p.mu.RUnlock()
+	count := len((*p.data.Load())[groupID])
 
 	return PoolStats{
 		Current:     count,
 		Capacity:    count,
 		GroupID:     groupID,
-		CacheHits:   p.hits,
-		CacheMisses: p.misses,
-		MemoryBytes: p.memoryBytes,
+		CacheHits:   p.hits.Load(),
+		CacheMisses: p.misses.Load(),
+		MemoryBytes: p.memoryBytes.Load(),
 	}
 }
 
@@ -188,14 +182,15 @@ func (p *ImagePool) loadGroup(ctx context.Context, groupID int) error {
 	}
 
 	p.mu.Lock()
+	old := *p.data.Load()
 	// 计算旧数据内存
-	oldMem := SliceMemorySize(p.data[groupID])
+	oldMem := SliceMemorySize(old[groupID])
 	// 更新数据
-	p.data[groupID] = urls
+	p.storeGroup(old, groupID, urls)
 	// 计算新数据内存
 	newMem := SliceMemorySize(urls)
 	// 更新内存计数
-	p.memoryBytes += newMem - oldMem
+	p.memoryBytes.Add(newMem - oldMem)
 	p.mu.Unlock()
 
 	log.Info().
@@ -209,13 +204,7 @@ func (p *ImagePool) loadGroup(ctx context.Context, groupID int) error {
 
 // GetRandomImage 返回随机图片URL
 func (p *ImagePool) GetRandomImage(groupID int) string {
-	p.mu.RLock()
-	items := p.data[groupID]
-	if len(items) == 0 {
-		items = p.data[1]
-	}
-	p.mu.RUnlock()
-
+	items := groupItems(*p.data.Load(), groupID)
 	if len(items) == 0 {
 		return ""
 	}
@@ -224,10 +213,7 @@ func (p *ImagePool) GetRandomImage(groupID int) string {
 
 // GetImages 返回指定分组的所有图片URL
 func (p *ImagePool) GetImages(groupID int) []string {
-	p.mu.RLock()
-	urls := p.data[groupID]
-	p.mu.RUnlock()
-
+	urls := (*p.data.Load())[groupID]
 	if len(urls) == 0 {
 		return nil
 	}
@@ -243,17 +229,14 @@ func (p *ImagePool) AppendImages(groupID int, urls []string) {
 		return
 	}
 
-	p.mu.Lock()
-	defer p.mu.Unlock()
-
-	if p.data[groupID] == nil {
-		p.data[groupID] = []string{}
-	}
-	p.data[groupID] = append(p.data[groupID], urls...)
-
-	// 增加内存计数
+	// 内存计算在锁外完成，写锁只覆盖一次合并
 	addedMem := SliceMemorySize(urls)
-	p.memoryBytes += addedMem
+
+	p.mu.Lock()
+	old := *p.data.Load()
+	p.storeGroup(old, groupID, append(old[groupID], urls...))
+	p.memoryBytes.Add(addedMem)
+	p.mu.Unlock()
 
 	log.Debug().Int("group_id", groupID).Int("added", len(urls)).Msg("Images appended to pool")
 }
@@ -265,11 +248,8 @@ func (p *ImagePool) ReloadGroup(ctx context.Context, groupID int) error {
 
 // GetTotalCount 获取所有图片总数
 func (p *ImagePool) GetTotalCount() int {
-	p.mu.RLock()
-	defer p.mu.RUnlock()
-
 	total := 0
-	for _, items := range p.data {
+	for _, items := range *p.data.Load() {
 		total += len(items)
 	}
 	return total
@@ -277,20 +257,22 @@ func (p *ImagePool) GetTotalCount() int {
 
 // GetGroupCount 获取指定分组的图片数量
 func (p *ImagePool) GetGroupCount(groupID int) int {
-	p.mu.RLock()
-	defer p.mu.RUnlock()
-
-	return len(p.data[groupID])
+	return len((*p.data.Load())[groupID])
 }
 
 // GetAllGroups 获取所有分组信息
 func (p *ImagePool) GetAllGroups() map[int]int {
-	p.mu.RLock()
-	defer p.mu.RUnlock()
-
-	groups := make(map[int]int)
-	for gid, items := range p.data {
+	data := *p.data.Load()
+	groups := make(map[int]int, len(data))
+	for gid, items := range data {
 		groups[gid] = len(items)
 	}
 	return groups
 }
+
+// storeGroup 写时复制：基于 old 替换指定分组数据并发布新快照（调用方须持有 p.mu）
+func (p *ImagePool) storeGroup(old map[int][]string, groupID int, urls []string) {
+	next := maps.Clone(old)
+	next[groupID] = urls
+	p.data.Store(&next)
+}
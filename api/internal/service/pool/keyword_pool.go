@@ -4,8 +4,10 @@ import (
 	"context"
 	"errors"
 	"fmt"
+	"maps"
 	"math/rand/v2"
 	"sync"
+	"sync/atomic"
 
 	"github.com/jmoiron/sqlx"
 	"github.com/rs/zerolog/log"
@@ -18,20 +20,26 @@ var (
 	ErrEmptyPool = errors.New("pool is empty")
 )
 
+// keywordSnapshot 不可变的分组数据快照（写时复制，读路径无锁）
+type keywordSnapshot struct {
+	data    map[int][]string // groupID -> encoded keywords
+	rawData map[int][]string // groupID -> raw keywords
+}
+
 // KeywordPool 关键词池实现
 // 使用 Repository 层获取数据,支持多分组管理
+// 读取通过 atomic.Pointer 加载快照，完全无锁；加载/追加等低频写入在 mu 下复制分组表后发布新快照
 type KeywordPool struct {
 	repo repository.KeywordRepository
 
 	// 数据存储
-	data        map[int][]string // groupID -> encoded keywords
-	rawData     map[int][]string // groupID -> raw keywords
-	mu          sync.RWMutex
-	memoryBytes int64 // 内存占用追踪
+	snap        atomic.Pointer[keywordSnapshot]
+	mu          sync.Mutex   // 仅串行化写入
+	memoryBytes atomic.Int64 // 内存占用追踪（统计读取不加锁）
 
 	// 统计
-	hits   int64
-	misses int64
+	hits   atomic.Int64
+	misses atomic.Int64
 
 	// 控制
 	ctx    context.Context
@@ -42,15 +50,16 @@ type KeywordPool struct {
 // NewKeywordPool 创建新的关键词池
 func NewKeywordPool(db *sqlx.DB) *KeywordPool {
 	ctx, cancel := context.WithCancel(context.Background())
-	return &KeywordPool{
-		repo:    repository.NewKeywordRepository(db),
+	p := &KeywordPool{
+		repo:   repository.NewKeywordRepository(db),
+		ctx:    ctx,
+		cancel: cancel,
+	}
+	p.snap.Store(&keywordSnapshot{
 		data:    make(map[int][]string),
 		rawData: make(map[int][]string),
-		ctx:     ctx,
-		cancel:  cancel,
-		hits:    0,
-		misses:  0,
-	}
+	})
+	return p
 }
 
 // Start 启动关键词池
@@ -73,7 +82,7 @@ func (p *KeywordPool) Start(ctx context.Context) error {
 
 	log.Info().
 		Int("groups", len(groups)).
-		Int64("memory_bytes", p.memoryBytes).
+		Int64("memory_bytes", p.memoryBytes.Load()).
 		Msg("Keyword pool started")
 
 	return nil
@@ -89,37 +98,28 @@ func (p *KeywordPool) Stop() error {
 
 // Pop 获取一个关键词(随机)
 func (p *KeywordPool) Pop(groupID int) (string, error) {
-	p.mu.RLock()
-	items := p.data[groupID]
-	if len(items) == 0 {
-		// Fallback to default group
-		items = p.data[1]
-	}
-	p.mu.RUnlock()
+	items := groupItems(p.snap.Load().data, groupID)
 
 	if len(items) == 0 {
-		p.misses++
+		p.misses.Add(1)
 		return "", ErrEmptyPool
 	}
 
-	p.hits++
+	p.hits.Add(1)
 	return items[rand.IntN(len(items))], nil
 }
 
 // GetStats 获取统计信息
 func (p *KeywordPool) GetStats(groupID int) PoolStats {
-	p.mu.RLock()
-	items := p.data[groupID]
-	count := len(items)
-	p.mu.RUnlock()
+	count := len(p.snap.Load().data[groupID])
 
 	return PoolStats{
 		Current:     count,
 		Capacity:    count,
 		GroupID:     groupID,
-		CacheHits:   p.hits,
-		CacheMisses: p.misses,
-		MemoryBytes: p.memoryBytes,
+		CacheHits:   p.hits.Load(),
+		CacheMisses: p.misses.Load(),
+		MemoryBytes: p.memoryBytes.Load(),
 	}
 }
 
@@ -195,22 +195,19 @@ func (p *KeywordPool) loadGroup(ctx context.Context, groupID int) error {
 		rawCopy[i] = kw.Keyword
 	}
 
-	// Pre-encode keywords
-	encoded := make([]string, len(keywords))
-	for i, kw := range keywords {
-		encoded[i] = encodeText(kw.Keyword)
-	}
+	// Pre-encode keywords（批量编码，共享一块底层内存）
+	encoded := encodeTexts(rawCopy)
 
 	p.mu.Lock()
+	old := p.snap.Load()
 	// 计算旧数据内存
-	oldMem := SliceMemorySize(p.data[groupID]) + SliceMemorySize(p.rawData[groupID])
+	oldMem := SliceMemorySize(old.data[groupID]) + SliceMemorySize(old.rawData[groupID])
 	// 更新数据
-	p.data[groupID] = encoded
-	p.rawData[groupID] = rawCopy
+	p.storeGroup(old, groupID, encoded, rawCopy)
 	// 计算新数据内存
 	newMem := SliceMemorySize(encoded) + SliceMemorySize(rawCopy)
 	// 更新内存计数
-	p.memoryBytes += newMem - oldMem
+	p.memoryBytes.Add(newMem - oldMem)
 	p.mu.Unlock()
 
 	log.Info().
@@ -224,55 +221,58 @@ func (p *KeywordPool) loadGroup(ctx context.Context, groupID int) error {
 
 // GetRandomKeywords 返回随机关键词(已编码)
 func (p *KeywordPool) GetRandomKeywords(groupID int, count int) []string {
-	p.mu.RLock()
-	items := p.data[groupID]
-	if len(items) == 0 {
-		items = p.data[1] // fallback to default group
-	}
-	p.mu.RUnlock()
+	items := groupItems(p.snap.Load().data, groupID)
 
 	return getRandomItems(items, count)
 }
 
+// GetRandomKeywordsBatch 从一次原子读取的快照中取出 n 组随机编码关键词，每组 count 个（组内不重复），全程不加锁
+// 结果平铺为长度 n*count 的切片，第 i 组为 [i*count, (i+1)*count)；关键词不足 count 个时返回 nil
+func (p *KeywordPool) GetRandomKeywordsBatch(groupID int, count, n int) []string {
+	items := groupItems(p.snap.Load().data, groupID)
+
+	if count <= 0 || n <= 0 || len(items) < count {
+		return nil
+	}
+
+	result := make([]string, 0, count*n)
+	for i := 0; i < n; i++ {
+		result = appendRandomItems(result, items, count)
+	}
+	return result
+}
+
 // GetRawKeywords 返回原始关键词(未编码)
 func (p *KeywordPool) GetRawKeywords(groupID int, count int) []string {
-	p.mu.RLock()
-	items := p.rawData[groupID]
-	if len(items) == 0 {
-		items = p.rawData[1]
-	}
-	p.mu.RUnlock()
+	items := groupItems(p.snap.Load().rawData, groupID)
 
 	return getRandomItems(items, count)
 }
 
 // AppendKeywords 追加关键词到内存(新增时调用)
-func (p *KeywordPool) AppendKeywords(groupID int, keywords []string) {
+// 返回编码后的关键词，供调用方复用，避免重复编码
+func (p *KeywordPool) AppendKeywords(groupID int, keywords []string) []string {
 	if len(keywords) == 0 {
-		return
-	}
-
-	p.mu.Lock()
-	defer p.mu.Unlock()
-
-	if p.data[groupID] == nil {
-		p.data[groupID] = []string{}
-		p.rawData[groupID] = []string{}
+		return nil
 	}
 
-	// 追加原始关键词
-	p.rawData[groupID] = append(p.rawData[groupID], keywords...)
-
-	// 追加编码后的关键词并计算内存增量
+	// 编码和内存计算在锁外完成，写锁只覆盖一次合并，避免阻塞 Pop 读路径
+	encoded := encodeTexts(keywords)
 	var addedMem int64
-	for _, kw := range keywords {
-		encoded := encodeText(kw)
-		p.data[groupID] = append(p.data[groupID], encoded)
-		addedMem += StringMemorySize(kw) + StringMemorySize(encoded)
+	for i, kw := range keywords {
+		addedMem += StringMemorySize(kw) + StringMemorySize(encoded[i])
 	}
-	p.memoryBytes += addedMem
+
+	p.mu.Lock()
+	old := p.snap.Load()
+	p.storeGroup(old, groupID,
+		append(old.data[groupID], encoded...),
+		append(old.rawData[groupID], keywords...))
+	p.memoryBytes.Add(addedMem)
+	p.mu.Unlock()
 
 	log.Debug().Int("group_id", groupID).Int("added", len(keywords)).Msg("Keywords appended to pool")
+	return encoded
 }
 
 // ReloadGroup 重载指定分组的关键词缓存(删除时调用)
@@ -282,11 +282,8 @@ func (p *KeywordPool) ReloadGroup(ctx context.Context, groupID int) error {
 
 // GetTotalCount 获取所有关键词总数
 func (p *KeywordPool) GetTotalCount() int {
-	p.mu.RLock()
-	defer p.mu.RUnlock()
-
 	total := 0
-	for _, items := range p.data {
+	for _, items := range p.snap.Load().data {
 		total += len(items)
 	}
 	return total
@@ -294,19 +291,14 @@ func (p *KeywordPool) GetTotalCount() int {
 
 // GetGroupCount 获取指定分组的关键词数量
 func (p *KeywordPool) GetGroupCount(groupID int) int {
-	p.mu.RLock()
-	defer p.mu.RUnlock()
-
-	return len(p.data[groupID])
+	return len(p.snap.Load().data[groupID])
 }
 
 // GetAllGroups 获取所有分组信息
 func (p *KeywordPool) GetAllGroups() map[int]int {
-	p.mu.RLock()
-	defer p.mu.RUnlock()
-
-	groups := make(map[int]int)
-	for gid, items := range p.data {
+	data := p.snap.Load().data
+	groups := make(map[int]int, len(data))
+	for gid, items := range data {
 		groups[gid] = len(items)
 	}
 	return groups
@@ -314,60 +306,60 @@ func (p *KeywordPool) GetAllGroups() map[int]int {
 
 // GetKeywords 返回指定分组的所有编码关键词
 func (p *KeywordPool) GetKeywords(groupID int) []string {
-	p.mu.RLock()
-	items := p.data[groupID]
-	if len(items) == 0 {
-		items = p.data[1] // fallback to default group
-	}
+	items := groupItems(p.snap.Load().data, groupID)
 	// 复制避免外部修改
 	result := make([]string, len(items))
 	copy(result, items)
-	p.mu.RUnlock()
 	return result
 }
 
 // GetAllRawKeywords 返回指定分组的所有原始关键词
 func (p *KeywordPool) GetAllRawKeywords(groupID int) []string {
-	p.mu.RLock()
-	items := p.rawData[groupID]
-	if len(items) == 0 {
-		items = p.rawData[1] // fallback to default group
-	}
+	items := groupItems(p.snap.Load().rawData, groupID)
 	// 复制避免外部修改
 	result := make([]string, len(items))
 	copy(result, items)
-	p.mu.RUnlock()
 	return result
 }
 
 // GetRandomRawKeyword 返回指定分组的一个随机原始关键词（零分配）
 func (p *KeywordPool) GetRandomRawKeyword(groupID int) string {
-	p.mu.RLock()
-	items := p.rawData[groupID]
-	if len(items) == 0 {
-		items = p.rawData[1]
-	}
+	items := groupItems(p.snap.Load().rawData, groupID)
 	if len(items) == 0 {
-		p.mu.RUnlock()
 		return ""
 	}
-	kw := items[rand.IntN(len(items))]
-	p.mu.RUnlock()
-	return kw
+	return items[rand.IntN(len(items))]
 }
 
 // HasRawKeywords 检查指定分组是否有原始关键词（零分配）
 func (p *KeywordPool) HasRawKeywords(groupID int) bool {
-	p.mu.RLock()
-	items := p.rawData[groupID]
+	return len(groupItems(p.snap.Load().rawData, groupID)) > 0
+}
+
+// storeGroup 写时复制：基于 old 替换指定分组数据并发布新快照（调用方须持有 p.mu）
+// 读者持有的旧快照不受影响；追加时即使复用旧切片的空余容量，也只写入旧切片长度之外的位置
+func (p *KeywordPool) storeGroup(old *keywordSnapshot, groupID int, encoded, raw []string) {
+	next := &keywordSnapshot{
+		data:    maps.Clone(old.data),
+		rawData: maps.Clone(old.rawData),
+	}
+	next.data[groupID] = encoded
+	next.rawData[groupID] = raw
+	p.snap.Store(next)
+}
+
+// groupItems 返回指定分组的数据，分组为空时回退到默认分组 1
+func groupItems(data map[int][]string, groupID int) []string {
+	items := data[groupID]
 	if len(items) == 0 {
-		items = p.rawData[1]
+		items = data[1]
 	}
-	has := len(items) > 0
-	p.mu.RUnlock()
-	return has
+	return items
 }
 
+// smallSampleMax 使用拒绝采样的最大样本数
+const smallSampleMax = 8
+
 // getRandomItems 从切片中随机选取指定数量的元素(Fisher-Yates 部分洗牌)
 func getRandomItems(items []string, count int) []string {
 	n := len(items)
@@ -377,10 +369,52 @@ func getRandomItems(items []string, count int) []string {
 	if count > n {
 		count = n
 	}
+	return appendRandomItems(make([]string, 0, count), items, count)
+}
 
-	swapped := make(map[int]int, count)
-	result := make([]string, count)
+// appendRandomItems 向 dst 追加 count 个不重复的随机元素（要求 0 < count <= len(items)）
+func appendRandomItems(dst, items []string, count int) []string {
+	n := len(items)
+
+	// 小样本（如标题生成取 3 个）：拒绝采样 + 线性查重，无需分配 map
+	if count <= smallSampleMax && count*2 <= n {
+		var picked [smallSampleMax]int
+		for i := 0; i < count; {
+			j := rand.IntN(n)
+			dup := false
+			for _, k := range picked[:i] {
+				if k == j {
+					dup = true
+					break
+				}
+			}
+			if dup {
+				continue
+			}
+			picked[i] = j
+			dst = append(dst, items[j])
+			i++
+		}
+		return dst
+	}
 
+	// 大样本（取数占总量 1/4 以上）：直接对下标数组做部分 Fisher-Yates，
+	// 一次连续分配的 int32 排列比按元素写 map 的稀疏置换快且省内存
+	if count*4 >= n {
+		perm := make([]int32, n)
+		for i := range perm {
+			perm[i] = int32(i)
+		}
+		for i := 0; i < count; i++ {
+			j := i + rand.IntN(n-i)
+			perm[i], perm[j] = perm[j], perm[i]
+			dst = append(dst, items[perm[i]])
+		}
+		return dst
+	}
+
+	// 中等样本：稀疏置换，只记录被交换过的下标
+	swapped := make(map[int]int, count)
 	for i := 0; i < count; i++ {
 		j := i + rand.IntN(n-i)
 		vi, oki := swapped[i]
@@ -393,7 +427,7 @@ func getRandomItems(items []string, count int) []string {
 		}
 		swapped[i] = vj
 		swapped[j] = vi
-		result[i] = items[vj]
+		dst = append(dst, items[vj])
 	}
-	return result
+	return dst
 }
@@ -3,6 +3,7 @@ package pool
 import (
 	"context"
 	"fmt"
+	"sync"
 
 	"github.com/jmoiron/sqlx"
 	"github.com/rs/zerolog/log"
@@ -29,15 +30,31 @@ func NewManager(db *sqlx.DB) *Manager {
 func (m *Manager) Start(ctx context.Context) error {
 	log.Info().Msg("Starting pool manager")
 
-	// 启动关键词池
-	if err := m.keywordPool.Start(ctx); err != nil {
-		return fmt.Errorf("start keyword pool: %w", err)
+	// 关键词池和图片池的预加载互不依赖，并发启动，
+	// 启动耗时取两者中较长的一个，而不是两者之和
+	var kwErr, imgErr error
+	var wg sync.WaitGroup
+	wg.Add(2)
+	go func() {
+		defer wg.Done()
+		kwErr = m.keywordPool.Start(ctx)
+	}()
+	go func() {
+		defer wg.Done()
+		imgErr = m.imagePool.Start(ctx)
+	}()
+	wg.Wait()
+
+	// 任一失败时清理已启动的池
+	if kwErr != nil {
+		if imgErr == nil {
+			m.imagePool.Stop()
+		}
+		return fmt.Errorf("start keyword pool: %w", kwErr)
 	}
-
-	// 启动图片池
-	if err := m.imagePool.Start(ctx); err != nil {
-		m.keywordPool.Stop() // 清理已启动的池
-		return fmt.Errorf("start image pool: %w", err)
+	if imgErr != nil {
+		m.keywordPool.Stop()
+		return fmt.Errorf("start image pool: %w", imgErr)
 	}
 
 	log.Info().Msg("Pool manager started successfully")
@@ -21,6 +21,8 @@ type UpdateTask struct {
 type BatcherConfig struct {
 	MaxBatch      int
 	FlushInterval time.Duration
+	// OnFlushed 可选：事务提交成功后按表回调已更新的 ID
+	OnFlushed func(table string, ids []int64)
 }
 
 // UpdateBatcher batches status updates to reduce database pressure
@@ -119,6 +121,12 @@ func (b *UpdateBatcher) flushLocked() {
 		Interface("tables", grouped).
 		Msg("Batch update completed")
 
+	if b.config.OnFlushed != nil {
+		for table, ids := range grouped {
+			b.config.OnFlushed(table, ids)
+		}
+	}
+
 	// Clear pending queue
 	b.pending = b.pending[:0]
 }
@@ -1,8 +1,8 @@
 package pool
 
 import (
-	"fmt"
 	"math/rand/v2"
+	"strconv"
 	"strings"
 	"unsafe"
 )
@@ -26,32 +26,94 @@ func SliceMemorySize(items []string) int64 {
 	return size
 }
 
-// encodeText 将文本中的非ASCII字符编码为HTML实体
-// 这是 HTMLEntityEncoder.EncodeText 的简化版本
-func encodeText(text string) string {
-	if text == "" {
-		return ""
+// encodeTexts 批量编码，所有结果共享同一块底层内存（单次分配），
+// 返回的每个字符串都是该内存块的子串，避免逐条分配小字符串
+func encodeTexts(texts []string) []string {
+	if len(texts) == 0 {
+		return nil
+	}
+
+	total := 0
+	for _, t := range texts {
+		total += len(t)
 	}
 
 	var sb strings.Builder
-	sb.Grow(len(text) * 2) // 预分配空间
+	sb.Grow(total * 3) // 中文 3 字节 -> 实体约 8 字节，按 3 倍预估
+	ends := make([]int, len(texts))
+	var rb RandBits
+	for i, t := range texts {
+		// 关键词池固定 50% hex，即全局编码器的默认比例
+		AppendEncoded(&sb, t, keywordHexCutoff, &rb)
+		ends[i] = sb.Len()
+	}
+
+	blob := sb.String()
+	result := make([]string, len(texts))
+	start := 0
+	for i, end := range ends {
+		result[i] = blob[start:end]
+		start = end
+	}
+	return result
+}
+
+// keywordHexCutoff 关键词编码的 hex 比例 0.5 映射到 [0, 65536]
+const keywordHexCutoff = 1 << 15
+
+// HexCutoff 将 hex 编码比例映射到 [0, 65536]，供 AppendEncoded 与 16 位随机量比较
+func HexCutoff(mixRatio float64) uint32 {
+	cutoff := mixRatio * 65536
+	if cutoff < 0 {
+		cutoff = 0
+	} else if cutoff > 65536 {
+		cutoff = 65536
+	}
+	return uint32(cutoff)
+}
+
+// RandBits 按 16 位切分的随机量来源：一次 rand.Uint64 供 4 个字符使用，
+// 替代逐字符 rand.Float64。零值即可使用，可在多段文本间连续消费
+type RandBits struct {
+	bits  uint64
+	nbits int
+}
 
-	mixRatio := 0.5 // 50% hex, 50% decimal
+// next16 返回下一个 16 位随机量
+func (rb *RandBits) next16() uint32 {
+	if rb.nbits == 0 {
+		rb.bits = rand.Uint64()
+		rb.nbits = 4
+	}
+	v := uint32(rb.bits & 0xffff)
+	rb.bits >>= 16
+	rb.nbits--
+	return v
+}
+
+// AppendEncoded 将 text 中的非ASCII字符编码为HTML实体后写入 sb，ASCII 字符原样保留
+// 每个非ASCII字符取一个 16 位随机量，小于 cutoff 时用 hex（&#x..;），否则用十进制（&#..;）。
+// 这是实体编码规则的唯一实现，HTMLEntityEncoder 与关键词池都经由这里编码；
+// 实体数字写入栈上缓冲区，不产生临时字符串
+func AppendEncoded(sb *strings.Builder, text string, cutoff uint32, rb *RandBits) {
+	var num [8]byte
 	for _, r := range text {
 		if r <= 127 {
 			// ASCII字符,保持原样
-			sb.WriteRune(r)
+			sb.WriteByte(byte(r))
+			continue
+		}
+
+		// 非ASCII字符,编码
+		if rb.next16() < cutoff {
+			// 十六进制编码: &#x数字;
+			sb.WriteString("&#x")
+			sb.Write(strconv.AppendInt(num[:0], int64(r), 16))
 		} else {
-			// 非ASCII字符,编码
-			if rand.Float64() < mixRatio {
-				// 十六进制编码: &#x数字;
-				sb.WriteString(fmt.Sprintf("&#x%x;", r))
-			} else {
-				// 十进制编码: &#数字;
-				sb.WriteString(fmt.Sprintf("&#%d;", r))
-			}
+			// 十进制编码: &#数字;
+			sb.WriteString("&#")
+			sb.Write(strconv.AppendInt(num[:0], int64(r), 10))
 		}
+		sb.WriteByte(';')
 	}
-
-	return sb.String()
 }
@@ -51,6 +51,10 @@ type PoolManager struct {
 	wg      sync.WaitGroup
 	stopped atomic.Bool
 
+	// 内容池跌破低水位时通知 refillLoop（缓冲 1，合并重复通知），ticker 仅作兜底
+	refillCh        chan struct{}
+	contentLowWater atomic.Int64 // ContentPoolSize * ContentThreshold
+
 	// 状态追踪
 	lastRefresh time.Time
 }
@@ -88,13 +92,7 @@ type PoolStatusStats struct {
 func NewPoolManager(db *sqlx.DB) *PoolManager {
 	ctx, cancel := context.WithCancel(context.Background())
 
-	// 配置批量更新器：最多 100 条记录或 5 秒刷新一次
-	batcherConfig := pool.BatcherConfig{
-		MaxBatch:      100,
-		FlushInterval: 5 * time.Second,
-	}
-
-	return &PoolManager{
+	m := &PoolManager{
 		titles:       make(map[int]*MemoryPool),
 		contents:     make(map[int]*MemoryPool),
 		poolManager:  pool.NewManager(db),
@@ -104,7 +102,37 @@ func NewPoolManager(db *sqlx.DB) *PoolManager {
 		db:           db,
 		ctx:          ctx,
 		cancel:       cancel,
-		batcher:      pool.NewUpdateBatcher(db, batcherConfig),
+		refillCh:     make(chan struct{}, 1),
+	}
+	m.setContentLowWater(m.config)
+
+	// 配置批量更新器：最多 100 条记录或 5 秒刷新一次
+	// 提交后释放已落库 ID 的去重记录，避免 loadedIDs 无限增长
+	batcherConfig := pool.BatcherConfig{
+		MaxBatch:      100,
+		FlushInterval: 5 * time.Second,
+		OnFlushed:     m.forgetFlushedIDs,
+	}
+	m.batcher = pool.NewUpdateBatcher(db, batcherConfig)
+
+	return m
+}
+
+// forgetFlushedIDs 状态更新提交后，从对应缓存池的去重集合中移除这些 ID
+func (m *PoolManager) forgetFlushedIDs(table string, ids []int64) {
+	if table != "contents" {
+		return
+	}
+
+	m.mu.RLock()
+	pools := make([]*MemoryPool, 0, len(m.contents))
+	for _, p := range m.contents {
+		pools = append(pools, p)
+	}
+	m.mu.RUnlock()
+
+	for _, p := range pools {
+		p.ForgetIDs(ids)
 	}
 }
 
@@ -116,6 +144,7 @@ func (m *PoolManager) Start(ctx context.Context) error {
 		return fmt.Errorf("failed to load pool config: %w", err)
 	}
 	m.config = config
+	m.setContentLowWater(config)
 
 	// Discover and initialize pools for all groups (titles/contents)
 	groupIDs, err := m.discoverGroups(ctx)
@@ -239,20 +268,28 @@ func (m *PoolManager) getOrCreatePool(poolType string, groupID int) *MemoryPool
 }
 
 // Pop retrieves an item from the pool
+// 按字符串类型分发，仅供通用调用方使用；热路径请直接调用 PopTitle / PopContent
 func (m *PoolManager) Pop(poolType string, groupID int) (string, error) {
-	// titles 使用 TitleGenerator
 	if poolType == "titles" {
-		if m.titleGenerator == nil {
-			return "", ErrCachePoolEmpty
-		}
-		return m.titleGenerator.Pop(groupID)
+		return m.PopTitle(groupID)
 	}
-
 	if err := validatePoolType(poolType); err != nil {
 		return "", err
 	}
+	return m.PopContent(groupID)
+}
 
-	memPool := m.getOrCreatePool(poolType, groupID)
+// PopTitle 从标题生成器取一个标题（无类型字符串比较与白名单校验）
+func (m *PoolManager) PopTitle(groupID int) (string, error) {
+	if m.titleGenerator == nil {
+		return "", ErrCachePoolEmpty
+	}
+	return m.titleGenerator.Pop(groupID)
+}
+
+// PopContent 从正文内存池取一条正文（直接访问 contents 池，无类型字符串分发）
+func (m *PoolManager) PopContent(groupID int) (string, error) {
+	memPool := m.getOrCreatePool("contents", groupID)
 	item, ok := memPool.Pop()
 	if !ok {
 		// Try to refill and pop again
@@ -263,15 +300,24 @@ func (m *PoolManager) Pop(poolType string, groupID int) (string, error) {
 		}
 	}
 
+	// 跌破低水位时立即唤醒 refillLoop，而不是等下一次 ticker
+	if int64(memPool.Len()) < m.contentLowWater.Load() && !memPool.IsExhausted() {
+		select {
+		case m.refillCh <- struct{}{}:
+		default:
+		}
+	}
+
 	// Async batch update status (never drops messages)
 	if !m.stopped.Load() && m.batcher != nil {
-		m.batcher.Add(pool.UpdateTask{Table: poolType, ID: item.ID})
+		m.batcher.Add(pool.UpdateTask{Table: "contents", ID: item.ID})
 	}
 
 	return item.Text, nil
 }
 
 // refillLoop runs the background refill check
+// 低水位通知立即触发补充，ticker 作为兜底检查
 func (m *PoolManager) refillLoop() {
 	defer m.wg.Done()
 
@@ -280,6 +326,8 @@ func (m *PoolManager) refillLoop() {
 
 	for {
 		select {
+		case <-m.refillCh:
+			m.checkAndRefillAll()
 		case <-ticker.C:
 			m.checkAndRefillAll()
 		case <-m.ctx.Done():
@@ -288,6 +336,11 @@ func (m *PoolManager) refillLoop() {
 	}
 }
 
+// setContentLowWater 根据配置更新内容池低水位（Pop 无锁读取）
+func (m *PoolManager) setContentLowWater(config *CachePoolConfig) {
+	m.contentLowWater.Store(int64(float64(config.ContentPoolSize) * config.ContentThreshold))
+}
+
 // checkAndRefillAll checks and refills all content pools
 func (m *PoolManager) checkAndRefillAll() {
 	m.mu.RLock()
@@ -333,6 +386,10 @@ func (m *PoolManager) refillPool(memPool *MemoryPool) {
 		LIMIT ?
 	`, column, poolType)
 
+	// 标记补充开始：在本次结果 Push 完成前，提交的消费记录不会从去重集合中删除
+	seq := memPool.BeginRefill()
+	defer memPool.EndRefill(seq)
+
 	var items []PoolItem
 	err := m.db.SelectContext(m.ctx, &items, query, groupID, need)
 	if err != nil {
@@ -375,6 +432,7 @@ func (m *PoolManager) Reload(ctx context.Context) error {
 	m.mu.Lock()
 	oldConfig := m.config
 	m.config = config
+	m.setContentLowWater(config)
 
 	// Resize content pools if needed
 	if config.ContentPoolSize != oldConfig.ContentPoolSize {
@@ -475,16 +533,22 @@ func (m *PoolManager) GetRandomKeywords(groupID int, count int) []string {
 	return m.poolManager.GetKeywordPool().GetRandomKeywords(groupID, count)
 }
 
+// GetRandomKeywordsBatch returns n groups of count random encoded keywords, flattened
+// 兼容层: 代理到 pool.KeywordPool
+func (m *PoolManager) GetRandomKeywordsBatch(groupID int, count, n int) []string {
+	return m.poolManager.GetKeywordPool().GetRandomKeywordsBatch(groupID, count, n)
+}
+
 // GetRawKeywords returns raw (not encoded) keywords
 // 兼容层: 代理到 pool.KeywordPool
 func (m *PoolManager) GetRawKeywords(groupID int, count int) []string {
 	return m.poolManager.GetKeywordPool().GetRawKeywords(groupID, count)
 }
 
-// AppendKeywords 追加关键词到内存（新增时调用）
+// AppendKeywords 追加关键词到内存（新增时调用），返回编码后的关键词
 // 兼容层: 代理到 pool.KeywordPool
-func (m *PoolManager) AppendKeywords(groupID int, keywords []string) {
-	m.poolManager.GetKeywordPool().AppendKeywords(groupID, keywords)
+func (m *PoolManager) AppendKeywords(groupID int, keywords []string) []string {
+	return m.poolManager.GetKeywordPool().AppendKeywords(groupID, keywords)
 }
 
 // ReloadKeywordGroup 重载指定分组的关键词缓存（删除时调用）
@@ -596,6 +660,16 @@ func (m *PoolManager) GetRandomEmoji() string {
 	return m.emojiManager.GetRandom()
 }
 
+// GetRandomEmojiPair returns two random emojis picked from distinct positions
+func (m *PoolManager) GetRandomEmojiPair() (string, string) {
+	return m.emojiManager.GetRandomPair()
+}
+
+// GetRandomEmojiPairs returns n pairs of distinct random emojis, flattened
+func (m *PoolManager) GetRandomEmojiPairs(n int) []string {
+	return m.emojiManager.GetRandomPairs(n)
+}
+
 // GetRandomEmojiExclude returns a random emoji not in the exclude set
 func (m *PoolManager) GetRandomEmojiExclude(exclude map[string]bool) string {
 	return m.emojiManager.GetRandomExclude(exclude)
@@ -36,7 +36,7 @@ const (
 	AvgClsSize          = 20
 	AvgURLSize          = 100
 	AvgKeywordEmojiSize = 60
-	AvgNumberSize       = 8
+	AvgNumberSize       = 4 // NumberPool 以 int32 存储
 )
 
 // CalculatePoolSizes 根据预设、缓冲秒数和模板统计计算池大小
@@ -0,0 +1,243 @@
+package core
+
+import (
+	"context"
+	"database/sql"
+	"encoding/json"
+	"errors"
+	"math/rand/v2"
+	"strconv"
+	"time"
+
+	"github.com/redis/go-redis/v9"
+	"github.com/rs/zerolog/log"
+)
+
+// scheduleEventChannel 定时任务变更通知频道
+const scheduleEventChannel = "scheduler:events"
+
+// scheduleVersionKey 定时任务版本号，每次变更 INCR
+// Pub/Sub 不保证送达（断线期间的消息会丢失），监听器据此轮询兜底
+const scheduleVersionKey = "scheduler:version"
+
+// 版本号轮询间隔：版本未变化时逐次翻倍，发生变化后恢复最小间隔
+const (
+	scheduleVersionMinInterval = 10 * time.Second
+	scheduleVersionMaxInterval = 5 * time.Minute
+)
+
+// 定时任务变更类型
+const (
+	scheduleEventUpsert    = "upsert"     // 任务新增/修改/启用/禁用，按数据库最新状态重新调度
+	scheduleEventDelete    = "delete"     // 任务删除
+	scheduleEventReloadAll = "reload_all" // 全量重载
+)
+
+// scheduleEvent 定时任务变更消息
+type scheduleEvent struct {
+	Op      string `json:"op"`
+	TaskID  int64  `json:"task_id,omitempty"`
+	Origin  string `json:"origin"`  // 发布者实例 ID，实例忽略自己发出的消息
+	Version int64  `json:"version"` // 本次变更后的版本号
+}
+
+// newSchedulerInstanceID 生成调度器实例 ID
+func newSchedulerInstanceID() string {
+	return strconv.FormatUint(rand.Uint64(), 36)
+}
+
+// SetRedis 设置 Redis 客户端，任务变更后向其他实例广播
+func (s *Scheduler) SetRedis(rdb *redis.Client) {
+	s.mu.Lock()
+	s.redis = rdb
+	s.mu.Unlock()
+}
+
+// publishEvent 广播任务变更（未配置 Redis 时为单实例模式，直接跳过）
+func (s *Scheduler) publishEvent(op string, taskID int64) {
+	s.mu.RLock()
+	rdb := s.redis
+	s.mu.RUnlock()
+	if rdb == nil {
+		return
+	}
+
+	ctx, cancel := context.WithTimeout(context.Background(), 3*time.Second)
+	defer cancel()
+
+	version, err := rdb.Incr(ctx, scheduleVersionKey).Result()
+	if err != nil {
+		log.Warn().Err(err).Str("op", op).Int64("task_id", taskID).Msg("Failed to bump schedule version")
+	} else {
+		s.advanceVersion(version)
+	}
+
+	payload, _ := json.Marshal(scheduleEvent{Op: op, TaskID: taskID, Origin: s.instanceID, Version: version})
+	if err := rdb.Publish(ctx, scheduleEventChannel, payload).Err(); err != nil {
+		log.Warn().Err(err).Str("op", op).Int64("task_id", taskID).Msg("Failed to publish schedule event")
+	}
+}
+
+// advanceVersion 版本号恰好是已同步版本的下一个时才前进
+// 中间有遗漏的变更则保持不动，交由版本号轮询触发全量重载
+func (s *Scheduler) advanceVersion(version int64) {
+	s.version.CompareAndSwap(version-1, version)
+}
+
+// applyEvent 在本实例应用其他实例发出的任务变更
+func (s *Scheduler) applyEvent(ctx context.Context, ev scheduleEvent) error {
+	switch ev.Op {
+	case scheduleEventUpsert:
+		var task ScheduledTask
+		query := `SELECT ` + scheduleTaskColumns + ` FROM scheduled_tasks WHERE id = ?`
+		err := s.db.GetContext(ctx, &task, query, ev.TaskID)
+		if err != nil && !errors.Is(err, sql.ErrNoRows) {
+			// 查询失败不能当作已删除：返回错误，版本号不前进，由版本号轮询全量重载修复
+			return err
+		}
+		if err != nil || !task.Enabled {
+			// 已删除或已禁用
+			s.unscheduleTask(ev.TaskID)
+			return nil
+		}
+		s.mu.Lock()
+		_, err = s.addTaskLocked(&task)
+		s.mu.Unlock()
+		return err
+	case scheduleEventDelete:
+		s.unscheduleTask(ev.TaskID)
+		return nil
+	case scheduleEventReloadAll:
+		return s.reloadTasks(ctx)
+	default:
+		log.Debug().Str("op", ev.Op).Msg("Ignoring unknown schedule event")
+		return nil
+	}
+}
+
+// ScheduleReloader 定时任务变更监听器
+// 多实例部署时，任一实例修改任务后通过 Redis 通知其余实例同步调度，无需轮询数据库
+type ScheduleReloader struct {
+	redis     *redis.Client
+	scheduler *Scheduler
+	ctx       context.Context
+	cancel    context.CancelFunc
+}
+
+// NewScheduleReloader 创建定时任务变更监听器
+func NewScheduleReloader(rdb *redis.Client, scheduler *Scheduler) *ScheduleReloader {
+	ctx, cancel := context.WithCancel(context.Background())
+	return &ScheduleReloader{
+		redis:     rdb,
+		scheduler: scheduler,
+		ctx:       ctx,
+		cancel:    cancel,
+	}
+}
+
+// Start 启动监听
+func (r *ScheduleReloader) Start() {
+	// 以当前版本号为基线，调度器启动时已全量加载过任务
+	if version, err := r.currentVersion(); err == nil {
+		r.scheduler.version.Store(version)
+	}
+
+	go r.listen()
+	go r.pollVersion()
+	log.Info().Str("channel", scheduleEventChannel).Msg("Schedule reloader started")
+}
+
+// Stop 停止监听
+func (r *ScheduleReloader) Stop() {
+	r.cancel()
+	log.Info().Msg("Schedule reloader stopped")
+}
+
+// listen 监听 Redis 消息
+func (r *ScheduleReloader) listen() {
+	pubsub := r.redis.Subscribe(r.ctx, scheduleEventChannel)
+	defer pubsub.Close()
+
+	ch := pubsub.Channel()
+	for {
+		select {
+		case <-r.ctx.Done():
+			return
+		case msg := <-ch:
+			if msg == nil {
+				// Channel closed, stop listening
+				return
+			}
+			r.handleMessage(msg.Payload)
+		}
+	}
+}
+
+// handleMessage 处理消息
+func (r *ScheduleReloader) handleMessage(payload string) {
+	var ev scheduleEvent
+	if err := json.Unmarshal([]byte(payload), &ev); err != nil {
+		log.Error().Err(err).Msg("Failed to parse schedule event")
+		return
+	}
+	if ev.Origin == r.scheduler.instanceID {
+		return
+	}
+
+	ctx, cancel := context.WithTimeout(r.ctx, 30*time.Second)
+	defer cancel()
+	if err := r.scheduler.applyEvent(ctx, ev); err != nil {
+		log.Error().Err(err).Str("op", ev.Op).Int64("task_id", ev.TaskID).Msg("Failed to apply schedule event")
+		return
+	}
+	r.scheduler.advanceVersion(ev.Version)
+
+	log.Info().Str("op", ev.Op).Int64("task_id", ev.TaskID).Msg("Schedule event applied")
+}
+
+// currentVersion 读取 Redis 中的任务版本号（不存在视为 0）
+func (r *ScheduleReloader) currentVersion() (int64, error) {
+	ctx, cancel := context.WithTimeout(r.ctx, 3*time.Second)
+	defer cancel()
+	version, err := r.redis.Get(ctx, scheduleVersionKey).Int64()
+	if err == redis.Nil {
+		return 0, nil
+	}
+	return version, err
+}
+
+// pollVersion 轮询版本号兜底丢失的消息
+// 版本号与已同步版本一致时只有一次 GET，且间隔指数退避；不一致时才全量重载
+func (r *ScheduleReloader) pollVersion() {
+	interval := scheduleVersionMinInterval
+	timer := time.NewTimer(interval)
+	defer timer.Stop()
+
+	for {
+		select {
+		case <-r.ctx.Done():
+			return
+		case <-timer.C:
+		}
+
+		version, err := r.currentVersion()
+		switch {
+		case err != nil:
+			log.Warn().Err(err).Msg("Failed to read schedule version")
+		case version == r.scheduler.version.Load():
+			interval = min(interval*2, scheduleVersionMaxInterval)
+		default:
+			ctx, cancel := context.WithTimeout(r.ctx, 30*time.Second)
+			err := r.scheduler.reloadTasks(ctx)
+			cancel()
+			if err != nil {
+				log.Error().Err(err).Msg("Failed to reload tasks after missed schedule events")
+			} else {
+				r.scheduler.version.Store(version)
+				log.Info().Int64("version", version).Msg("Tasks reloaded after missed schedule events")
+			}
+			interval = scheduleVersionMinInterval
+		}
+		timer.Reset(interval)
+	}
+}
@@ -5,6 +5,7 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
+	"math/bits"
 	"strconv"
 	"strings"
 
@@ -24,13 +25,7 @@ type ScheduleConfig struct {
 // SyncSpiderSchedule 同步爬虫项目的定时配置到 scheduled_tasks 表
 func SyncSpiderSchedule(ctx context.Context, db *sqlx.DB, scheduler *Scheduler, projectID int, projectName string, scheduleJSON *string, enabled int) error {
 	// 查找已存在的任务
-	var existingTaskID int64
-	err := db.GetContext(ctx, &existingTaskID,
-		`SELECT id FROM scheduled_tasks
-		 WHERE task_type = 'run_spider'
-		 AND JSON_UNQUOTE(JSON_EXTRACT(params, '$.project_id')) = ?`,
-		strconv.Itoa(projectID))
-
+	existingTaskID, err := findSpiderTaskID(ctx, db, projectID)
 	taskExists := err == nil && existingTaskID > 0
 
 	// 无配置或类型为 none，删除已有任务
@@ -92,20 +87,20 @@ func ScheduleJSONToCron(config ScheduleConfig) (string, error) {
 		if config.Interval <= 0 {
 			return "", fmt.Errorf("invalid interval: %d", config.Interval)
 		}
-		return fmt.Sprintf("0 */%d * * * *", config.Interval), nil
+		return cronSpec("*/"+strconv.Itoa(config.Interval), "*", "*", "*"), nil
 
 	case "interval_hours":
 		if config.Interval <= 0 {
 			return "", fmt.Errorf("invalid interval: %d", config.Interval)
 		}
-		return fmt.Sprintf("0 0 */%d * * *", config.Interval), nil
+		return cronSpec("0", "*/"+strconv.Itoa(config.Interval), "*", "*"), nil
 
 	case "daily":
 		hour, minute, err := parseTime(config.Time)
 		if err != nil {
 			return "", err
 		}
-		return fmt.Sprintf("0 %d %d * * *", minute, hour), nil
+		return cronSpec(strconv.Itoa(minute), strconv.Itoa(hour), "*", "*"), nil
 
 	case "weekly":
 		if len(config.Days) == 0 {
@@ -115,8 +110,11 @@ func ScheduleJSONToCron(config ScheduleConfig) (string, error) {
 		if err != nil {
 			return "", err
 		}
-		days := intsToString(config.Days)
-		return fmt.Sprintf("0 %d %d * * %s", minute, hour, days), nil
+		days, err := bitmaskList(config.Days, 0, 6)
+		if err != nil {
+			return "", err
+		}
+		return cronSpec(strconv.Itoa(minute), strconv.Itoa(hour), "*", days), nil
 
 	case "monthly":
 		if len(config.Dates) == 0 {
@@ -126,55 +124,100 @@ func ScheduleJSONToCron(config ScheduleConfig) (string, error) {
 		if err != nil {
 			return "", err
 		}
-		dates := intsToString(config.Dates)
-		return fmt.Sprintf("0 %d %d %s * *", minute, hour, dates), nil
+		dates, err := bitmaskList(config.Dates, 1, 31)
+		if err != nil {
+			return "", err
+		}
+		return cronSpec(strconv.Itoa(minute), strconv.Itoa(hour), dates, "*"), nil
 
 	default:
 		return "", fmt.Errorf("unknown schedule type: %s", config.Type)
 	}
 }
 
+// cronSpec 拼接 Cron 表达式（秒固定为 0，月固定为 *）
+// 直接字符串拼接只分配一次，不经过 fmt 的反射格式化
+func cronSpec(minute, hour, dom, dow string) string {
+	return "0 " + minute + " " + hour + " " + dom + " * " + dow
+}
+
 // parseTime 解析 HH:mm 格式时间
 func parseTime(timeStr string) (hour, minute int, err error) {
 	if timeStr == "" {
 		return 0, 0, fmt.Errorf("time is empty")
 	}
-	parts := strings.Split(timeStr, ":")
-	if len(parts) != 2 {
+	// strings.Cut 直接切出两段子串，不分配 Split 的切片
+	h, m, ok := strings.Cut(timeStr, ":")
+	if !ok || strings.Contains(m, ":") {
 		return 0, 0, fmt.Errorf("invalid time format: %s", timeStr)
 	}
-	hour, err = strconv.Atoi(parts[0])
+	hour, err = strconv.Atoi(h)
 	if err != nil {
 		return 0, 0, err
 	}
-	minute, err = strconv.Atoi(parts[1])
+	minute, err = strconv.Atoi(m)
 	if err != nil {
 		return 0, 0, err
 	}
 	return hour, minute, nil
 }
 
-// intsToString 将整数数组转换为逗号分隔的字符串
-func intsToString(nums []int) string {
-	strs := make([]string, len(nums))
-	for i, n := range nums {
-		strs[i] = strconv.Itoa(n)
+// bitmaskList 将 [lo, hi] 内的整数列表规范化为升序、去重的逗号分隔字符串
+// 保存时即规范化周几/日期列表，写入 scheduled_tasks 的 cron_expr 与勾选顺序无关，
+// 加载和触发时无需再处理；相同计划得到相同表达式，也能命中 parseCronSpec 的解析缓存。
+// 取值最多 64 个，用一个位图完成去重和排序，只有结果字符串一次分配
+func bitmaskList(nums []int, lo, hi int) (string, error) {
+	var mask uint64
+	for _, n := range nums {
+		if n < lo || n > hi {
+			return "", fmt.Errorf("value %d out of range [%d, %d]", n, lo, hi)
+		}
+		mask |= 1 << uint(n)
 	}
-	return strings.Join(strs, ",")
+
+	var buf [96]byte // 31 个日期最长 "1,2,...,31" 为 83 字节
+	out := buf[:0]
+	for mask != 0 {
+		if len(out) > 0 {
+			out = append(out, ',')
+		}
+		out = strconv.AppendInt(out, int64(bits.TrailingZeros64(mask)), 10)
+		mask &= mask - 1 // 清除最低位
+	}
+	return string(out), nil
+}
+
+// SetSpiderScheduleEnabled 仅切换爬虫项目定时任务的启用状态
+// 定时配置未变化时无需重新解析 JSON、转换 Cron 和整行 UPDATE；返回 false 表示任务不存在，需走 SyncSpiderSchedule
+func SetSpiderScheduleEnabled(ctx context.Context, db *sqlx.DB, scheduler *Scheduler, projectID int, enabled bool) (bool, error) {
+	taskID, err := findSpiderTaskID(ctx, db, projectID)
+	if err != nil || taskID == 0 {
+		return false, nil
+	}
+
+	if enabled {
+		return true, scheduler.EnableTask(ctx, taskID)
+	}
+	return true, scheduler.DisableTask(ctx, taskID)
 }
 
 // DeleteSpiderSchedule 删除爬虫项目的定时任务
 func DeleteSpiderSchedule(ctx context.Context, db *sqlx.DB, scheduler *Scheduler, projectID int) error {
+	taskID, err := findSpiderTaskID(ctx, db, projectID)
+	if err != nil {
+		return nil // 不存在则无需删除
+	}
+
+	return scheduler.DeleteTask(ctx, taskID)
+}
+
+// findSpiderTaskID 查找爬虫项目对应的定时任务 ID
+func findSpiderTaskID(ctx context.Context, db *sqlx.DB, projectID int) (int64, error) {
 	var taskID int64
 	err := db.GetContext(ctx, &taskID,
 		`SELECT id FROM scheduled_tasks
 		 WHERE task_type = 'run_spider'
 		 AND JSON_UNQUOTE(JSON_EXTRACT(params, '$.project_id')) = ?`,
 		strconv.Itoa(projectID))
-
-	if err != nil {
-		return nil // 不存在则无需删除
-	}
-
-	return scheduler.DeleteTask(ctx, taskID)
+	return taskID, err
 }
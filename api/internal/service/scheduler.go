@@ -4,11 +4,15 @@ package core
 import (
 	"context"
 	"database/sql"
+	"errors"
 	"fmt"
+	"strings"
 	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/jmoiron/sqlx"
+	"github.com/redis/go-redis/v9"
 	"github.com/robfig/cron/v3"
 	"github.com/rs/zerolog/log"
 )
@@ -21,18 +25,51 @@ type Scheduler struct {
 	tasks    map[int64]*ScheduledTask
 	mu       sync.RWMutex
 	running  bool
+
+	// 执行中的任务 ID（task_id -> struct{}），跨 cron 实例重建保持，
+	// 同一任务上一次执行尚未结束时直接跳过本次触发（相当于 max_instances=1 + coalesce）
+	inFlight sync.Map
+
+	// 每次执行都会用到的任务日志语句，Start 时预编译（失败则回退到 db.Exec）
+	logInsertStmt atomic.Pointer[sqlx.Stmt]
+	logUpdateStmt atomic.Pointer[sqlx.Stmt]
+
+	// 多实例同步：任务变更后经 Redis 广播，其余实例由 ScheduleReloader 应用
+	redis      *redis.Client
+	instanceID string
+	version    atomic.Int64 // 已同步到的任务版本号（scheduleVersionKey）
+
+	// 待写回的执行时间，延迟合并为一条批量 UPDATE
+	runTimesMu sync.Mutex
+	runTimes   map[int64]runTimeUpdate
+}
+
+// runTimeUpdate 任务执行时间的待写回值（零值表示该列不更新）
+type runTimeUpdate struct {
+	lastRun time.Time
+	nextRun time.Time
 }
 
 // NewScheduler 创建调度器
 func NewScheduler(db *sqlx.DB) *Scheduler {
 	return &Scheduler{
 		db:       db,
-		cron:     cron.New(cron.WithSeconds()), // 支持秒级调度
+		cron:     newCron(),
 		handlers: make(map[TaskType]TaskHandler),
 		tasks:    make(map[int64]*ScheduledTask),
+		runTimes: make(map[int64]runTimeUpdate),
+
+		instanceID: newSchedulerInstanceID(),
 	}
 }
 
+// newCron 创建 cron 实例
+// 同一任务的重叠触发由 Scheduler.inFlight 去重，不依赖 cron 的 SkipIfStillRunning：
+// 后者按 Job 包装实例记状态，reloadTasks 换新 cron 或 addTaskLocked 重建条目后状态随之丢失
+func newCron() *cron.Cron {
+	return cron.New(cron.WithSeconds()) // 支持秒级调度
+}
+
 // RegisterHandler 注册任务处理器
 func (s *Scheduler) RegisterHandler(handler TaskHandler) {
 	s.mu.Lock()
@@ -51,13 +88,17 @@ func (s *Scheduler) Start(ctx context.Context) error {
 	s.running = true
 	s.mu.Unlock()
 
+	s.prepareStatements(ctx)
+
 	// 加载任务
 	if err := s.loadTasks(ctx); err != nil {
 		return fmt.Errorf("load tasks: %w", err)
 	}
 
 	// 启动 cron
+	s.mu.Lock()
 	s.cron.Start()
+	s.mu.Unlock()
 	log.Info().Msg("Scheduler started")
 
 	return nil
@@ -74,43 +115,94 @@ func (s *Scheduler) Stop() {
 
 	ctx := s.cron.Stop()
 	<-ctx.Done()
+	s.flushRunTimes()
+	s.closeStatements()
 	s.running = false
 	log.Info().Msg("Scheduler stopped")
 }
 
+// scheduleTaskColumns 调度所需的任务列
+// 内存中的任务只用于触发执行，执行时间、创建/更新时间只在 GetTasks 展示时从数据库读取，
+// 加载时不再逐行扫描和解析这些时间列（全量加载额外读取 next_run_at 用于比对）
+const scheduleTaskColumns = "id, name, task_type, cron_expr, params, enabled"
+
 // loadTasks 从数据库加载任务
 func (s *Scheduler) loadTasks(ctx context.Context) error {
-	query := `SELECT id, name, task_type, cron_expr, params, enabled, last_run_at, next_run_at, created_at, updated_at
-              FROM scheduled_tasks WHERE enabled = 1`
+	tasks, err := s.queryEnabledTasks(ctx)
+	if err != nil {
+		return err
+	}
+
+	// 整批在一次加锁内加入 cron，下次执行时间最后按块批量写回，避免每个任务一次锁 + 一次 UPDATE
+	s.mu.Lock()
+	nextRuns, scheduled := s.addTasksLocked(tasks)
+	s.mu.Unlock()
+
+	s.writeRunTimes(ctx, nextRuns)
+
+	log.Info().Int("count", scheduled).Int("total", len(tasks)).Int("next_run_updated", len(nextRuns)).Msg("Tasks loaded and scheduled")
+	return nil
+}
+
+// queryEnabledTasks 查询所有启用的任务
+func (s *Scheduler) queryEnabledTasks(ctx context.Context) ([]ScheduledTask, error) {
+	query := `SELECT ` + scheduleTaskColumns + `, next_run_at FROM scheduled_tasks WHERE enabled = 1`
 
 	var tasks []ScheduledTask
 	if err := s.db.SelectContext(ctx, &tasks, query); err != nil {
-		if err == sql.ErrNoRows {
-			log.Info().Msg("No scheduled tasks found")
-			return nil
-		}
-		return fmt.Errorf("query tasks: %w", err)
+		return nil, fmt.Errorf("query tasks: %w", err)
 	}
+	return tasks, nil
+}
 
+// addTasksLocked 批量加入任务，返回需要写回的下次执行时间和成功调度的任务数（调用方需持有 s.mu 写锁）
+// 数据库中已持久化的 next_run_at 与推算结果一致时（重启前后计划未变、未错过触发）不再写回，
+// 重启时的 UPDATE 量只与变化的任务数相关，而不是全部启用任务
+func (s *Scheduler) addTasksLocked(tasks []ScheduledTask) (map[int64]runTimeUpdate, int) {
+	nextRuns := make(map[int64]runTimeUpdate)
+	scheduled := 0
 	for i := range tasks {
-		if err := s.scheduleTask(&tasks[i]); err != nil {
+		nextRun, err := s.addTaskLocked(&tasks[i])
+		if err != nil {
 			log.Error().Err(err).Int64("task_id", tasks[i].ID).Str("name", tasks[i].Name).Msg("Failed to schedule task")
 			continue
 		}
+		scheduled++
+		if stored := tasks[i].NextRunAt; stored != nil && stored.Equal(nextRun) {
+			continue
+		}
+		nextRuns[tasks[i].ID] = runTimeUpdate{nextRun: nextRun}
 	}
-
-	log.Info().Int("count", len(tasks)).Msg("Tasks loaded and scheduled")
-	return nil
+	return nextRuns, scheduled
 }
 
 // scheduleTask 调度单个任务
 func (s *Scheduler) scheduleTask(task *ScheduledTask) error {
 	s.mu.Lock()
-	defer s.mu.Unlock()
+	nextRun, err := s.addTaskLocked(task)
+	s.mu.Unlock()
+	if err != nil {
+		return err
+	}
+
+	// 更新下次执行时间（数据库写入放在锁外）
+	s.updateNextRunAt(task.ID, nextRun)
+
+	log.Info().
+		Int64("task_id", task.ID).
+		Str("name", task.Name).
+		Str("cron", task.CronExpr).
+		Time("next_run", nextRun).
+		Msg("Task scheduled")
 
+	return nil
+}
+
+// addTaskLocked 将任务加入 cron（调用方需持有 s.mu 写锁），返回下次执行时间
+func (s *Scheduler) addTaskLocked(task *ScheduledTask) (time.Time, error) {
 	// 检查处理器是否存在
 	if _, exists := s.handlers[task.TaskType]; !exists {
-		return fmt.Errorf("no handler for task type: %s", task.TaskType)
+		return time.Time{}, fmt.Errorf("no handler for task type: %s", task.TaskType)
 	}
 
 	// 如果任务已存在，先移除
@@ -121,30 +213,54 @@ func (s *Scheduler) scheduleTask(task *ScheduledTask) error {
 	// 创建任务副本
 	taskCopy := *task
 
-	// 添加 cron 任务
-	entryID, err := s.cron.AddFunc(task.CronExpr, func() {
-		s.executeTask(&taskCopy)
-	})
+	// 添加 cron 任务（表达式解析结果按字符串缓存复用）
+	schedule, err := parseCronSpec(task.CronExpr)
 	if err != nil {
-		return fmt.Errorf("add cron job: %w", err)
+		return time.Time{}, fmt.Errorf("add cron job: %w", err)
 	}
+	entryID := s.cron.Schedule(schedule, cron.FuncJob(func() {
+		s.runScheduled(&taskCopy)
+	}))
 
 	task.cronEntryID = int(entryID)
 	s.tasks[task.ID] = task
 
-	// 更新下次执行时间
-	entry := s.cron.Entry(entryID)
-	nextRun := entry.Next
-	s.updateNextRunAt(task.ID, nextRun)
+	// 直接由调度表达式推算下次执行时间（cron 未启动时 Entry.Next 尚为零值）
+	return schedule.Next(time.Now()), nil
+}
 
-	log.Info().
-		Int64("task_id", task.ID).
-		Str("name", task.Name).
-		Str("cron", task.CronExpr).
-		Time("next_run", nextRun).
-		Msg("Task scheduled")
+// cronParser 与 cron.WithSeconds() 相同的表达式解析器（秒 分 时 日 月 周）
+var cronParser = cron.NewParser(
+	cron.Second | cron.Minute | cron.Hour | cron.Dom | cron.Month | cron.Dow | cron.Descriptor,
+)
 
-	return nil
+// cronScheduleCache 表达式 -> 解析后的 cron.Schedule
+// Schedule 只读，可在多个任务间共享；大量任务使用相同表达式时只解析一次
+var cronScheduleCache sync.Map
+
+// parseCronSpec 解析 cron 表达式（带缓存）
+func parseCronSpec(spec string) (cron.Schedule, error) {
+	if cached, ok := cronScheduleCache.Load(spec); ok {
+		return cached.(cron.Schedule), nil
+	}
+	schedule, err := cronParser.Parse(spec)
+	if err != nil {
+		return nil, err
+	}
+	cronScheduleCache.Store(spec, schedule)
+	return schedule, nil
+}
+
+// runScheduled cron 触发入口：同一任务仍在执行时跳过本次触发，
+// 慢任务积压时不会再排队执行、重复写日志和查询数据库
+func (s *Scheduler) runScheduled(task *ScheduledTask) {
+	if _, busy := s.inFlight.LoadOrStore(task.ID, struct{}{}); busy {
+		log.Debug().Int64("task_id", task.ID).Str("name", task.Name).Msg("Task still running, skip trigger")
+		return
+	}
+	defer s.inFlight.Delete(task.ID)
+
+	s.executeTask(task)
 }
 
 // executeTask 执行任务
@@ -175,16 +291,14 @@ func (s *Scheduler) executeTask(task *ScheduledTask) {
 	// 更新日志
 	s.updateTaskLog(logID, result)
 
-	// 更新最后执行时间
-	s.updateLastRunAt(task.ID)
-
-	// 更新下次执行时间
+	// 最后/下次执行时间延迟合并写回：同一时刻触发的多个任务共用一条 UPDATE
+	update := runTimeUpdate{lastRun: time.Now()}
 	s.mu.RLock()
 	if t, exists := s.tasks[task.ID]; exists && t.cronEntryID != 0 {
-		entry := s.cron.Entry(cron.EntryID(t.cronEntryID))
-		s.updateNextRunAt(task.ID, entry.Next)
+		update.nextRun = s.cron.Entry(cron.EntryID(t.cronEntryID)).Next
 	}
 	s.mu.RUnlock()
+	s.queueRunTimes(task.ID, update)
 
 	logLevel := log.Info()
 	if !result.Success {
@@ -199,11 +313,48 @@ func (s *Scheduler) executeTask(task *ScheduledTask) {
 		Msg("Task execution completed")
 }
 
+// 任务日志语句
+const (
+	createTaskLogQuery = `INSERT INTO task_logs (task_id, status, started_at, created_at) VALUES (?, ?, ?, ?)`
+	updateTaskLogQuery = `UPDATE task_logs SET status = ?, message = ?, duration = ?, ended_at = ? WHERE id = ?`
+)
+
+// prepareStatements 预编译任务日志语句
+// 预编译语句在各连接上复用，省去每次带参 Exec 的 prepare/close 往返
+func (s *Scheduler) prepareStatements(ctx context.Context) {
+	if stmt, err := s.db.PreparexContext(ctx, createTaskLogQuery); err != nil {
+		log.Warn().Err(err).Msg("Failed to prepare task log insert, falling back to plain exec")
+	} else {
+		s.logInsertStmt.Store(stmt)
+	}
+	if stmt, err := s.db.PreparexContext(ctx, updateTaskLogQuery); err != nil {
+		log.Warn().Err(err).Msg("Failed to prepare task log update, falling back to plain exec")
+	} else {
+		s.logUpdateStmt.Store(stmt)
+	}
+}
+
+// closeStatements 关闭预编译语句
+func (s *Scheduler) closeStatements() {
+	for _, p := range []*atomic.Pointer[sqlx.Stmt]{&s.logInsertStmt, &s.logUpdateStmt} {
+		if stmt := p.Swap(nil); stmt != nil {
+			stmt.Close()
+		}
+	}
+}
+
+// execStmt 优先使用预编译语句执行，未预编译时回退到 db.Exec
+func (s *Scheduler) execStmt(stmt *sqlx.Stmt, query string, args ...interface{}) (sql.Result, error) {
+	if stmt != nil {
+		return stmt.Exec(args...)
+	}
+	return s.db.Exec(query, args...)
+}
+
 // createTaskLog 创建任务日志
 func (s *Scheduler) createTaskLog(taskID int64) int64 {
-	query := `INSERT INTO task_logs (task_id, status, started_at, created_at) VALUES (?, ?, ?, ?)`
 	now := time.Now()
-	result, err := s.db.Exec(query, taskID, TaskStatusRunning, now, now)
+	result, err := s.execStmt(s.logInsertStmt.Load(), createTaskLogQuery, taskID, TaskStatusRunning, now, now)
 	if err != nil {
 		log.Error().Err(err).Int64("task_id", taskID).Msg("Failed to create task log")
 		return 0
@@ -224,21 +375,11 @@ func (s *Scheduler) updateTaskLog(logID int64, result TaskResult) {
 	}
 
 	now := time.Now()
-	query := `UPDATE task_logs SET status = ?, message = ?, duration = ?, ended_at = ? WHERE id = ?`
-	if _, err := s.db.Exec(query, status, result.Message, result.Duration, now, logID); err != nil {
+	if _, err := s.execStmt(s.logUpdateStmt.Load(), updateTaskLogQuery, status, result.Message, result.Duration, now, logID); err != nil {
 		log.Error().Err(err).Int64("log_id", logID).Msg("Failed to update task log")
 	}
 }
 
-// updateLastRunAt 更新最后执行时间
-func (s *Scheduler) updateLastRunAt(taskID int64) {
-	query := `UPDATE scheduled_tasks SET last_run_at = ?, updated_at = ? WHERE id = ?`
-	now := time.Now()
-	if _, err := s.db.Exec(query, now, now, taskID); err != nil {
-		log.Error().Err(err).Int64("task_id", taskID).Msg("Failed to update last_run_at")
-	}
-}
-
 // updateNextRunAt 更新下次执行时间
 func (s *Scheduler) updateNextRunAt(taskID int64, nextRun time.Time) {
 	query := `UPDATE scheduled_tasks SET next_run_at = ?, updated_at = ? WHERE id = ?`
@@ -248,6 +389,98 @@ func (s *Scheduler) updateNextRunAt(taskID int64, nextRun time.Time) {
 	}
 }
 
+// runTimeFlushDelay 执行时间写回的合并窗口
+const runTimeFlushDelay = 50 * time.Millisecond
+
+// runTimeBatchSize 批量写回执行时间时每条语句包含的任务数
+const runTimeBatchSize = 500
+
+// queueRunTimes 记录待写回的执行时间，窗口内的多次记录合并为一次批量 UPDATE
+func (s *Scheduler) queueRunTimes(taskID int64, update runTimeUpdate) {
+	s.runTimesMu.Lock()
+	s.runTimes[taskID] = update
+	first := len(s.runTimes) == 1
+	s.runTimesMu.Unlock()
+
+	// 窗口内第一条记录负责安排一次延迟写回
+	if first {
+		time.AfterFunc(runTimeFlushDelay, s.flushRunTimes)
+	}
+}
+
+// flushRunTimes 写回所有待更新的执行时间
+func (s *Scheduler) flushRunTimes() {
+	s.runTimesMu.Lock()
+	pending := s.runTimes
+	s.runTimes = make(map[int64]runTimeUpdate)
+	s.runTimesMu.Unlock()
+
+	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
+	defer cancel()
+	s.writeRunTimes(ctx, pending)
+}
+
+// writeRunTimes 批量写回执行时间
+// 按块拼接 CASE 语句，一次往返更新多行；零值列保持原值
+func (s *Scheduler) writeRunTimes(ctx context.Context, updates map[int64]runTimeUpdate) {
+	if len(updates) == 0 {
+		return
+	}
+
+	ids := make([]int64, 0, len(updates))
+	for id := range updates {
+		ids = append(ids, id)
+	}
+
+	now := time.Now()
+	for start := 0; start < len(ids); start += runTimeBatchSize {
+		chunk := ids[start:min(start+runTimeBatchSize, len(ids))]
+
+		var sb strings.Builder
+		args := make([]interface{}, 0, len(chunk)*5+1)
+		sb.WriteString("UPDATE scheduled_tasks SET ")
+		args = appendRunTimeCase(&sb, args, "last_run_at", chunk, updates, func(u runTimeUpdate) time.Time { return u.lastRun })
+		args = appendRunTimeCase(&sb, args, "next_run_at", chunk, updates, func(u runTimeUpdate) time.Time { return u.nextRun })
+		sb.WriteString("updated_at = ? WHERE id IN (?")
+		sb.WriteString(strings.Repeat(",?", len(chunk)-1))
+		sb.WriteByte(')')
+		args = append(args, now)
+		for _, id := range chunk {
+			args = append(args, id)
+		}
+
+		if _, err := s.db.ExecContext(ctx, sb.String(), args...); err != nil {
+			log.Error().Err(err).Int("count", len(chunk)).Msg("Failed to batch update task run times")
+		}
+	}
+}
+
+// appendRunTimeCase 为一列拼接 "col = CASE id WHEN ? THEN ? ... ELSE col END, "
+// 本块内该列全为零值时不生成该列
+func appendRunTimeCase(sb *strings.Builder, args []interface{}, column string, ids []int64,
+	updates map[int64]runTimeUpdate, value func(runTimeUpdate) time.Time) []interface{} {
+	written := false
+	for _, id := range ids {
+		t := value(updates[id])
+		if t.IsZero() {
+			continue
+		}
+		if !written {
+			sb.WriteString(column)
+			sb.WriteString(" = CASE id")
+			written = true
+		}
+		sb.WriteString(" WHEN ? THEN ?")
+		args = append(args, id, t)
+	}
+	if written {
+		sb.WriteString(" ELSE ")
+		sb.WriteString(column)
+		sb.WriteString(" END, ")
+	}
+	return args
+}
+
 // TriggerTask 手动触发任务执行
 func (s *Scheduler) TriggerTask(taskID int64) error {
 	s.mu.RLock()
@@ -257,8 +490,7 @@ func (s *Scheduler) TriggerTask(taskID int64) error {
 	if !exists {
 		// 尝试从数据库加载
 		var dbTask ScheduledTask
-		query := `SELECT id, name, task_type, cron_expr, params, enabled, last_run_at, next_run_at, created_at, updated_at
-                  FROM scheduled_tasks WHERE id = ?`
+		query := `SELECT ` + scheduleTaskColumns + ` FROM scheduled_tasks WHERE id = ?`
 		if err := s.db.Get(&dbTask, query, taskID); err != nil {
 			if err == sql.ErrNoRows {
 				return fmt.Errorf("task not found: %d", taskID)
@@ -281,11 +513,11 @@ func (s *Scheduler) EnableTask(ctx context.Context, taskID int64) error {
 	if _, err := s.db.ExecContext(ctx, query, time.Now(), taskID); err != nil {
 		return fmt.Errorf("update task: %w", err)
 	}
+	s.publishEvent(scheduleEventUpsert, taskID)
 
 	// 加载并调度任务
 	var task ScheduledTask
-	selectQuery := `SELECT id, name, task_type, cron_expr, params, enabled, last_run_at, next_run_at, created_at, updated_at
-                    FROM scheduled_tasks WHERE id = ?`
+	selectQuery := `SELECT ` + scheduleTaskColumns + ` FROM scheduled_tasks WHERE id = ?`
 	if err := s.db.GetContext(ctx, &task, selectQuery, taskID); err != nil {
 		return fmt.Errorf("query task: %w", err)
 	}
@@ -300,21 +532,34 @@ func (s *Scheduler) DisableTask(ctx context.Context, taskID int64) error {
 	if _, err := s.db.ExecContext(ctx, query, time.Now(), taskID); err != nil {
 		return fmt.Errorf("update task: %w", err)
 	}
+	s.publishEvent(scheduleEventUpsert, taskID)
 
 	// 从调度器移除
-	s.mu.Lock()
-	if task, exists := s.tasks[taskID]; exists {
-		if task.cronEntryID != 0 {
-			s.cron.Remove(cron.EntryID(task.cronEntryID))
-		}
-		delete(s.tasks, taskID)
-	}
-	s.mu.Unlock()
+	s.unscheduleTask(taskID)
 
 	log.Info().Int64("task_id", taskID).Msg("Task disabled")
 	return nil
 }
 
+// ErrTaskNotFound 任务不存在
+var ErrTaskNotFound = errors.New("task not found")
+
+// GetTask 按 ID 获取单个任务
+func (s *Scheduler) GetTask(ctx context.Context, taskID int64) (*ScheduledTask, error) {
+	query := `SELECT id, name, task_type, cron_expr, params, enabled, last_run_at, next_run_at, created_at, updated_at
+              FROM scheduled_tasks WHERE id = ?`
+
+	var task ScheduledTask
+	if err := s.db.GetContext(ctx, &task, query, taskID); err != nil {
+		if errors.Is(err, sql.ErrNoRows) {
+			return nil, ErrTaskNotFound
+		}
+		return nil, fmt.Errorf("query task: %w", err)
+	}
+
+	return &task, nil
+}
+
 // GetTasks 获取所有任务
 func (s *Scheduler) GetTasks(ctx context.Context) ([]ScheduledTask, error) {
 	query := `SELECT id, name, task_type, cron_expr, params, enabled, last_run_at, next_run_at, created_at, updated_at
@@ -382,6 +627,7 @@ func (s *Scheduler) CreateTask(ctx context.Context, task *ScheduledTask) (int64,
 	task.ID = id
 	task.CreatedAt = now
 	task.UpdatedAt = now
+	s.publishEvent(scheduleEventUpsert, id)
 
 	// 如果启用则调度
 	if task.Enabled {
@@ -405,27 +651,22 @@ func (s *Scheduler) UpdateTask(ctx context.Context, task *ScheduledTask) error {
 	}
 
 	task.UpdatedAt = now
+	s.publishEvent(scheduleEventUpsert, task.ID)
 
-	// 重新调度
-	s.mu.Lock()
-	if existingTask, exists := s.tasks[task.ID]; exists && existingTask.cronEntryID != 0 {
-		s.cron.Remove(cron.EntryID(existingTask.cronEntryID))
-		delete(s.tasks, task.ID)
+	// 重新调度：启用时 addTaskLocked 在同一次加锁内替换旧条目，禁用时直接移除
+	if !task.Enabled {
+		s.unscheduleTask(task.ID)
+		return nil
 	}
-	s.mu.Unlock()
-
-	if task.Enabled {
-		if err := s.scheduleTask(task); err != nil {
-			return fmt.Errorf("reschedule task: %w", err)
-		}
+	if err := s.scheduleTask(task); err != nil {
+		return fmt.Errorf("reschedule task: %w", err)
 	}
 
 	return nil
 }
 
-// DeleteTask 删除任务
-func (s *Scheduler) DeleteTask(ctx context.Context, taskID int64) error {
-	// 从调度器移除
+// unscheduleTask 从 cron 和内存任务表中移除任务
+func (s *Scheduler) unscheduleTask(taskID int64) {
 	s.mu.Lock()
 	if task, exists := s.tasks[taskID]; exists {
 		if task.cronEntryID != 0 {
@@ -434,6 +675,12 @@ func (s *Scheduler) DeleteTask(ctx context.Context, taskID int64) error {
 		delete(s.tasks, taskID)
 	}
 	s.mu.Unlock()
+}
+
+// DeleteTask 删除任务
+func (s *Scheduler) DeleteTask(ctx context.Context, taskID int64) error {
+	// 从调度器移除
+	s.unscheduleTask(taskID)
 
 	// 删除日志
 	if _, err := s.db.ExecContext(ctx, "DELETE FROM task_logs WHERE task_id = ?", taskID); err != nil {
@@ -445,6 +692,7 @@ func (s *Scheduler) DeleteTask(ctx context.Context, taskID int64) error {
 	if _, err := s.db.ExecContext(ctx, query, taskID); err != nil {
 		return fmt.Errorf("delete task: %w", err)
 	}
+	s.publishEvent(scheduleEventDelete, taskID)
 
 	log.Info().Int64("task_id", taskID).Msg("Task deleted")
 	return nil
@@ -452,18 +700,39 @@ func (s *Scheduler) DeleteTask(ctx context.Context, taskID int64) error {
 
 // ReloadTasks 重新加载所有任务
 func (s *Scheduler) ReloadTasks(ctx context.Context) error {
-	// 清空当前任务
+	if err := s.reloadTasks(ctx); err != nil {
+		return err
+	}
+	s.publishEvent(scheduleEventReloadAll, 0)
+	return nil
+}
+
+// reloadTasks 清空并从数据库重新加载本实例的所有任务
+// 运行中的 cron 每次 Remove/Schedule 都要与其调度 goroutine 做一次 channel 往返；
+// 这里改为在未启动的新 cron 上直接追加全部条目，再整体替换旧实例
+func (s *Scheduler) reloadTasks(ctx context.Context) error {
+	tasks, err := s.queryEnabledTasks(ctx)
+	if err != nil {
+		return err
+	}
+
 	s.mu.Lock()
-	for id, task := range s.tasks {
-		if task.cronEntryID != 0 {
-			s.cron.Remove(cron.EntryID(task.cronEntryID))
-		}
-		delete(s.tasks, id)
+	old := s.cron
+	s.cron = newCron()
+	s.tasks = make(map[int64]*ScheduledTask, len(tasks))
+	nextRuns, scheduled := s.addTasksLocked(tasks)
+	if s.running {
+		s.cron.Start()
 	}
 	s.mu.Unlock()
 
-	// 重新加载
-	return s.loadTasks(ctx)
+	// 旧实例不再触发新任务，执行中的任务照常完成（其 inFlight 标记仍会挡住新实例上的重叠触发）
+	old.Stop()
+
+	s.writeRunTimes(ctx, nextRuns)
+
+	log.Info().Int("count", scheduled).Int("total", len(tasks)).Int("next_run_updated", len(nextRuns)).Msg("Tasks reloaded and scheduled")
+	return nil
 }
 
 // GetStats 获取调度器统计
@@ -482,7 +751,7 @@ func (s *Scheduler) GetStats() map[string]interface{} {
 		"running":      s.running,
 		"total_tasks":  len(s.tasks),
 		"active_tasks": activeCount,
-		"cron_entries": len(s.cron.Entries()),
+		"cron_entries": len(s.tasks), // 每个内存任务对应一个 cron 条目；Entries() 会复制并排序全部条目
 		"handlers":     len(s.handlers),
 	}
 }
@@ -2,6 +2,7 @@ package core
 
 import (
 	"context"
+	"fmt"
 	"strconv"
 	"strings"
 	"sync"
@@ -12,22 +13,64 @@ import (
 	"github.com/rs/zerolog/log"
 )
 
+// activeProjectsKey 活跃项目索引（SET），由 worker 在项目开始运行时 SADD
+const activeProjectsKey = "spider:active_projects"
+
+// statsDeltaScript 在 Redis 端原子计算分钟增量
+// KEYS[1] 为实时统计 spider:{id}:stats，KEYS[2] 为上次归档快照 spider:{id}:stats:archived；
+// 读取两者、写回新快照并返回 4 个字段的增量（负数记 0），统计为空时返回空数组。
+// 快照存 Redis 而非进程内存：服务重启后不会把累计值整体当作一分钟的增量，多实例也不会重复归档。
+// 快照是 "total,completed,failed,retried" 字符串，每分钟一次 GET/SET，不再带 4 个字段名读写 Hash；
+// 旧版本写下的 Hash 快照（GET 报 WRONGTYPE）按 Hash 读取一次，随后被 SET 覆盖为字符串。
+// 统计与快照完全相同（空闲项目）时直接返回空数组，不做增量计算也不写回快照
+var statsDeltaScript = redis.NewScript(`
+local cur = redis.call('HMGET', KEYS[1], 'total', 'completed', 'failed', 'retried')
+if not (cur[1] or cur[2] or cur[3] or cur[4]) then
+	return {}
+end
+for i = 1, 4 do
+	cur[i] = tonumber(cur[i]) or 0
+end
+local packed = redis.pcall('GET', KEYS[2])
+local current = table.concat(cur, ',')
+if packed == current then
+	return {}
+end
+local last = {}
+if type(packed) == 'string' then
+	for v in string.gmatch(packed, '[^,]+') do
+		last[#last + 1] = v
+	end
+elseif type(packed) == 'table' and packed.err then
+	last = redis.call('HMGET', KEYS[2], 'total', 'completed', 'failed', 'retried')
+end
+local delta = {}
+for i = 1, 4 do
+	local d = cur[i] - (tonumber(last[i]) or 0)
+	if d < 0 then d = 0 end
+	delta[i] = d
+end
+redis.call('SET', KEYS[2], current)
+return delta
+`)
+
 // StatsArchiver 统计归档服务
 // 定时将 Redis 中的实时统计数据归档到 MySQL，用于历史趋势图表
 type StatsArchiver struct {
 	db    *sqlx.DB
 	redis *redis.Client
 
-	mu            sync.Mutex
-	running       bool
-	stopCh        chan struct{}
-	lastMinuteRun time.Time
-	lastHourRun   time.Time
-	lastDayRun    time.Time
+	mu      sync.Mutex
+	running bool
+	stopCh  chan struct{}
+
+	// 各任务上次执行时间（Unix 秒），每个 tick 只做整数比较
+	lastMinuteRun int64
+	lastHourRun   int64
+	lastDayRun    int64
 
-	// 保存每个项目上次归档时的统计值（用于计算增量）
-	archivedMu   sync.RWMutex
-	lastArchived map[int]statsSnapshot
+	// 活跃项目索引是否已用 SCAN 结果回填（索引上线前已有的项目不在 SET 中）
+	indexBackfilled bool
 }
 
 type statsSnapshot struct {
@@ -40,10 +83,9 @@ type statsSnapshot struct {
 // NewStatsArchiver 创建统计归档服务
 func NewStatsArchiver(db *sqlx.DB, redis *redis.Client) *StatsArchiver {
 	return &StatsArchiver{
-		db:           db,
-		redis:        redis,
-		stopCh:       make(chan struct{}),
-		lastArchived: make(map[int]statsSnapshot),
+		db:     db,
+		redis:  redis,
+		stopCh: make(chan struct{}),
 	}
 }
 
@@ -96,40 +138,256 @@ func (a *StatsArchiver) Stop() {
 }
 
 func (a *StatsArchiver) runTasks(ctx context.Context, now time.Time) {
+	ts := now.Unix()
+	hour, minute, _ := now.Clock()
+	minuteDue := ts-a.lastMinuteRun >= 60
+	hourDue := minute == 0 && ts-a.lastHourRun >= 3600
+	dayDue := hour == 0 && minute < 10 && ts-a.lastDayRun >= 86400
+
+	// 各任务读写的行互不重叠，并发执行后整轮耗时取最长一项而不是总和；
+	// 天聚合读取小时聚合的结果，两者在同一个 goroutine 中保持先后顺序
+	var wg sync.WaitGroup
+	spawn := func(fn func()) {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			fn()
+		}()
+	}
+
 	// 每分钟：归档分钟统计
-	if now.Sub(a.lastMinuteRun) >= time.Minute {
-		if err := a.archiveMinuteStats(ctx, now); err != nil {
-			log.Error().Err(err).Msg("archiveMinuteStats error")
-		}
-		a.lastMinuteRun = now
+	if minuteDue {
+		spawn(func() {
+			if err := a.archiveMinuteStats(ctx, now); err != nil {
+				log.Error().Err(err).Msg("archiveMinuteStats error")
+			}
+		})
+		a.lastMinuteRun = ts
 	}
 
-	// 每小时：聚合小时统计
-	if now.Minute() == 0 && now.Sub(a.lastHourRun) >= time.Hour {
-		if err := a.aggregateHourStats(ctx, now); err != nil {
-			log.Error().Err(err).Msg("aggregateHourStats error")
-		}
-		// 清理 7 天前的分钟数据
-		a.cleanupOldData(ctx, "minute", 7)
-		a.lastHourRun = now
+	// 每小时聚合小时统计，每天凌晨聚合天统计
+	// 两次聚合共用一个连接，只从连接池取还一次
+	if hourDue || dayDue {
+		spawn(func() {
+			conn, err := a.db.Connx(ctx)
+			if err != nil {
+				log.Error().Err(err).Msg("aggregate stats: acquire connection error")
+				return
+			}
+			defer conn.Close()
+
+			if hourDue {
+				if err := a.aggregateHourStats(ctx, conn, now); err != nil {
+					log.Error().Err(err).Msg("aggregateHourStats error")
+				}
+			}
+			if dayDue {
+				if err := a.aggregateDayStats(ctx, conn, now); err != nil {
+					log.Error().Err(err).Msg("aggregateDayStats error")
+				}
+			}
+		})
 	}
 
-	// 每天凌晨：聚合天统计
-	if now.Hour() == 0 && now.Minute() < 10 && now.Sub(a.lastDayRun) >= 24*time.Hour {
-		if err := a.aggregateDayStats(ctx, now); err != nil {
-			log.Error().Err(err).Msg("aggregateDayStats error")
-		}
-		// 清理 30 天前的小时数据
-		a.cleanupOldData(ctx, "hour", 30)
-		a.lastDayRun = now
+	// 清理 7 天前的分钟数据
+	if hourDue {
+		spawn(func() { a.cleanupOldData(ctx, now, "minute", 7) })
+		a.lastHourRun = ts
 	}
+
+	// 清理 30 天前的小时数据
+	if dayDue {
+		spawn(func() { a.cleanupOldData(ctx, now, "hour", 30) })
+		a.lastDayRun = ts
+	}
+
+	wg.Wait()
 }
 
 // archiveMinuteStats 归档分钟统计（保存增量）
 func (a *StatsArchiver) archiveMinuteStats(ctx context.Context, now time.Time) error {
 	periodStart := now.Truncate(time.Minute)
 
-	// 扫描所有 spider:*:stats 键
+	projectIDs, err := a.activeProjects(ctx)
+	if err != nil {
+		return err
+	}
+	if len(projectIDs) == 0 {
+		return nil
+	}
+
+	cmds, err := a.computeDeltas(ctx, projectIDs)
+	if err != nil {
+		return err
+	}
+
+	var rows []minuteStatsRow
+	for i, projectID := range projectIDs {
+		d, err := cmds[i].Int64Slice()
+		if err != nil || len(d) != 4 {
+			continue
+		}
+		delta := statsSnapshot{Total: d[0], Completed: d[1], Failed: d[2], Retried: d[3]}
+
+		// 有变化才保存
+		if delta.Total > 0 || delta.Completed > 0 || delta.Failed > 0 {
+			rows = append(rows, minuteStatsRow{projectID: projectID, delta: delta})
+		}
+	}
+
+	if len(rows) == 0 {
+		return nil
+	}
+	return a.saveMinuteStats(ctx, periodStart, rows)
+}
+
+// 分钟增量计算的 pipeline 分批参数
+const (
+	statsDeltaBatchSize   = 256 // 每个 pipeline 携带的项目数
+	statsDeltaConcurrency = 4   // 同时在途的 pipeline 数
+)
+
+// computeDeltas 为每个项目执行 statsDeltaScript，返回与 projectIDs 一一对应的命令结果
+// 脚本先加载一次（Redis 重启后脚本缓存会清空），之后 EVALSHA 按 statsDeltaBatchSize 分批 pipeline 发送，
+// 最多 statsDeltaConcurrency 批并发：项目少时仍是一次往返，项目多时单个 pipeline 的请求/回复缓冲有上限，
+// 且多批的往返相互重叠。脚本保证读取与写回快照之间不会被写入方插入
+func (a *StatsArchiver) computeDeltas(ctx context.Context, projectIDs []int) ([]*redis.Cmd, error) {
+	if err := statsDeltaScript.Load(ctx, a.redis).Err(); err != nil {
+		return nil, fmt.Errorf("load stats delta script: %w", err)
+	}
+
+	cmds := make([]*redis.Cmd, len(projectIDs))
+	sem := make(chan struct{}, statsDeltaConcurrency)
+	var wg sync.WaitGroup
+	for lo := 0; lo < len(projectIDs); lo += statsDeltaBatchSize {
+		hi := min(lo+statsDeltaBatchSize, len(projectIDs))
+
+		sem <- struct{}{}
+		wg.Add(1)
+		go func(lo, hi int) {
+			defer func() {
+				<-sem
+				wg.Done()
+			}()
+
+			pipe := a.redis.Pipeline()
+			for i := lo; i < hi; i++ {
+				key := "spider:" + strconv.Itoa(projectIDs[i]) + ":stats"
+				cmds[i] = statsDeltaScript.EvalSha(ctx, pipe, []string{key, key + ":archived"})
+			}
+			// 同批其他项目的快照已写回，不能整批丢弃；失败的命令由调用方按项目跳过
+			if _, err := pipe.Exec(ctx); err != nil {
+				log.Warn().Err(err).Int("projects", hi-lo).Msg("compute project stats delta error")
+			}
+		}(lo, hi)
+	}
+	wg.Wait()
+
+	return cmds, nil
+}
+
+// minuteStatsRow 待写入的分钟增量
+type minuteStatsRow struct {
+	projectID int
+	delta     statsSnapshot
+}
+
+// minuteStatsBatchSize 单条 INSERT 最多携带的行数，控制语句大小在 max_allowed_packet 以内
+const minuteStatsBatchSize = 1000
+
+// saveMinuteStats 用多行 INSERT ... VALUES (...),(...) 写入本分钟所有项目的增量
+// 每 minuteStatsBatchSize 行一条语句，语句解析和索引定位按批摊销；多批时在同一事务中提交
+func (a *StatsArchiver) saveMinuteStats(ctx context.Context, periodStart time.Time, rows []minuteStatsRow) error {
+	tx, err := a.db.BeginTxx(ctx, nil)
+	if err != nil {
+		return fmt.Errorf("begin tx: %w", err)
+	}
+	defer tx.Rollback()
+
+	for len(rows) > 0 {
+		n := min(len(rows), minuteStatsBatchSize)
+		if err := insertMinuteStats(ctx, tx, periodStart, rows[:n]); err != nil {
+			return err
+		}
+		rows = rows[n:]
+	}
+
+	return tx.Commit()
+}
+
+// insertMinuteStats 以一条多行 INSERT 写入一批分钟增量
+func insertMinuteStats(ctx context.Context, tx *sqlx.Tx, periodStart time.Time, rows []minuteStatsRow) error {
+	var query strings.Builder
+	query.Grow(512 + len(rows)*32)
+	query.WriteString(`INSERT INTO spider_stats_history
+		(project_id, period_type, period_start, total, completed, failed, retried, avg_speed)
+		VALUES `)
+
+	args := make([]interface{}, 0, len(rows)*7)
+	for i, row := range rows {
+		if i > 0 {
+			query.WriteByte(',')
+		}
+		query.WriteString("(?, 'minute', ?, ?, ?, ?, ?, ?)")
+		avgSpeed := float64(row.delta.Completed) // 每分钟完成数作为速度
+		args = append(args, row.projectID, periodStart,
+			row.delta.Total, row.delta.Completed, row.delta.Failed, row.delta.Retried, avgSpeed)
+	}
+
+	// 增量由 statsDeltaScript 原子领取，每份只会交给一个归档者；同一分钟的行已存在
+	// （多实例同一分钟各领到一部分增量）时累加而不是覆盖，后写入者不会冲掉先写入的计数
+	query.WriteString(`
+		ON DUPLICATE KEY UPDATE
+			total = total + VALUES(total),
+			completed = completed + VALUES(completed),
+			failed = failed + VALUES(failed),
+			retried = retried + VALUES(retried),
+			avg_speed = IFNULL(avg_speed, 0) + VALUES(avg_speed)`)
+
+	if _, err := tx.ExecContext(ctx, query.String(), args...); err != nil {
+		return fmt.Errorf("save minute stats (%d rows): %w", len(rows), err)
+	}
+	return nil
+}
+
+// activeProjects 获取有统计数据的项目 ID
+// 从活跃项目索引 SMEMBERS 一次读取，开销只与项目数相关；
+// 服务启动后首次调用改用 SCAN 并回填索引，兼容索引上线前已存在的项目
+func (a *StatsArchiver) activeProjects(ctx context.Context) ([]int, error) {
+	if !a.indexBackfilled {
+		projectIDs, err := a.scanProjects(ctx)
+		if err != nil {
+			return nil, err
+		}
+		if len(projectIDs) > 0 {
+			members := make([]interface{}, len(projectIDs))
+			for i, id := range projectIDs {
+				members[i] = id
+			}
+			if err := a.redis.SAdd(ctx, activeProjectsKey, members...).Err(); err != nil {
+				return nil, fmt.Errorf("backfill active projects: %w", err)
+			}
+		}
+		a.indexBackfilled = true
+		return projectIDs, nil
+	}
+
+	members, err := a.redis.SMembers(ctx, activeProjectsKey).Result()
+	if err != nil {
+		return nil, fmt.Errorf("read active projects: %w", err)
+	}
+	projectIDs := make([]int, 0, len(members))
+	for _, m := range members {
+		if id, err := strconv.Atoi(m); err == nil {
+			projectIDs = append(projectIDs, id)
+		}
+	}
+	return projectIDs, nil
+}
+
+// scanProjects 扫描所有 spider:*:stats 键，解析出项目 ID
+func (a *StatsArchiver) scanProjects(ctx context.Context) ([]int, error) {
+	var projectIDs []int
 	iter := a.redis.Scan(ctx, 0, "spider:*:stats", 100).Iterator()
 	for iter.Next(ctx) {
 		key := iter.Val()
@@ -147,67 +405,17 @@ func (a *StatsArchiver) archiveMinuteStats(ctx context.Context, now time.Time) e
 		if err != nil {
 			continue
 		}
-
-		// 获取当前统计
-		statsData, err := a.redis.HGetAll(ctx, key).Result()
-		if err != nil || len(statsData) == 0 {
-			continue
-		}
-
-		current := statsSnapshot{
-			Total:     parseInt64(statsData["total"]),
-			Completed: parseInt64(statsData["completed"]),
-			Failed:    parseInt64(statsData["failed"]),
-			Retried:   parseInt64(statsData["retried"]),
-		}
-
-		// 计算增量
-		a.archivedMu.RLock()
-		last := a.lastArchived[projectID]
-		a.archivedMu.RUnlock()
-		delta := statsSnapshot{
-			Total:     maxInt64(0, current.Total-last.Total),
-			Completed: maxInt64(0, current.Completed-last.Completed),
-			Failed:    maxInt64(0, current.Failed-last.Failed),
-			Retried:   maxInt64(0, current.Retried-last.Retried),
-		}
-
-		// 有变化才保存
-		if delta.Total > 0 || delta.Completed > 0 || delta.Failed > 0 {
-			avgSpeed := float64(delta.Completed) // 每分钟完成数作为速度
-
-			_, err = a.db.ExecContext(ctx, `
-				INSERT INTO spider_stats_history
-				(project_id, period_type, period_start, total, completed, failed, retried, avg_speed)
-				VALUES (?, 'minute', ?, ?, ?, ?, ?, ?)
-				ON DUPLICATE KEY UPDATE
-					total = VALUES(total),
-					completed = VALUES(completed),
-					failed = VALUES(failed),
-					retried = VALUES(retried),
-					avg_speed = VALUES(avg_speed)
-			`, projectID, periodStart, delta.Total, delta.Completed, delta.Failed, delta.Retried, avgSpeed)
-
-			if err != nil {
-				log.Error().Err(err).Int("project_id", projectID).Msg("save minute stats error")
-			}
-		}
-
-		// 更新基准值
-		a.archivedMu.Lock()
-		a.lastArchived[projectID] = current
-		a.archivedMu.Unlock()
+		projectIDs = append(projectIDs, projectID)
 	}
-
-	return iter.Err()
+	return projectIDs, iter.Err()
 }
 
 // aggregateHourStats 聚合小时统计
-func (a *StatsArchiver) aggregateHourStats(ctx context.Context, now time.Time) error {
+func (a *StatsArchiver) aggregateHourStats(ctx context.Context, db sqlx.ExecerContext, now time.Time) error {
 	hourStart := now.Truncate(time.Hour).Add(-time.Hour)
 	hourEnd := hourStart.Add(time.Hour)
 
-	_, err := a.db.ExecContext(ctx, `
+	_, err := db.ExecContext(ctx, `
 		INSERT INTO spider_stats_history (project_id, period_type, period_start, total, completed, failed, retried, avg_speed)
 		SELECT project_id, 'hour', ?, SUM(total), SUM(completed), SUM(failed), SUM(retried), SUM(avg_speed)
 		FROM spider_stats_history
@@ -225,11 +433,11 @@ func (a *StatsArchiver) aggregateHourStats(ctx context.Context, now time.Time) e
 }
 
 // aggregateDayStats 聚合天统计
-func (a *StatsArchiver) aggregateDayStats(ctx context.Context, now time.Time) error {
+func (a *StatsArchiver) aggregateDayStats(ctx context.Context, db sqlx.ExecerContext, now time.Time) error {
 	dayStart := now.Truncate(24 * time.Hour).Add(-24 * time.Hour)
 	dayEnd := dayStart.Add(24 * time.Hour)
 
-	_, err := a.db.ExecContext(ctx, `
+	_, err := db.ExecContext(ctx, `
 		INSERT INTO spider_stats_history (project_id, period_type, period_start, total, completed, failed, retried, avg_speed)
 		SELECT project_id, 'day', ?, SUM(total), SUM(completed), SUM(failed), SUM(retried), SUM(avg_speed)
 		FROM spider_stats_history
@@ -246,31 +454,34 @@ func (a *StatsArchiver) aggregateDayStats(ctx context.Context, now time.Time) er
 	return err
 }
 
-// cleanupOldData 清理过期数据
-func (a *StatsArchiver) cleanupOldData(ctx context.Context, periodType string, retentionDays int) {
-	cutoff := time.Now().AddDate(0, 0, -retentionDays)
-	result, err := a.db.ExecContext(ctx, `
-		DELETE FROM spider_stats_history WHERE period_type = ? AND period_start < ?
-	`, periodType, cutoff)
+// cleanupBatchSize 过期数据每条 DELETE 删除的最大行数
+const cleanupBatchSize = 5000
 
-	if err != nil {
-		log.Error().Err(err).Str("period_type", periodType).Msg("cleanupOldData error")
-		return
-	}
+// cleanupOldData 清理过期数据（以本轮 tick 的时间为基准，与同轮聚合使用同一时刻）
+// 按 idx_period 分批 DELETE ... LIMIT，每批是一个短事务，undo 日志和行锁不随过期行数增长，
+// 不会长时间阻塞同表的分钟写入
+func (a *StatsArchiver) cleanupOldData(ctx context.Context, now time.Time, periodType string, retentionDays int) {
+	cutoff := now.AddDate(0, 0, -retentionDays)
 
-	if affected, _ := result.RowsAffected(); affected > 0 {
-		log.Info().Int64("count", affected).Str("period_type", periodType).Msg("Cleaned up old stats records")
-	}
-}
+	var total int64
+	for {
+		result, err := a.db.ExecContext(ctx, `
+			DELETE FROM spider_stats_history WHERE period_type = ? AND period_start < ? LIMIT ?
+		`, periodType, cutoff, cleanupBatchSize)
 
-func parseInt64(s string) int64 {
-	v, _ := strconv.ParseInt(s, 10, 64)
-	return v
-}
+		if err != nil {
+			log.Error().Err(err).Str("period_type", periodType).Msg("cleanupOldData error")
+			break
+		}
+
+		affected, _ := result.RowsAffected()
+		total += affected
+		if affected < cleanupBatchSize {
+			break
+		}
+	}
 
-func maxInt64(a, b int64) int64 {
-	if a > b {
-		return a
+	if total > 0 {
+		log.Info().Int64("count", total).Str("period_type", periodType).Msg("Cleaned up old stats records")
 	}
-	return b
 }
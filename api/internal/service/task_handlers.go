@@ -173,36 +173,26 @@ func (h *RunSpiderHandler) Handle(task *ScheduledTask) TaskResult {
 		Str("project_name", params.ProjectName).
 		Msg("Running scheduled spider")
 
-	// 检查项目状态和是否启用
-	var project struct {
-		Status  string `db:"status"`
-		Enabled int    `db:"enabled"`
-	}
-	if err := h.db.Get(&project, "SELECT status, enabled FROM spider_projects WHERE id = ?", params.ProjectID); err != nil {
-		return TaskResult{
-			Success:  false,
-			Message:  "项目不存在",
-			Duration: time.Since(startTime).Milliseconds(),
-		}
-	}
-	if project.Enabled == 0 {
+	// 条件 UPDATE 一步完成检查与置位：只有已启用且未在运行的项目会被置为 running，
+	// 正常触发只需一次往返，也消除了先查后改之间的竞态
+	res, err := h.db.ExecContext(ctx,
+		"UPDATE spider_projects SET status = 'running' WHERE id = ? AND enabled = 1 AND status != 'running'",
+		params.ProjectID)
+	if err != nil {
 		return TaskResult{
 			Success:  false,
-			Message:  "项目已禁用，跳过",
+			Message:  fmt.Sprintf("更新项目状态失败: %v", err),
 			Duration: time.Since(startTime).Milliseconds(),
 		}
 	}
-	if project.Status == "running" {
+	if affected, _ := res.RowsAffected(); affected == 0 {
 		return TaskResult{
 			Success:  false,
-			Message:  "项目正在运行中，跳过",
+			Message:  h.skipReason(ctx, params.ProjectID),
 			Duration: time.Since(startTime).Milliseconds(),
 		}
 	}
 
-	// 更新状态为 running
-	h.db.Exec("UPDATE spider_projects SET status = 'running' WHERE id = ?", params.ProjectID)
-
 	// 使用现有的 SpiderCommand 结构体
 	cmd := models.SpiderCommand{
 		Action:    "run",
@@ -211,7 +201,13 @@ func (h *RunSpiderHandler) Handle(task *ScheduledTask) TaskResult {
 	}
 	cmdJSON, _ := json.Marshal(cmd)
 
-	if err := h.redis.Publish(ctx, "spider:commands", cmdJSON).Err(); err != nil {
+	// 调度器只负责投递命令，爬取由 worker 执行；Pub/Sub 无订阅者时消息直接丢弃，
+	// 按接收者数判断是否投递成功，避免项目一直停留在 running
+	receivers, err := h.redis.Publish(ctx, "spider:commands", cmdJSON).Result()
+	if err == nil && receivers == 0 {
+		err = fmt.Errorf("no worker subscribed")
+	}
+	if err != nil {
 		// 回滚状态
 		h.db.Exec("UPDATE spider_projects SET status = 'idle' WHERE id = ?", params.ProjectID)
 		return TaskResult{
@@ -228,6 +224,18 @@ func (h *RunSpiderHandler) Handle(task *ScheduledTask) TaskResult {
 	}
 }
 
+// skipReason 条件 UPDATE 未命中时查询具体原因（仅跳过时才多一次查询）
+func (h *RunSpiderHandler) skipReason(ctx context.Context, projectID int) string {
+	var enabled int
+	if err := h.db.GetContext(ctx, &enabled, "SELECT enabled FROM spider_projects WHERE id = ?", projectID); err != nil {
+		return "项目不存在"
+	}
+	if enabled == 0 {
+		return "项目已禁用，跳过"
+	}
+	return "项目正在运行中，跳过"
+}
+
 // RegisterAllHandlers 注册所有任务处理器
 func RegisterAllHandlers(scheduler *Scheduler, poolManager *PoolManager, templateCache *TemplateCache, db *sqlx.DB, rdb *redis.Client) {
 	// 注册刷新数据池处理器
@@ -3,8 +3,8 @@ package core
 import (
 	"context"
 	"database/sql"
-	"fmt"
 	"sync"
+	"time"
 
 	"github.com/jmoiron/sqlx"
 	"github.com/rs/zerolog/log"
@@ -16,7 +16,8 @@ import (
 // Templates are loaded at startup and updated on-demand via API
 type TemplateCache struct {
 	db       *sqlx.DB
-	cache    sync.Map // key: "name:groupID" -> *models.Template
+	cache    sync.Map // key: templateKey -> *models.Template
+	misses   sync.Map // key: templateKey -> 未找到的时间（unix 纳秒），负缓存
 	count    int64
 	mu       sync.RWMutex
 	analyzer *TemplateAnalyzer // 模板分析器
@@ -29,13 +30,26 @@ func NewTemplateCache(db *sqlx.DB) *TemplateCache {
 	}
 }
 
+// templateMissTTL 模板不存在的负缓存时长
+// 期间同一模板的请求不再回源查库，新建模板最迟在该时长后可被按需加载
+const templateMissTTL = 30 * time.Second
+
+// templateKey 模板缓存键（可比较结构体，查找时无需拼接字符串）
+type templateKey struct {
+	name        string
+	siteGroupID int
+}
+
 // cacheKey generates the cache key for a template
-func cacheKey(name string, siteGroupID int) string {
-	return fmt.Sprintf("%s:%d", name, siteGroupID)
+func cacheKey(name string, siteGroupID int) templateKey {
+	return templateKey{name: name, siteGroupID: siteGroupID}
 }
 
 // LoadAll loads all active templates into cache at startup
 func (tc *TemplateCache) LoadAll(ctx context.Context) error {
+	// 显式加载时清空负缓存
+	tc.misses.Clear()
+
 	templates := []models.Template{}
 	query := `SELECT * FROM templates WHERE status = 1`
 
@@ -96,6 +110,15 @@ func (tc *TemplateCache) GetWithFallback(ctx context.Context, name string, siteG
 		return tmpl, nil
 	}
 
+	// 近期已确认不存在的模板直接返回，避免每个请求都回源查库
+	missKey := cacheKey(name, siteGroupID)
+	if at, found := tc.misses.Load(missKey); found {
+		if time.Since(time.Unix(0, at.(int64))) < templateMissTTL {
+			return nil, nil
+		}
+		tc.misses.Delete(missKey)
+	}
+
 	// Try to load from DB (for newly added templates)
 	tmpl := &models.Template{}
 
@@ -130,11 +153,14 @@ func (tc *TemplateCache) GetWithFallback(ctx context.Context, name string, siteG
 		}
 	}
 
+	tc.misses.Store(missKey, time.Now().UnixNano())
 	return nil, nil
 }
 
 // Reload reloads a specific template from database
 func (tc *TemplateCache) Reload(ctx context.Context, name string, siteGroupID int) error {
+	tc.misses.Clear()
+
 	tmpl := &models.Template{}
 	query := `SELECT * FROM templates WHERE name = ? AND site_group_id = ? AND status = 1 LIMIT 1`
 
@@ -178,6 +204,8 @@ func (tc *TemplateCache) Reload(ctx context.Context, name string, siteGroupID in
 
 // ReloadByName reloads all versions of a template (all site groups)
 func (tc *TemplateCache) ReloadByName(ctx context.Context, name string) error {
+	tc.misses.Clear()
+
 	templates := []models.Template{}
 	query := `SELECT * FROM templates WHERE name = ? AND status = 1`
 
@@ -187,9 +215,8 @@ func (tc *TemplateCache) ReloadByName(ctx context.Context, name string) error {
 
 	// Delete all existing versions of this template
 	tc.cache.Range(func(k, v interface{}) bool {
-		key := k.(string)
 		if tmpl, ok := v.(*models.Template); ok && tmpl != nil && tmpl.Name == name {
-			tc.cache.Delete(key)
+			tc.cache.Delete(k)
 		}
 		return true
 	})
@@ -227,10 +254,22 @@ func (tc *TemplateCache) ReloadAll(ctx context.Context) error {
 func (tc *TemplateCache) Invalidate(name string, siteGroupID int) {
 	key := cacheKey(name, siteGroupID)
 	tc.cache.Delete(key)
+	tc.misses.Delete(key)
+
+	// 其他站群的未命中会回退到默认站群查找，默认站群模板变化时一并清除同名负缓存
+	if siteGroupID == 1 {
+		tc.misses.Range(func(k, _ interface{}) bool {
+			if k.(templateKey).name == name {
+				tc.misses.Delete(k)
+			}
+			return true
+		})
+	}
 }
 
 // InvalidateAll clears the entire cache
 func (tc *TemplateCache) InvalidateAll() {
+	tc.misses.Clear()
 	tc.cache.Range(func(key, value interface{}) bool {
 		tc.cache.Delete(key)
 		return true
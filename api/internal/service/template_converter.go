@@ -7,13 +7,21 @@ import (
 )
 
 // TemplateConverter converts Jinja2 templates to Go text/template syntax
+// 所有规则合并为一个交替模式（每条规则一个外层捕获组），Convert 只扫描模板一遍，
+// 按命中的捕获组分派到对应规则，而不是每条规则各对整个模板 ReplaceAll 一遍
 type TemplateConverter struct {
-	rules []conversionRule
+	pattern *regexp.Regexp
+	rules   []conversionRule
 }
 
 type conversionRule struct {
-	pattern     *regexp.Regexp
+	pattern     *regexp.Regexp // 规则自身的模式，用于按 replacement 展开 ${n}
+	group       int            // 规则在合并模式中的外层捕获组序号
 	replacement string
+	// byName 非空时按第 1 个捕获组查表替换：多条只差名字的规则合并为一条
+	byName map[string]string
+	// variable 为剩余 {{ var }} 规则：首字母大写为顶层字段，Go 模板关键字原样保留
+	variable bool
 }
 
 // NewTemplateConverter creates a new template converter
@@ -25,108 +33,157 @@ func NewTemplateConverter() *TemplateConverter {
 	rules := []struct {
 		pattern     string
 		replacement string
+		byName      map[string]string
 	}{
 		// Function calls without arguments
-		{`\{\{\s*random_keyword\s*\(\s*\)\s*\}\}`, `{{$.RandomKeyword}}`},
-		{`\{\{\s*random_hotspot\s*\(\s*\)\s*\}\}`, `{{$.RandomKeyword}}`},
-		{`\{\{\s*keyword_with_emoji\s*\(\s*\)\s*\}\}`, `{{$.RandomKeywordEmoji}}`},
-		{`\{\{\s*random_keyword_emoji\s*\(\s*\)\s*\}\}`, `{{$.RandomKeywordEmoji}}`},
-		{`\{\{\s*random_url\s*\(\s*\)\s*\}\}`, `{{$.RandomURL}}`},
-		{`\{\{\s*random_image\s*\(\s*\)\s*\}\}`, `{{$.RandomImage}}`},
-		{`\{\{\s*content\s*\(\s*\)\s*\}\}`, `{{$.Content}}`},
-		{`\{\{\s*content_with_pinyin\s*\(\s*\)\s*\}\}`, `{{$.Content}}`},
-		{`\{\{\s*now\s*\(\s*\)\s*\}\}`, `{{$.Now}}`},
+		// 各无参函数（含旧模板别名 random_hotspot / keyword_with_emoji / content_with_pinyin）
+		// 合并为一条规则，按函数名查表替换
+		{`\{\{\s*(random_keyword_emoji|keyword_with_emoji|random_keyword|random_hotspot|random_url|random_image|content_with_pinyin|content|now)\s*\(\s*\)\s*\}\}`, "", map[string]string{
+			"random_keyword":       `{{$.RandomKeyword}}`,
+			"random_hotspot":       `{{$.RandomKeyword}}`,
+			"random_keyword_emoji": `{{$.RandomKeywordEmoji}}`,
+			"keyword_with_emoji":   `{{$.RandomKeywordEmoji}}`,
+			"random_url":           `{{$.RandomURL}}`,
+			"random_image":         `{{$.RandomImage}}`,
+			"content":              `{{$.Content}}`,
+			"content_with_pinyin":  `{{$.Content}}`,
+			"now":                  `{{$.Now}}`,
+		}},
 
 		// cls() function with argument - needs special handling
 		// Use [^'"]* instead of [^'"]+ to allow empty strings like cls('')
-		{`\{\{\s*cls\s*\(\s*['"]([^'"]*)['"]\s*\)\s*\}\}`, `{{$.Cls "${1}"}}`},
-		{`\{\{\s*cls\s*\(\s*([^)]+)\s*\)\s*\}\}`, `{{$.Cls ${1}}}`},
+		{`\{\{\s*cls\s*\(\s*['"]([^'"]*)['"]\s*\)\s*\}\}`, `{{$.Cls "${1}"}}`, nil},
+		{`\{\{\s*cls\s*\(\s*([^)]+)\s*\)\s*\}\}`, `{{$.Cls ${1}}}`, nil},
 
 		// encode() function
-		{`\{\{\s*encode\s*\(\s*['"]([^'"]+)['"]\s*\)\s*\}\}`, `{{$.Encode "${1}"}}`},
-		{`\{\{\s*encode_text\s*\(\s*['"]([^'"]+)['"]\s*\)\s*\}\}`, `{{$.Encode "${1}"}}`},
+		{`\{\{\s*encode(?:_text)?\s*\(\s*['"]([^'"]+)['"]\s*\)\s*\}\}`, `{{$.Encode "${1}"}}`, nil},
 
 		// random_number(min, max) function
-		{`\{\{\s*random_number\s*\(\s*(\d+)\s*,\s*(\d+)\s*\)\s*\}\}`, `{{$.RandomNumber ${1} ${2}}}`},
-
-		// Loop variable {{ i }} -> {{$i}}
-		{`\{\{\s*i\s*\}\}`, `{{$$i}}`},
-
-		// Simple variables
-		{`\{\{\s*title\s*\}\}`, `{{$.Title}}`},
-		{`\{\{\s*site_id\s*\}\}`, `{{$.SiteID}}`},
-		{`\{\{\s*analytics_code\s*\}\}`, `{{$.AnalyticsCode}}`},
-		{`\{\{\s*baidu_push_js\s*\}\}`, `{{$.BaiduPushJS}}`},
-		{`\{\{\s*article_content\s*\}\}`, `{{$.ArticleContent}}`},
+		{`\{\{\s*random_number\s*\(\s*(\d+)\s*,\s*(\d+)\s*\)\s*\}\}`, `{{$.RandomNumber ${1} ${2}}}`, nil},
+
+		// Loop variable {{ i }} -> {{$i}} and simple variables（合并为一条规则）
+		{`\{\{\s*(i|title|site_id|analytics_code|baidu_push_js|article_content)\s*\}\}`, "", map[string]string{
+			"i":               `{{$i}}`,
+			"title":           `{{$.Title}}`,
+			"site_id":         `{{$.SiteID}}`,
+			"analytics_code":  `{{$.AnalyticsCode}}`,
+			"baidu_push_js":   `{{$.BaiduPushJS}}`,
+			"article_content": `{{$.ArticleContent}}`,
+		}},
 
 		// Variables with "or ''" fallback (Jinja2 default filter)
 		// These are handled specially below to capitalize variable names
 
 		// analytics_code or '' -> AnalyticsCode
-		{`\{\{\s*analytics_code\s+or\s+['"]['"]?\s*\}\}`, `{{$.AnalyticsCode}}`},
-		{`\{\{\s*baidu_push_js\s+or\s+['"]['"]?\s*\}\}`, `{{$.BaiduPushJS}}`},
+		{`\{\{\s*(analytics_code|baidu_push_js)\s+or\s+['"]['"]?\s*\}\}`, "", map[string]string{
+			"analytics_code": `{{$.AnalyticsCode}}`,
+			"baidu_push_js":  `{{$.BaiduPushJS}}`,
+		}},
 
 		// For loops: {% for i in range(N) %} -> {{range $i := iterate N}}
-		{`\{%\s*for\s+(\w+)\s+in\s+range\s*\(\s*(\d+)\s*\)\s*%\}`, `{{range $$${1} := iterate ${2}}}`},
-		{`\{%\s*endfor\s*%\}`, `{{end}}`},
+		{`\{%\s*for\s+(\w+)\s+in\s+range\s*\(\s*(\d+)\s*\)\s*%\}`, `{{range $$${1} := iterate ${2}}}`, nil},
 
 		// If statements
-		{`\{%\s*if\s+([^%]+)\s*%\}`, `{{if ${1}}}`},
-		{`\{%\s*elif\s+([^%]+)\s*%\}`, `{{else if ${1}}}`},
-		{`\{%\s*else\s*%\}`, `{{else}}`},
-		{`\{%\s*endif\s*%\}`, `{{end}}`},
+		{`\{%\s*if\s+([^%]+)\s*%\}`, `{{if ${1}}}`, nil},
+		{`\{%\s*elif\s+([^%]+)\s*%\}`, `{{else if ${1}}}`, nil},
+
+		// endfor / else / endif
+		{`\{%\s*(endfor|else|endif)\s*%\}`, "", map[string]string{
+			"endfor": `{{end}}`,
+			"else":   `{{else}}`,
+			"endif":  `{{end}}`,
+		}},
 
 		// Comments
-		{`\{#[^#]*#\}`, ``},
+		{`\{#[^#]*#\}`, ``, nil},
 	}
 
+	// 合并模式中规则按上面的顺序排列，同一位置能匹配多条时取靠前的一条；
+	// 剩余变量规则放在最后，只处理前面规则都未命中的 {{ var }}
+	var master strings.Builder
+	group := 1
+	add := func(rule conversionRule) {
+		if master.Len() > 0 {
+			master.WriteByte('|')
+		}
+		master.WriteString("(" + rule.pattern.String() + ")")
+		rule.group = group
+		group += 1 + rule.pattern.NumSubexp()
+		tc.rules = append(tc.rules, rule)
+	}
 	for _, r := range rules {
-		tc.rules = append(tc.rules, conversionRule{
+		add(conversionRule{
 			pattern:     regexp.MustCompile(r.pattern),
 			replacement: r.replacement,
+			byName:      r.byName,
 		})
 	}
+	add(conversionRule{pattern: remainingVarPattern, variable: true})
+	tc.pattern = regexp.MustCompile(master.String())
 
 	return tc
 }
 
 // Convert converts a Jinja2 template to Go text/template syntax
 func (tc *TemplateConverter) Convert(jinja2Template string) string {
-	result := jinja2Template
-
-	for _, rule := range tc.rules {
-		result = rule.pattern.ReplaceAllString(result, rule.replacement)
+	src := jinja2Template
+	matches := tc.pattern.FindAllStringSubmatchIndex(src, -1)
+	if len(matches) == 0 {
+		return src
 	}
 
-	// Handle remaining Jinja2 variable syntax {{ var }}
-	// Convert to {{$.Var}} with capitalized first letter
-	// Use $ to reference top-level context (works inside range blocks)
-	// But skip Go template keywords
-	goTemplateKeywords := map[string]bool{
-		"end": true, "else": true, "if": true, "range": true,
-		"with": true, "define": true, "template": true, "block": true,
-		"nil": true, "true": true, "false": true,
-	}
-	remainingVarPattern := regexp.MustCompile(`\{\{\s*([a-z_][a-zA-Z0-9_]*)\s*\}\}`)
-	result = remainingVarPattern.ReplaceAllStringFunc(result, func(match string) string {
-		// Extract variable name
-		submatches := remainingVarPattern.FindStringSubmatch(match)
-		if len(submatches) < 2 {
-			return match
+	out := make([]byte, 0, len(src)+len(src)/4)
+	last := 0
+	for _, m := range matches {
+		out = append(out, src[last:m[0]]...)
+		last = m[1]
+
+		for i := range tc.rules {
+			rule := &tc.rules[i]
+			if m[2*rule.group] < 0 {
+				continue
+			}
+			// 截取该规则自己的匹配位置：外层组即整体匹配，其后紧跟规则内部的捕获组
+			sub := m[2*rule.group : 2*(rule.group+1+rule.pattern.NumSubexp())]
+			out = rule.expand(out, src, sub)
+			break
 		}
-		varName := submatches[1]
-		// Skip Go template keywords
+	}
+	out = append(out, src[last:]...)
+	return string(out)
+}
+
+// expand 将规则的替换结果追加到 dst
+func (r *conversionRule) expand(dst []byte, src string, sub []int) []byte {
+	switch {
+	case r.byName != nil:
+		return append(dst, r.byName[src[sub[2]:sub[3]]]...)
+	case r.variable:
+		// Handle remaining Jinja2 variable syntax {{ var }}
+		// Convert to {{$.Var}} with capitalized first letter
+		// Use $ to reference top-level context (works inside range blocks)
+		// But skip Go template keywords
+		varName := src[sub[2]:sub[3]]
 		if goTemplateKeywords[varName] {
-			return match
+			return append(dst, src[sub[0]:sub[1]]...)
 		}
-		// Capitalize first letter
-		if len(varName) > 0 {
-			varName = strings.ToUpper(varName[:1]) + varName[1:]
-		}
-		return "{{$." + varName + "}}"
-	})
+		dst = append(dst, "{{$."...)
+		dst = append(dst, strings.ToUpper(varName[:1])...)
+		dst = append(dst, varName[1:]...)
+		return append(dst, "}}"...)
+	default:
+		return r.pattern.ExpandString(dst, r.replacement, src, sub)
+	}
+}
 
-	return result
+// remainingVarPattern 其他规则未覆盖的 {{ var }}
+var remainingVarPattern = regexp.MustCompile(`\{\{\s*([a-z_][a-zA-Z0-9_]*)\s*\}\}`)
+
+// goTemplateKeywords Go 模板关键字，剩余变量转换时跳过
+var goTemplateKeywords = map[string]bool{
+	"end": true, "else": true, "if": true, "range": true,
+	"with": true, "define": true, "template": true, "block": true,
+	"nil": true, "true": true, "false": true,
 }
 
 // ConvertWithCache converts a template with caching
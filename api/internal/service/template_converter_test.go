@@ -0,0 +1,91 @@
+package core
+
+import "testing"
+
+// TestTemplateConverter_Rules 逐条验证转换规则
+func TestTemplateConverter_Rules(t *testing.T) {
+	tests := []struct {
+		name string
+		in   string
+		want string
+	}{
+		// 无参函数及旧模板别名
+		{"random_keyword", `{{ random_keyword() }}`, `{{$.RandomKeyword}}`},
+		{"random_hotspot alias", `{{random_hotspot()}}`, `{{$.RandomKeyword}}`},
+		{"random_keyword_emoji", `{{ random_keyword_emoji() }}`, `{{$.RandomKeywordEmoji}}`},
+		{"keyword_with_emoji alias", `{{ keyword_with_emoji( ) }}`, `{{$.RandomKeywordEmoji}}`},
+		{"random_url", `{{ random_url() }}`, `{{$.RandomURL}}`},
+		{"random_image", `{{ random_image() }}`, `{{$.RandomImage}}`},
+		{"content", `{{ content() }}`, `{{$.Content}}`},
+		{"content_with_pinyin alias", `{{ content_with_pinyin() }}`, `{{$.Content}}`},
+		{"now", `{{ now() }}`, `{{$.Now}}`},
+
+		// 带参函数
+		{"cls empty", `{{ cls('') }}`, `{{$.Cls ""}}`},
+		{"cls literal", `{{ cls("header") }}`, `{{$.Cls "header"}}`},
+		{"cls variable", `{{ cls(name) }}`, `{{$.Cls name}}`},
+		{"encode", `{{ encode('联系我们') }}`, `{{$.Encode "联系我们"}}`},
+		{"encode_text", `{{ encode_text("about") }}`, `{{$.Encode "about"}}`},
+		{"random_number", `{{ random_number(1, 100) }}`, `{{$.RandomNumber 1 100}}`},
+
+		// 简单变量
+		{"loop variable", `{{ i }}`, `{{$i}}`},
+		{"title", `{{ title }}`, `{{$.Title}}`},
+		{"site_id", `{{ site_id }}`, `{{$.SiteID}}`},
+		{"analytics_code", `{{ analytics_code }}`, `{{$.AnalyticsCode}}`},
+		{"baidu_push_js", `{{ baidu_push_js }}`, `{{$.BaiduPushJS}}`},
+		{"article_content", `{{ article_content }}`, `{{$.ArticleContent}}`},
+		{"analytics_code or", `{{ analytics_code or '' }}`, `{{$.AnalyticsCode}}`},
+		{"baidu_push_js or", `{{ baidu_push_js or "" }}`, `{{$.BaiduPushJS}}`},
+
+		// 控制结构与注释
+		{"for", `{% for i in range(10) %}x{% endfor %}`, `{{range $i := iterate 10}}x{{end}}`},
+		{"if elif else", `{% if title %}a{% elif site_id %}b{% else %}c{% endif %}`, `{{if title }}a{{else if site_id }}b{{else}}c{{end}}`},
+		{"comment", `a{# 注释 #}b`, `ab`},
+
+		// 剩余变量：首字母大写；Go 模板关键字和非小写开头的原样保留
+		{"remaining variable", `{{ keywords }}`, `{{$.Keywords}}`},
+		{"end passthrough", `{{ end }}`, `{{ end }}`},
+		{"else passthrough", `{{ else }}`, `{{ else }}`},
+		{"capitalized passthrough", `{{ Title }}`, `{{ Title }}`},
+		{"plain text", `plain text`, `plain text`},
+	}
+
+	tc := NewTemplateConverter()
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := tc.Convert(tt.in); got != tt.want {
+				t.Errorf("Convert(%q) = %q, want %q", tt.in, got, tt.want)
+			}
+		})
+	}
+}
+
+// TestTemplateConverter_MixedTemplates 多条规则相邻、嵌套出现时的转换结果
+// 期望值取自改为单遍扫描之前逐条 ReplaceAll 的转换器输出
+func TestTemplateConverter_MixedTemplates(t *testing.T) {
+	tests := []struct {
+		in   string
+		want string
+	}{
+		{
+			`<title>{{ title }}</title>{% for i in range(3) %}<a href="{{ random_url() }}" class="{{ cls('link') }}">{{ random_keyword() }}</a>{{ i }}{% endfor %}`,
+			`<title>{{$.Title}}</title>{{range $i := iterate 3}}<a href="{{$.RandomURL}}" class="{{$.Cls "link"}}">{{$.RandomKeyword}}</a>{{$i}}{{end}}`,
+		},
+		{
+			`{% if analytics_code %}{{ analytics_code or '' }}{% endif %}<p>{{ content_with_pinyin() }}</p>{# hidden #}{{ random_number(5,9) }}{{ unknown_var }}{{ end }}`,
+			`{{if analytics_code }}{{$.AnalyticsCode}}{{end}}<p>{{$.Content}}</p>{{$.RandomNumber 5 9}}{{$.Unknown_var}}{{ end }}`,
+		},
+		{
+			`<div class="{{ cls(i) }}">{{ encode("x") }}{{ random_hotspot() }}{{ now() }}</div>{{ baidu_push_js }}`,
+			`<div class="{{$.Cls i}}">{{$.Encode "x"}}{{$.RandomKeyword}}{{$.Now}}</div>{{$.BaiduPushJS}}`,
+		},
+	}
+
+	tc := NewTemplateConverter()
+	for _, tt := range tests {
+		if got := tc.Convert(tt.in); got != tt.want {
+			t.Errorf("Convert(%q)\n got: %q\nwant: %q", tt.in, got, tt.want)
+		}
+	}
+}
@@ -3,6 +3,7 @@ package core
 import (
 	"fmt"
 	"math/rand/v2"
+	"strconv"
 	"strings"
 	"sync/atomic"
 	"time"
@@ -66,25 +67,25 @@ func stringMemorySizer(v any) int64 {
 
 // InitPools 初始化所有池子（从配置读取）
 func (m *TemplateFuncsManager) InitPools(config *CachePoolConfig) {
-	// cls池
-	m.clsPool = NewObjectPool[string](PoolConfig{
+	// cls池（批量生成，整批共享一块底层内存）
+	m.clsPool = NewBatchObjectPool[string](PoolConfig{
 		Name:          "cls",
 		Size:          config.ClsPoolSize,
 		Threshold:     config.ClsThreshold,
 		NumWorkers:    config.ClsWorkers,
 		CheckInterval: config.ClsRefillInterval(),
 		MemorySizer:   stringMemorySizer,
-	}, generateRandomCls)
+	}, generateRandomClsBatch)
 
-	// url池
-	m.urlPool = NewObjectPool[string](PoolConfig{
+	// url池（批量生成，整批URL共享一块底层内存）
+	m.urlPool = NewBatchObjectPool[string](PoolConfig{
 		Name:          "url",
 		Size:          config.UrlPoolSize,
 		Threshold:     config.UrlThreshold,
 		NumWorkers:    config.UrlWorkers,
 		CheckInterval: config.UrlRefillInterval(),
 		MemorySizer:   stringMemorySizer,
-	}, generateRandomURL)
+	}, generateRandomURLs)
 
 	// number池
 	m.numberPool = NewNumberPool()
@@ -102,38 +103,7 @@ func (m *TemplateFuncsManager) generateKeywordWithEmojiFromRaw(keyword string) s
 		return m.encoder.EncodeText(keyword)
 	}
 
-	// 随机决定插入 1 或 2 个 emoji（50% 概率）
-	emojiCount := 1
-	if rand.Float64() < 0.5 {
-		emojiCount = 2
-	}
-
-	// 转换为 rune 切片处理中文
-	runes := []rune(keyword)
-	runeLen := len(runes)
-	if runeLen == 0 {
-		return m.encoder.EncodeText(keyword)
-	}
-
-	// 插入 emoji
-	exclude := make(map[string]bool)
-	for i := 0; i < emojiCount; i++ {
-		pos := rand.IntN(runeLen + 1) // 0 到 len，包含首尾
-		emoji := m.emojiManager.GetRandomExclude(exclude)
-		if emoji != "" {
-			exclude[emoji] = true
-			// 在位置插入
-			newRunes := make([]rune, 0, len(runes)+len([]rune(emoji)))
-			newRunes = append(newRunes, runes[:pos]...)
-			newRunes = append(newRunes, []rune(emoji)...)
-			newRunes = append(newRunes, runes[pos:]...)
-			runes = newRunes
-			runeLen = len(runes)
-		}
-	}
-
-	// 编码并返回
-	return m.encoder.EncodeText(string(runes))
+	return m.encoder.EncodeText(insertRandomEmojis(keyword, m.emojiManager))
 }
 
 // StopPools 停止所有池
@@ -153,11 +123,31 @@ func (m *TemplateFuncsManager) StopPools() {
 
 // Cls 从池中获取随机class
 func (m *TemplateFuncsManager) Cls(name string) string {
+	return m.randomClsBase() + " " + name
+}
+
+// randomClsBase 从池中获取随机 class 前缀（不含 name），池未初始化时降级到直接生成
+func (m *TemplateFuncsManager) randomClsBase() string {
 	if m.clsPool != nil {
-		return m.clsPool.Get() + " " + name
+		return m.clsPool.Get()
 	}
-	// 降级到直接生成
-	return generateRandomCls() + " " + name
+	return generateRandomCls()
+}
+
+// reserveCls 为一次渲染预留 n 个随机 class 前缀（池未初始化时逐个直接生成）
+func (m *TemplateFuncsManager) reserveCls(n int) PoolReservation[string] {
+	if m.clsPool != nil {
+		return m.clsPool.Reserve(n)
+	}
+	return PoolReservation[string]{fallback: generateRandomCls}
+}
+
+// reserveURLs 为一次渲染预留 n 个随机URL（池未初始化时逐个直接生成）
+func (m *TemplateFuncsManager) reserveURLs(n int) PoolReservation[string] {
+	if m.urlPool != nil {
+		return m.urlPool.Reserve(n)
+	}
+	return PoolReservation[string]{fallback: generateRandomURL}
 }
 
 // RandomURL 从池中获取随机URL
@@ -171,21 +161,26 @@ func (m *TemplateFuncsManager) RandomURL() string {
 
 // RandomKeyword 获取随机关键词（支持分组）
 func (m *TemplateFuncsManager) RandomKeyword(groupID int) string {
+	keywords := m.keywordsForGroup(groupID)
+	if len(keywords) == 0 {
+		return ""
+	}
+	return keywords[rand.IntN(len(keywords))]
+}
+
+// keywordsForGroup 获取分组的编码关键词快照（空分组降级到默认分组）
+func (m *TemplateFuncsManager) keywordsForGroup(groupID int) []string {
 	data := m.keywordData.Load()
 	if data == nil {
-		return ""
+		return nil
 	}
 
 	keywords := data.groups[groupID]
 	if len(keywords) == 0 {
 		// 降级到默认分组
 		keywords = data.groups[1]
-		if len(keywords) == 0 {
-			return ""
-		}
 	}
-
-	return keywords[rand.IntN(len(keywords))]
+	return keywords
 }
 
 // RandomKeywordEmoji 获取带 emoji 的随机关键词（支持分组，从对象池消费）
@@ -211,21 +206,26 @@ func (m *TemplateFuncsManager) RandomKeywordEmoji(groupID int) string {
 
 // RandomImage 获取随机图片URL（支持分组）
 func (m *TemplateFuncsManager) RandomImage(groupID int) string {
+	urls := m.imagesForGroup(groupID)
+	if len(urls) == 0 {
+		return ""
+	}
+	return urls[rand.IntN(len(urls))]
+}
+
+// imagesForGroup 获取分组的图片URL快照（空分组降级到默认分组）
+func (m *TemplateFuncsManager) imagesForGroup(groupID int) []string {
 	data := m.imageData.Load()
 	if data == nil {
-		return ""
+		return nil
 	}
 
 	urls := data.groups[groupID]
 	if len(urls) == 0 {
 		// 降级到默认分组
 		urls = data.groups[1]
-		if len(urls) == 0 {
-			return ""
-		}
 	}
-
-	return urls[rand.IntN(len(urls))]
+	return urls
 }
 
 // RandomNumber 获取随机数
@@ -247,29 +247,137 @@ func (m *TemplateFuncsManager) Encode(text string) string {
 
 // ========== 生成函数 ==========
 
+// randomClsLen 随机class长度（13 位 + 空格 + 32 位）
+const randomClsLen = 13 + 1 + 32
+
+// generateRandomCls 生成随机class
 func generateRandomCls() string {
+	var buf [randomClsLen]byte
+	fillRandomCls(&buf)
+	return string(buf[:])
+}
+
+// generateRandomClsBatch 批量生成随机class填满 dst
+// class 定长，整批写入同一块缓冲区后按固定步长切分，每批只分配一次
+func generateRandomClsBatch(dst []string) {
+	if len(dst) == 0 {
+		return
+	}
+
+	var sb strings.Builder
+	sb.Grow(len(dst) * randomClsLen)
+	var buf [randomClsLen]byte
+	for range dst {
+		fillRandomCls(&buf)
+		sb.Write(buf[:])
+	}
+
+	blob := sb.String()
+	for i := range dst {
+		dst[i] = blob[i*randomClsLen : (i+1)*randomClsLen]
+	}
+}
+
+// fillRandomCls 将一个随机class写入 buf（13 位 + 空格 + 32 位）
+// 每次 rand.Uint64 按 36 进制拆出 12 个字符（36^12 < 2^64），45 个字符只需 4 次随机数调用
+func fillRandomCls(buf *[randomClsLen]byte) {
 	const chars = "abcdefghijklmnopqrstuvwxyz0123456789"
-	part1 := make([]byte, 13)
-	for i := range part1 {
-		part1[i] = chars[rand.IntN(len(chars))]
+	const perWord = 12
+
+	var x uint64
+	n := 0
+	for i := range buf {
+		if i == 13 {
+			buf[i] = ' '
+			continue
+		}
+		if n == 0 {
+			x = rand.Uint64()
+			n = perWord
+		}
+		buf[i] = chars[x%uint64(len(chars))]
+		x /= uint64(len(chars))
+		n--
 	}
-	part2 := make([]byte, 32)
-	for i := range part2 {
-		part2[i] = chars[rand.IntN(len(chars))]
+}
+
+// urlDateRange 随机URL日期范围（最近 N 天）
+const urlDateRange = 30
+
+// urlDateLUT 最近 urlDateRange 天的日期字符串（YYYYMMDD），按分钟刷新
+type urlDateLUT struct {
+	minute int64
+	dates  [urlDateRange][8]byte
+}
+
+var urlDates atomic.Pointer[urlDateLUT]
+
+// getURLDateLUT 获取日期查找表，过期（跨分钟）时重建，避免每个URL都做 AddDate+Format
+func getURLDateLUT() *urlDateLUT {
+	now := time.Now()
+	minute := now.Unix() / 60
+	if lut := urlDates.Load(); lut != nil && lut.minute == minute {
+		return lut
 	}
-	return string(part1) + " " + string(part2)
+
+	lut := &urlDateLUT{minute: minute}
+	for i := range lut.dates {
+		now.AddDate(0, 0, -i).AppendFormat(lut.dates[i][:0], "20060102")
+	}
+	urlDates.Store(lut)
+	return lut
 }
 
+// generateRandomURL 生成随机URL（在栈上缓冲区拼接，避免 fmt.Sprintf 的反射开销和中间分配）
 func generateRandomURL() string {
-	if rand.Float64() < 0.6 {
-		num := rand.IntN(900000000) + 100000000
-		return fmt.Sprintf("/?%d.html", num)
+	var buf [32]byte
+	return string(appendRandomURL(buf[:0]))
+}
+
+// maxRandomURLLen 随机URL最大长度（"/?" + 8位日期 + "/" + 5位数字 + ".html"）
+const maxRandomURLLen = 21
+
+// generateRandomURLs 批量生成随机URL填满 dst
+// 整批拼接进同一块缓冲区，每个URL是其子串，每批只分配一次而非每个URL一次
+func generateRandomURLs(dst []string) {
+	if len(dst) == 0 {
+		return
+	}
+
+	var sb strings.Builder
+	sb.Grow(len(dst) * maxRandomURLLen)
+	ends := make([]int, len(dst))
+	var buf [32]byte
+	for i := range dst {
+		sb.Write(appendRandomURL(buf[:0]))
+		ends[i] = sb.Len()
+	}
+
+	blob := sb.String()
+	start := 0
+	for i, end := range ends {
+		dst[i] = blob[start:end]
+		start = end
 	}
-	daysAgo := rand.IntN(30)
-	date := time.Now().AddDate(0, 0, -daysAgo)
-	dateStr := date.Format("20060102")
-	num := rand.IntN(90000) + 10000
-	return fmt.Sprintf("/?%s/%d.html", dateStr, num)
+}
+
+// appendRandomURL 将一个随机URL追加到 b
+// 所有随机量按混合进制从一次 rand.Uint64 中拆出，偏差可忽略（仅用于装饰性URL）
+func appendRandomURL(b []byte) []byte {
+	b = append(b, "/?"...)
+	x := rand.Uint64()
+	num9 := x % 900000000
+	x /= 900000000
+	if x%5 < 3 { // 60%
+		b = strconv.AppendUint(b, num9+100000000, 10)
+	} else {
+		x /= 5
+		b = append(b, getURLDateLUT().dates[x%urlDateRange][:]...)
+		b = append(b, '/')
+		x /= urlDateRange
+		b = strconv.AppendUint(b, x%90000+10000, 10)
+	}
+	return append(b, ".html"...)
 }
 
 // ========== 统计 ==========
@@ -305,9 +413,26 @@ func IterateFunc(n int) []int {
 	return result
 }
 
+// nowCache 按秒缓存的格式化时间
+type nowCache struct {
+	sec int64
+	str string
+}
+
+var cachedNow atomic.Pointer[nowCache]
+
 // NowFunc returns the current time formatted as string
+// 同一秒内的调用复用已格式化的字符串，避免每个请求都做一次 Format
 func NowFunc() string {
-	return time.Now().Format("2006-01-02 15:04:05")
+	now := time.Now()
+	sec := now.Unix()
+	if c := cachedNow.Load(); c != nil && c.sec == sec {
+		return c.str
+	}
+
+	str := now.Format("2006-01-02 15:04:05")
+	cachedNow.Store(&nowCache{sec: sec, str: str})
+	return str
 }
 
 // BuildArticleContent builds article content from titles and content
@@ -316,7 +441,7 @@ func BuildArticleContent(titles []string, content string) string {
 		return content
 	}
 
-	nowStr := time.Now().Format("2006-01-02 15:04:05")
+	nowStr := NowFunc()
 
 	var sb strings.Builder
 	sb.WriteString(titles[0])
@@ -427,6 +552,7 @@ func (m *TemplateFuncsManager) GetPoolStats() map[string]interface{} {
 // ============ 图片分组管理方法 ============
 
 // LoadImageGroup 加载指定分组的图片（初始化时使用）
+// urls 的所有权移交给 TemplateFuncsManager，调用方之后不得再修改（PoolManager.GetImages 返回的已是副本）
 func (m *TemplateFuncsManager) LoadImageGroup(groupID int, urls []string) {
 	for {
 		old := m.imageData.Load()
@@ -441,10 +567,7 @@ func (m *TemplateFuncsManager) LoadImageGroup(groupID int, urls []string) {
 			}
 		}
 
-		// 复制 urls 避免外部修改
-		copied := make([]string, len(urls))
-		copy(copied, urls)
-		newGroups[groupID] = copied
+		newGroups[groupID] = urls
 
 		newData := &ImageData{groups: newGroups}
 		if m.imageData.CompareAndSwap(old, newData) {
@@ -487,6 +610,7 @@ func (m *TemplateFuncsManager) AppendImages(groupID int, urls []string) {
 }
 
 // ReloadImageGroup 重载指定分组（删除后异步调用）
+// urls 的所有权移交规则同 LoadImageGroup
 func (m *TemplateFuncsManager) ReloadImageGroup(groupID int, urls []string) {
 	for {
 		old := m.imageData.Load()
@@ -501,11 +625,8 @@ func (m *TemplateFuncsManager) ReloadImageGroup(groupID int, urls []string) {
 			}
 		}
 
-		// 复制 urls 避免外部修改
 		if len(urls) > 0 {
-			copied := make([]string, len(urls))
-			copy(copied, urls)
-			newGroups[groupID] = copied
+			newGroups[groupID] = urls
 		} else {
 			delete(newGroups, groupID)
 		}
@@ -534,6 +655,8 @@ func (m *TemplateFuncsManager) GetImageStats() map[int]int {
 // ============ 关键词分组管理方法 ============
 
 // LoadKeywordGroup 加载指定分组的关键词（初始化时使用）
+// keywords/rawKeywords 已在 KeywordPool 加载时预编码，且 PoolManager 的 Get 方法返回的已是副本，
+// 所有权直接移交给 TemplateFuncsManager，不再重复复制；调用方之后不得再修改
 func (m *TemplateFuncsManager) LoadKeywordGroup(groupID int, keywords, rawKeywords []string) {
 	for {
 		old := m.keywordData.Load()
@@ -554,14 +677,8 @@ func (m *TemplateFuncsManager) LoadKeywordGroup(groupID int, keywords, rawKeywor
 			}
 		}
 
-		// 复制数据避免外部修改
-		copiedKeywords := make([]string, len(keywords))
-		copy(copiedKeywords, keywords)
-		newGroups[groupID] = copiedKeywords
-
-		copiedRaw := make([]string, len(rawKeywords))
-		copy(copiedRaw, rawKeywords)
-		newRawGroups[groupID] = copiedRaw
+		newGroups[groupID] = keywords
+		newRawGroups[groupID] = rawKeywords
 
 		newData := &KeywordData{groups: newGroups, rawGroups: newRawGroups}
 		if m.keywordData.CompareAndSwap(old, newData) {
@@ -616,6 +733,7 @@ func (m *TemplateFuncsManager) AppendKeywords(groupID int, keywords, rawKeywords
 }
 
 // ReloadKeywordGroup 重载指定分组（删除后异步调用）
+// 切片所有权移交规则同 LoadKeywordGroup
 func (m *TemplateFuncsManager) ReloadKeywordGroup(groupID int, keywords, rawKeywords []string) {
 	for {
 		old := m.keywordData.Load()
@@ -638,13 +756,8 @@ func (m *TemplateFuncsManager) ReloadKeywordGroup(groupID int, keywords, rawKeyw
 
 		// 替换或删除分组
 		if len(keywords) > 0 {
-			copiedKeywords := make([]string, len(keywords))
-			copy(copiedKeywords, keywords)
-			newGroups[groupID] = copiedKeywords
-
-			copiedRaw := make([]string, len(rawKeywords))
-			copy(copiedRaw, rawKeywords)
-			newRawGroups[groupID] = copiedRaw
+			newGroups[groupID] = keywords
+			newRawGroups[groupID] = rawKeywords
 		} else {
 			delete(newGroups, groupID)
 			delete(newRawGroups, groupID)
@@ -2,8 +2,7 @@ package core
 
 import (
 	"bytes"
-	"crypto/md5"
-	"encoding/hex"
+	"hash/maphash"
 	"html/template"
 	"strings"
 	"sync"
@@ -16,7 +15,7 @@ import (
 type TemplateRenderer struct {
 	converter     *TemplateConverter
 	funcsManager  *TemplateFuncsManager
-	compiledCache sync.Map // cache key -> *template.Template
+	compiledCache boundedTemplateCache // cache key -> *template.Template
 	fastRenderer  *FastRenderer
 }
 
@@ -42,6 +41,20 @@ type RenderData struct {
 	randomNumber  func(min, max int) int
 }
 
+// templateFuncMap 模板函数表（只读，所有模板编译共用，无需每次编译重建）
+var templateFuncMap = template.FuncMap{
+	"iterate": IterateFunc,
+}
+
+// templateKeySeed 模板缓存键的哈希种子（进程内固定，键只在进程内使用）
+var templateKeySeed = maphash.MakeSeed()
+
+// templateCacheKey 计算模板内容的缓存键
+// maphash 走运行时的硬件加速哈希，直接读取字符串，无需 []byte 转换和 hex 编码
+func templateCacheKey(templateContent string) uint64 {
+	return maphash.String(templateKeySeed, templateContent)
+}
+
 // NewTemplateRenderer creates a new template renderer
 func NewTemplateRenderer(funcsManager *TemplateFuncsManager) *TemplateRenderer {
 	return &TemplateRenderer{
@@ -56,8 +69,7 @@ func (r *TemplateRenderer) Render(templateContent string, templateName string, d
 	startTime := time.Now()
 
 	// Generate cache key from template content hash
-	hash := md5.Sum([]byte(templateContent))
-	cacheKey := hex.EncodeToString(hash[:])
+	cacheKey := templateCacheKey(templateContent)
 
 	// 设置 content 到 data.Content
 	if data != nil {
@@ -66,13 +78,14 @@ func (r *TemplateRenderer) Render(templateContent string, templateName string, d
 
 	// 1. 尝试快速渲染（绕过反射）
 	if result, ok := r.fastRenderer.Render(cacheKey, data); ok {
-		elapsed := time.Since(startTime)
-		log.Debug().
-			Str("template", templateName).
-			Dur("duration", elapsed).
-			Int("output_size", len(result)).
-			Bool("fast_render", true).
-			Msg("Template rendered (fast)")
+		// 热路径：仅在 Debug 日志开启时计算耗时并组装日志字段
+		if e := log.Debug(); e.Enabled() {
+			e.Str("template", templateName).
+				Dur("duration", time.Since(startTime)).
+				Int("output_size", len(result)).
+				Bool("fast_render", true).
+				Msg("Template rendered (fast)")
+		}
 		return result, nil
 	}
 
@@ -86,12 +99,8 @@ func (r *TemplateRenderer) Render(templateContent string, templateName string, d
 		goTemplate := r.converter.Convert(templateContent)
 
 		// Create template with custom functions
-		funcMap := template.FuncMap{
-			"iterate": IterateFunc,
-		}
-
 		var err error
-		tmpl, err = template.New(templateName).Funcs(funcMap).Parse(goTemplate)
+		tmpl, err = template.New(templateName).Funcs(templateFuncMap).Parse(goTemplate)
 		if err != nil {
 			log.Error().Err(err).Str("template", templateName).Msg("Failed to parse template")
 			return "", err
@@ -123,11 +132,7 @@ func (r *TemplateRenderer) Render(templateContent string, templateName string, d
 	// 按占位符拆分模板为静态片段
 	segments := splitByPlaceholders(templateStr, placeholders)
 
-	fastTemplate := &CompiledFastTemplate{
-		Segments:     segments,
-		Placeholders: placeholders,
-		TotalSize:    len(templateStr) + 50000, // 预留动态值空间
-	}
+	fastTemplate := NewCompiledFastTemplate(segments, placeholders, len(templateStr)+50000) // 预留动态值空间
 	r.fastRenderer.Store(cacheKey, fastTemplate)
 
 	// 4. 首次渲染：使用顺序写入方式返回结果
@@ -164,7 +169,7 @@ func (r *TemplateRenderer) getPlaceholderValue(p Placeholder, data *RenderData)
 
 // ClearCache clears the compiled template cache and fast template cache
 func (r *TemplateRenderer) ClearCache() {
-	r.compiledCache = sync.Map{}
+	r.compiledCache.Clear()
 	if r.fastRenderer != nil {
 		r.fastRenderer.ClearCache()
 	}
@@ -172,14 +177,8 @@ func (r *TemplateRenderer) ClearCache() {
 
 // GetCacheStats returns cache statistics
 func (r *TemplateRenderer) GetCacheStats() map[string]interface{} {
-	var count int
-	r.compiledCache.Range(func(_, _ interface{}) bool {
-		count++
-		return true
-	})
-
 	stats := map[string]interface{}{
-		"compiled_templates": count,
+		"compiled_templates": r.compiledCache.Len(),
 	}
 
 	// 添加快速渲染器统计
@@ -192,6 +191,53 @@ func (r *TemplateRenderer) GetCacheStats() map[string]interface{} {
 	return stats
 }
 
+// maxCachedTemplates 编译模板/快速模板缓存的最大条目数
+// 模板内容每次修改都会产生新键，不设上限时长期运行的进程会无限累积旧模板
+const maxCachedTemplates = 1024
+
+// boundedTemplateCache 有界模板缓存：读路径直接走 sync.Map（无锁），
+// 仅新键写入时加锁记录插入顺序，超出上限后淘汰最早写入的条目（FIFO）
+type boundedTemplateCache struct {
+	m     sync.Map // uint64 -> value
+	mu    sync.Mutex
+	order []uint64 // 插入顺序
+}
+
+// Load 读取缓存
+func (c *boundedTemplateCache) Load(key uint64) (any, bool) {
+	return c.m.Load(key)
+}
+
+// Store 写入缓存，新键超出上限时淘汰最早写入的键
+func (c *boundedTemplateCache) Store(key uint64, value any) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	if _, loaded := c.m.Swap(key, value); loaded {
+		return
+	}
+	c.order = append(c.order, key)
+	if len(c.order) > maxCachedTemplates {
+		c.m.Delete(c.order[0])
+		c.order = c.order[1:]
+	}
+}
+
+// Len 返回缓存条目数
+func (c *boundedTemplateCache) Len() int {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	return len(c.order)
+}
+
+// Clear 清空缓存
+func (c *boundedTemplateCache) Clear() {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	c.m.Clear()
+	c.order = nil
+}
+
 // splitByPlaceholders 将模板按占位符拆分为静态片段
 // 返回 len(placeholders)+1 个片段，与占位符交替排列
 // 例如: "A__PH_0__B__PH_1__C" -> ["A", "B", "C"]
@@ -14,11 +14,22 @@ import (
 // TitlePool 标题池（基于 channel）
 type TitlePool struct {
 	ch            chan string
+	refillCh      chan struct{} // 消费跌破阈值时通知填充协程（缓冲 1）
 	groupID       int
 	memoryBytes   atomic.Int64 // 内存占用追踪
 	consumedCount atomic.Int64 // 被消费的数量（Pop 计数）
 }
 
+// signalRefill 剩余量低于阈值时通知填充协程（非阻塞，已有待处理通知时跳过）
+func (p *TitlePool) signalRefill(threshold int) {
+	if len(p.ch) < threshold && len(p.refillCh) == 0 {
+		select {
+		case p.refillCh <- struct{}{}:
+		default:
+		}
+	}
+}
+
 // TitleGenerator 动态标题生成器
 type TitleGenerator struct {
 	pools       map[int]*TitlePool // groupID -> 标题池
@@ -70,6 +81,38 @@ func (g *TitleGenerator) generateTitle(groupID int) string {
 	return keywords[0] + emoji1 + keywords[1] + emoji2 + keywords[2]
 }
 
+// titleBatchSize 批量生成标题时每批的数量
+const titleBatchSize = 256
+
+// generateTitles 批量生成 n 个标题：关键词和 emoji 各一次加锁批量取出，再逐个拼接
+// 关键词不足 3 个时退回逐个生成（部分拼接逻辑见 generateTitle）
+func (g *TitleGenerator) generateTitles(groupID int, n int) []string {
+	keywords := g.poolManager.GetRandomKeywordsBatch(groupID, 3, n)
+	if keywords == nil {
+		titles := make([]string, 0, n)
+		for i := 0; i < n; i++ {
+			title := g.generateTitle(groupID)
+			if title == "" {
+				break
+			}
+			titles = append(titles, title)
+		}
+		return titles
+	}
+
+	emojis := g.poolManager.GetRandomEmojiPairs(n)
+	titles := make([]string, n)
+	for i := range titles {
+		var emoji1, emoji2 string
+		if emojis != nil {
+			emoji1, emoji2 = emojis[2*i], emojis[2*i+1]
+		}
+		kw := keywords[3*i : 3*i+3]
+		titles[i] = kw[0] + emoji1 + kw[1] + emoji2 + kw[2]
+	}
+	return titles
+}
+
 // getOrCreatePool 获取或创建指定 groupID 的标题池
 // 使用 RLock 优先策略：读多写少场景下避免排他锁竞争
 func (g *TitleGenerator) getOrCreatePool(groupID int) *TitlePool {
@@ -91,8 +134,9 @@ func (g *TitleGenerator) getOrCreatePool(groupID int) *TitlePool {
 	}
 
 	pool := &TitlePool{
-		ch:      make(chan string, g.config.TitlePoolSize),
-		groupID: groupID,
+		ch:       make(chan string, g.config.TitlePoolSize),
+		refillCh: make(chan struct{}, 1),
+		groupID:  groupID,
 	}
 	g.pools[groupID] = pool
 	log.Debug().Int("group_id", groupID).Int("size", g.config.TitlePoolSize).Msg("Created title pool")
@@ -109,6 +153,7 @@ func (g *TitleGenerator) Pop(groupID int) (string, error) {
 		pool.memoryBytes.Add(-StringMemorySize(title))
 		// 增加消费计数
 		pool.consumedCount.Add(1)
+		pool.signalRefill(int(float64(g.config.TitlePoolSize) * g.config.TitleThreshold))
 		return title, nil
 	default:
 		// 池空，同步生成一个返回（也计入消费）
@@ -127,19 +172,28 @@ func (g *TitleGenerator) fillPool(groupID int, pool *TitlePool) {
 	filled := 0
 	var addedMem int64
 loop:
-	for i := 0; i < need; i++ {
-		title := g.generateTitle(groupID)
-		if title == "" {
+	for filled < need {
+		batch := need - filled
+		if batch > titleBatchSize {
+			batch = titleBatchSize
+		}
+		titles := g.generateTitles(groupID, batch)
+		if len(titles) == 0 {
 			// 关键词池为空，无法生成标题，退出循环避免 CPU 空转
 			break
 		}
-		select {
-		case pool.ch <- title:
-			filled++
-			addedMem += StringMemorySize(title)
-		default:
-			// 池满，停止
-			break loop
+		for _, title := range titles {
+			select {
+			case pool.ch <- title:
+				filled++
+				addedMem += StringMemorySize(title)
+			default:
+				// 池满，停止
+				break loop
+			}
+		}
+		if len(titles) < batch {
+			break
 		}
 	}
 
@@ -162,7 +216,7 @@ func (g *TitleGenerator) refillWorker(groupID int, pool *TitlePool) {
 	defer g.wg.Done()
 
 	// 启动后立即尝试一次填充（不等 ticker）
-	if !g.stopped.Load() && len(g.poolManager.GetRandomKeywords(groupID, 1)) > 0 {
+	if !g.stopped.Load() && g.poolManager.HasRawKeywords(groupID) {
 		g.fillPool(groupID, pool)
 	}
 
@@ -173,19 +227,21 @@ func (g *TitleGenerator) refillWorker(groupID int, pool *TitlePool) {
 		select {
 		case <-g.ctx.Done():
 			return
+		case <-pool.refillCh:
 		case <-ticker.C:
-			if g.stopped.Load() {
-				return
-			}
-			// 预检查：关键词池为空时跳过填充，避免无效循环
-			if len(g.poolManager.GetRandomKeywords(groupID, 1)) == 0 {
-				continue
-			}
-			// 检查是否需要补充（低于阈值比例时触发）
-			thresholdCount := int(float64(g.config.TitlePoolSize) * g.config.TitleThreshold)
-			if len(pool.ch) < thresholdCount {
-				g.fillPool(groupID, pool)
-			}
+		}
+
+		if g.stopped.Load() {
+			return
+		}
+		// 预检查：关键词池为空时跳过填充，避免无效循环
+		if !g.poolManager.HasRawKeywords(groupID) {
+			continue
+		}
+		// 检查是否需要补充（低于阈值比例时触发）
+		thresholdCount := int(float64(g.config.TitlePoolSize) * g.config.TitleThreshold)
+		if len(pool.ch) < thresholdCount {
+			g.fillPool(groupID, pool)
 		}
 	}
 }
@@ -346,17 +402,28 @@ func (g *TitleGenerator) SyncGroups(groupIDs []int) {
 	}
 }
 
-// GetStats 获取标题池统计
-func (g *TitleGenerator) GetStats() map[int]map[string]int {
+// snapshotPools 短暂持锁复制池列表和当前配置，统计在锁外计算，避免监控轮询与 Pop/建池争用 g.mu
+// 配置指针会被 Reload/Resize 在写锁下替换，须与池列表在同一临界区内读取
+func (g *TitleGenerator) snapshotPools() ([]*TitlePool, *CachePoolConfig) {
 	g.mu.RLock()
-	defer g.mu.RUnlock()
+	pools := make([]*TitlePool, 0, len(g.pools))
+	for _, pool := range g.pools {
+		pools = append(pools, pool)
+	}
+	cfg := g.config
+	g.mu.RUnlock()
+	return pools, cfg
+}
 
-	stats := make(map[int]map[string]int)
-	for groupID, pool := range g.pools {
-		thresholdCount := int(float64(g.config.TitlePoolSize) * g.config.TitleThreshold)
-		stats[groupID] = map[string]int{
+// GetStats 获取标题池统计
+func (g *TitleGenerator) GetStats() map[int]map[string]int {
+	pools, cfg := g.snapshotPools()
+	thresholdCount := int(float64(cfg.TitlePoolSize) * cfg.TitleThreshold)
+	stats := make(map[int]map[string]int, len(pools))
+	for _, pool := range pools {
+		stats[pool.groupID] = map[string]int{
 			"current":   len(pool.ch),
-			"max_size":  g.config.TitlePoolSize,
+			"max_size":  cfg.TitlePoolSize,
 			"threshold": thresholdCount,
 		}
 	}
@@ -365,12 +432,10 @@ func (g *TitleGenerator) GetStats() map[int]map[string]int {
 
 // GetTotalStats 获取汇总统计
 func (g *TitleGenerator) GetTotalStats() (current, maxSize int, memoryBytes, consumedCount int64) {
-	g.mu.RLock()
-	defer g.mu.RUnlock()
-
-	for _, pool := range g.pools {
+	pools, cfg := g.snapshotPools()
+	for _, pool := range pools {
 		current += len(pool.ch)
-		maxSize += g.config.TitlePoolSize
+		maxSize += cfg.TitlePoolSize
 		memoryBytes += pool.memoryBytes.Load()
 		consumedCount += pool.consumedCount.Load()
 	}
@@ -379,20 +444,18 @@ func (g *TitleGenerator) GetTotalStats() (current, maxSize int, memoryBytes, con
 
 // GetGroupStats 获取按分组的统计信息（用于前端分组详情展示）
 func (g *TitleGenerator) GetGroupStats() []PoolGroupInfo {
-	g.mu.RLock()
-	defer g.mu.RUnlock()
-
-	groups := make([]PoolGroupInfo, 0, len(g.pools))
-	for gid, pool := range g.pools {
+	pools, cfg := g.snapshotPools()
+	groups := make([]PoolGroupInfo, 0, len(pools))
+	for _, pool := range pools {
 		current := len(pool.ch)
-		maxSize := g.config.TitlePoolSize
+		maxSize := cfg.TitlePoolSize
 		consumed := int(pool.consumedCount.Load())
 		util := 0.0
 		if maxSize > 0 {
 			util = float64(current) / float64(maxSize) * 100
 		}
 		groups = append(groups, PoolGroupInfo{
-			ID:          gid,
+			ID:          pool.groupID,
 			Count:       current,
 			Size:        maxSize,
 			Available:   current,
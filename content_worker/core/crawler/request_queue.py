@@ -11,6 +11,7 @@ Redis 键名设计：
 - spider:{project_id}:completed  - SET 已完成URL指纹（断点续抓跳过）
 - spider:{project_id}:stats      - HASH 实时统计
 - spider:{project_id}:state      - STRING 任务状态
+- spider:active_projects         - SET 有统计数据的项目ID（供统计归档使用，免去 SCAN 全库）
 """
 
 import json
@@ -24,6 +25,12 @@ if TYPE_CHECKING:
 
 from .request import Request
 
+# 活跃项目索引（与 Go 端 StatsArchiver 约定的键名）
+ACTIVE_PROJECTS_KEY = "spider:active_projects"
+
+# 实时统计字段
+STATS_FIELDS = ('total', 'completed', 'failed', 'retried')
+
 
 @dataclass
 class QueueStats:
@@ -243,27 +250,20 @@ class RequestQueue:
 
     async def get_stats(self) -> QueueStats:
         """获取队列统计信息"""
-        # 获取基础统计
-        stats_data = await self.redis.hgetall(self._key_stats)
-
-        # 转换类型
-        def _get_int(key: str) -> int:
-            val = stats_data.get(key) or stats_data.get(key.encode())
-            if val is None:
-                return 0
-            if isinstance(val, bytes):
-                val = val.decode()
-            return int(val)
+        # 获取基础统计（HMGET 按固定顺序返回，int() 可直接解析 bytes）
+        total, completed, failed, retried = (
+            int(v or 0) for v in await self.redis.hmget(self._key_stats, STATS_FIELDS)
+        )
 
         # 获取队列长度
         pending = await self.redis.zcard(self._key_pending)
         processing = await self.redis.hlen(self._key_processing)
 
         return QueueStats(
-            total=_get_int('total'),
-            completed=_get_int('completed'),
-            failed=_get_int('failed'),
-            retried=_get_int('retried'),
+            total=total,
+            completed=completed,
+            failed=failed,
+            retried=retried,
             pending=pending,
             processing=processing,
         )
@@ -280,6 +280,9 @@ class RequestQueue:
     async def set_state(self, state: str) -> None:
         """设置任务状态"""
         await self.redis.set(self._key_state, state)
+        if state == self.STATE_RUNNING and not self.is_test:
+            # 登记到活跃项目索引，统计归档直接 SMEMBERS 读取
+            await self.redis.sadd(ACTIVE_PROJECTS_KEY, self.project_id)
         logger.debug(f"Project {self.project_id} state changed to: {state}")
 
     async def pause(self) -> None:
@@ -386,12 +389,7 @@ class RequestQueue:
 
     async def get_item_count(self) -> int:
         """获取已产出的数据条数"""
-        count = await self.redis.get(self._key_item_count)
-        if count is None:
-            return 0
-        if isinstance(count, bytes):
-            count = count.decode()
-        return int(count)
+        return int(await self.redis.get(self._key_item_count) or 0)
 
     async def incr_item_count(self) -> int:
         """递增数据计数，返回新值"""
@@ -399,12 +397,7 @@ class RequestQueue:
 
     async def get_queued_count(self) -> int:
         """获取回调产出的请求入队数量"""
-        count = await self.redis.get(self._key_queued_count)
-        if count is None:
-            return 0
-        if isinstance(count, bytes):
-            count = count.decode()
-        return int(count)
+        return int(await self.redis.get(self._key_queued_count) or 0)
 
     async def incr_queued_count(self) -> int:
         """递增回调请求入队计数，返回新值"""
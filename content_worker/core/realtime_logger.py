@@ -4,6 +4,7 @@
 
 通过 loguru 的 sink 机制，所有 logger.xxx() 调用都会自动发送到 Redis。
 使用 contextvars 实现异步上下文隔离，不同任务的日志发送到不同 channel。
+日志先写入内存缓冲区，由后台每 50ms 通过 pipeline 批量发布，避免每条日志一次 Redis 往返。
 
 使用方式：
     from core.realtime_logger import RealtimeContext, send_end, send_item
@@ -21,7 +22,7 @@ import asyncio
 import traceback
 from contextvars import ContextVar
 from datetime import datetime
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from loguru import logger
 
@@ -38,6 +39,61 @@ _channel_ctx: ContextVar[Optional[str]] = ContextVar('_channel_ctx', default=Non
 # 全局 sink ID，用于管理 sink 生命周期
 _sink_id: Optional[int] = None
 
+# ============================================
+# 发布缓冲区 - 批量发送到 Redis
+# ============================================
+
+# 缓冲刷新间隔（秒）
+FLUSH_INTERVAL = 0.05
+
+# 待发布消息，按写入顺序保存 (redis, channel, payload)
+_pending: List[Tuple['Redis', str, str]] = []
+_flush_handle: Optional[asyncio.TimerHandle] = None
+_flush_lock: Optional[asyncio.Lock] = None
+
+
+def _enqueue(redis: 'Redis', channel: str, data: Dict[str, Any]):
+    """将消息加入缓冲区，首条消息时安排一次延迟刷新（需在事件循环线程中调用）"""
+    global _flush_handle
+    _pending.append((redis, channel, json.dumps(data, ensure_ascii=False)))
+    if _flush_handle is None:
+        loop = asyncio.get_running_loop()
+        _flush_handle = loop.call_later(FLUSH_INTERVAL, lambda: asyncio.create_task(flush_pending()))
+
+
+async def flush_pending():
+    """
+    立即发布缓冲区中的全部消息
+
+    同一 Redis 客户端的消息合并为一个 pipeline，保持写入顺序。
+    """
+    global _flush_handle, _flush_lock, _pending
+    if _flush_lock is None:
+        _flush_lock = asyncio.Lock()
+
+    # 加锁保证多次刷新之间的发布顺序
+    async with _flush_lock:
+        if _flush_handle is not None:
+            _flush_handle.cancel()
+            _flush_handle = None
+        if not _pending:
+            return
+        batch, _pending = _pending, []
+
+        pipes: Dict[int, Any] = {}
+        for redis, channel, payload in batch:
+            pipe = pipes.get(id(redis))
+            if pipe is None:
+                pipe = pipes[id(redis)] = redis.pipeline(transaction=False)
+            pipe.publish(channel, payload)
+
+        for pipe in pipes.values():
+            try:
+                await pipe.execute()
+            except Exception:
+                # 不能用 logger 记录，否则会再次进入 sink
+                traceback.print_exc()
+
 
 # ============================================
 # Redis Sink - 自动捕获所有 loguru 日志
@@ -74,14 +130,9 @@ def _redis_sink(message):
         "timestamp": datetime.now().isoformat()
     }
 
-    # 获取事件循环并发送
+    # 写入缓冲区，由后台批量发送
     try:
-        loop = asyncio.get_running_loop()
-        loop.call_soon_threadsafe(
-            lambda d=data, r=redis, c=channel: asyncio.create_task(
-                r.publish(c, json.dumps(d, ensure_ascii=False))
-            )
-        )
+        _enqueue(redis, channel, data)
     except RuntimeError:
         # 没有运行中的事件循环，忽略
         pass
@@ -170,11 +221,7 @@ class RealtimeContext:
 
     async def end(self):
         """发送结束信号，通知前端任务已完成"""
-        data = {
-            "type": "end",
-            "timestamp": datetime.now().isoformat()
-        }
-        await self.redis.publish(self.channel, json.dumps(data, ensure_ascii=False))
+        await send_end(self.redis, self.channel)
 
     async def item(self, data: Dict[str, Any]):
         """
@@ -189,7 +236,7 @@ class RealtimeContext:
             "message": json.dumps(data, ensure_ascii=False),
             "timestamp": datetime.now().isoformat()
         }
-        await self.redis.publish(self.channel, json.dumps(msg, ensure_ascii=False))
+        _enqueue(self.redis, self.channel, msg)
 
 
 # ============================================
@@ -201,11 +248,13 @@ async def send_end(redis: 'Redis', channel: str):
     发送结束消息（在上下文外部使用）
 
     用于如 stop_test 等场景，需要在任务取消后发送 end 消息。
+    先刷新缓冲区，保证 end 消息在已产生的日志之后到达。
     """
     data = {
         "type": "end",
         "timestamp": datetime.now().isoformat()
     }
+    await flush_pending()
     await redis.publish(channel, json.dumps(data, ensure_ascii=False))
 
 
@@ -228,7 +277,7 @@ async def send_item(data: Dict[str, Any]):
         "message": json.dumps(data, ensure_ascii=False),
         "timestamp": datetime.now().isoformat()
     }
-    await redis.publish(channel, json.dumps(msg, ensure_ascii=False))
+    _enqueue(redis, channel, msg)
 
 
 # ============================================
@@ -45,6 +45,12 @@ class GeneratorManager:
         self._last_stats_time = None
         # 最后错误信息
         self._last_error: Optional[str] = None
+        # 预解析队列键名（Dynaconf 属性访问较重，实时状态每篇文章都会发布）
+        self._queue_keys = (
+            settings.queues.pending,
+            settings.queues.retry,
+            settings.queues.dead,
+        )
 
     async def load_config(self) -> Dict:
         """从数据库加载配置"""
@@ -235,10 +241,8 @@ class GeneratorManager:
             async for message in pubsub.listen():
                 if message["type"] == "message":
                     try:
-                        data = message["data"]
-                        if isinstance(data, bytes):
-                            data = data.decode('utf-8')
-                        cmd = json.loads(data)
+                        # json.loads 同时接受 bytes/str
+                        cmd = json.loads(message["data"])
                         await self.handle_command(cmd)
                     except Exception as e:
                         logger.error(f"处理命令失败: {e}")
@@ -290,17 +294,15 @@ class GeneratorManager:
 
         try:
             # 查询队列长度
-            queue_pending = await self.rdb.llen(settings.queues.pending)
-            queue_retry = await self.rdb.llen(settings.queues.retry)
-            queue_dead = await self.rdb.llen(settings.queues.dead)
+            pending_key, retry_key, dead_key = self._queue_keys
+            queue_pending = await self.rdb.llen(pending_key)
+            queue_retry = await self.rdb.llen(retry_key)
+            queue_dead = await self.rdb.llen(dead_key)
 
-            # 汇总所有 Worker 统计
+            # 汇总所有 Worker 统计（每篇文章完成都会触发，直接读计数器，避免 get_stats 为每个 Worker 构造临时字典）
             total_processed = 0
-            total_failed = 0
             for worker in self.worker_instances:
-                stats = worker.get_stats()
-                total_processed += stats.get('processed', 0)
-                total_failed += stats.get('failed', 0)
+                total_processed += worker.processed_count
 
             # 计算处理速度
             current_time = time.time()
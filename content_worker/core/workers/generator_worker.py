@@ -180,8 +180,7 @@ class GeneratorWorker:
             )
             if result:
                 queue_name, article_id = result
-                if isinstance(article_id, bytes):
-                    article_id = article_id.decode('utf-8')
+                # int() 同时接受 bytes/str，无需逐条 isinstance 判断后解码
                 return int(article_id)
             return None
 
@@ -557,6 +556,11 @@ class GeneratorWorker:
         finally:
             await self.stop()
 
+    @property
+    def processed_count(self) -> int:
+        """已处理数量（热路径汇总用，不构造统计字典）"""
+        return self._processed_count
+
     def get_stats(self) -> Dict[str, Any]:
         """获取统计信息"""
         avg_ms = 0.0
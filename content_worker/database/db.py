@@ -27,6 +27,7 @@ async def init_db_pool(
     database: str = "seo_generator",
     charset: str = "utf8mb4",
     pool_size: int = 30,
+    min_size: int = 10,
     pool_recycle: int = 1800,
     **kwargs
 ) -> aiomysql.Pool:
@@ -41,6 +42,7 @@ async def init_db_pool(
         database: 数据库名
         charset: 字符集
         pool_size: 连接池大小
+        min_size: 启动时预先建立的连接数（不超过 pool_size）
         pool_recycle: 连接回收时间（秒）
 
     Returns:
@@ -59,7 +61,7 @@ async def init_db_pool(
             password=password,
             db=database,
             charset=charset,
-            minsize=10,
+            minsize=min(min_size, pool_size),
             maxsize=pool_size,
             pool_recycle=pool_recycle,
             autocommit=True,
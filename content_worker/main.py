@@ -18,12 +18,8 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from loguru import logger
 
 
-async def init_components():
-    """初始化所有组件"""
-    from config import get_config
-    config = get_config()
-
-    # 1. 初始化数据库连接池
+async def _init_database(config):
+    """初始化数据库连接池"""
     logger.info("初始化数据库连接...")
     from database.db import init_db_pool
 
@@ -33,28 +29,50 @@ async def init_components():
         'user': os.environ.get('DB_USER', getattr(config.database, 'user', 'root')),
         'password': os.environ.get('DB_PASSWORD', getattr(config.database, 'password', '')),
         'database': os.environ.get('DB_NAME', getattr(config.database, 'database', 'seo_generator')),
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', getattr(config.database, 'pool_size', 30))),
     }
+    # 连接在启动时全部建立，首批任务不用再逐个付出握手开销
+    db_config['min_size'] = db_config['pool_size']
 
     await init_db_pool(**db_config)
     logger.info(f"数据库连接池已初始化: {db_config['host']}:{db_config['port']}")
 
-    # 2. 初始化 Redis 连接
+
+async def _init_redis(config):
+    """初始化 Redis 连接（REDIS_ENABLED=false 时跳过）"""
     redis_enabled = os.environ.get('REDIS_ENABLED', 'true').lower() == 'true'
-    if redis_enabled:
-        logger.info("初始化 Redis 连接...")
-        from core.redis_client import init_redis_client
-
-        redis_config = {
-            'host': os.environ.get('REDIS_HOST', getattr(config.redis, 'host', 'localhost')),
-            'port': int(os.environ.get('REDIS_PORT', getattr(config.redis, 'port', 6379))),
-            'db': int(os.environ.get('REDIS_DB', getattr(config.redis, 'db', 0))),
-            'password': os.environ.get('REDIS_PASSWORD', getattr(config.redis, 'password', None)),
-        }
-
-        await init_redis_client(**redis_config)
-        logger.info(f"Redis 连接已初始化: {redis_config['host']}:{redis_config['port']}")
-    else:
+    if not redis_enabled:
         logger.warning("Redis 已禁用")
+        return
+
+    logger.info("初始化 Redis 连接...")
+    from core.redis_client import init_redis_client
+
+    redis_config = {
+        'host': os.environ.get('REDIS_HOST', getattr(config.redis, 'host', 'localhost')),
+        'port': int(os.environ.get('REDIS_PORT', getattr(config.redis, 'port', 6379))),
+        'db': int(os.environ.get('REDIS_DB', getattr(config.redis, 'db', 0))),
+        'password': os.environ.get('REDIS_PASSWORD', getattr(config.redis, 'password', None)),
+    }
+
+    await init_redis_client(**redis_config)
+    logger.info(f"Redis 连接已初始化: {redis_config['host']}:{redis_config['port']}")
+
+
+async def init_components():
+    """初始化所有组件"""
+    from config import get_config
+    config = get_config()
+
+    # 数据库与 Redis 互不依赖，并发建立连接，启动耗时取两者中较长的一个
+    results = await asyncio.gather(
+        _init_database(config),
+        _init_redis(config),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
 
     return config
 
@@ -1459,7 +1459,8 @@ CREATE TABLE IF NOT EXISTS spider_stats_history (
     avg_speed DECIMAL(10,2) COMMENT '平均速度（条/分钟）',
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     UNIQUE KEY uk_project_period (project_id, period_type, period_start),
-    INDEX idx_query (project_id, period_type, period_start DESC)
+    INDEX idx_query (project_id, period_type, period_start DESC),
+    INDEX idx_period (period_type, period_start, project_id) COMMENT '小时/天聚合与过期清理按周期范围扫描'
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='爬虫统计历史表';
 
 -- ============================================
@@ -1524,6 +1525,9 @@ UPDATE sites SET article_group_id = (SELECT id FROM article_groups WHERE is_defa
 -- 6. articles表添加唯一索引（防止同分组内文章标题重复）
 -- 注意：如果有重复数据需要先处理
 ALTER TABLE articles ADD UNIQUE INDEX idx_group_title (group_id, title(255));
+
+-- 7. spider_stats_history 添加按周期查询的索引（小时/天聚合、过期清理）
+ALTER TABLE spider_stats_history ADD INDEX idx_period (period_type, period_start, project_id);
 */
 
 -- ============================================